@@ -1,9 +1,10 @@
 import logging
 import os
+import sys
+from typing import TYPE_CHECKING
 
-from src import strava_service
-from src.access_token import GetAccessToken
-from src.infrastructure.api_clients.async_strava_api import AsyncStravaAPI
+from src.infrastructure.api_clients.concurrency import DEFAULT_MAX_CONCURRENCY
+from src.presentation import batch_cli
 from src.presentation.cli_entrypoint import MenuHandler
 from src.presentation.console_output.console_error_handler import (
     ConsoleErrorHandler,
@@ -11,47 +12,82 @@ from src.presentation.console_output.console_error_handler import (
 from src.presentation.console_output.result_console_printer import (
     ResultConsolePrinter,
 )
+from src.utils import constants as constant
 from src.utils.logger_config import setup_logging
 
+if TYPE_CHECKING:
+    from src.strava_service import StravaService
 
-def main() -> None:
-    setup_logging()
 
-    logger = logging.getLogger(__name__)
-    logger.info("Starting Strava CLI\n")
+def build_service(max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> "StravaService":
+    # Imported here so the menu and --help start without loading the API,
+    # pandas, cryptography and Supabase stacks.
+    from src.access_token import GetAccessToken
+    from src.infrastructure.api_clients.async_http_client import AsyncHTTPClient
+    from src.infrastructure.api_clients.async_strava_api import AsyncStravaAPI
+    from src.infrastructure.api_clients.response_cache import ResponseCache
+    from src.infrastructure.cache.npz_stream_cache import NpzStreamCache
+    from src.infrastructure.database.sqlite_activity_store import (
+        SqliteActivityStore,
+    )
+    from src.strava_service import StravaService
 
     token = GetAccessToken()
-    access_token = token.get_access_token()
+    table = token.credentials["supabase_secrets"].supabase_table
+    # Token refreshes and API calls share one pooled HTTP client.
+    http_client = AsyncHTTPClient(
+        database_deleter=token.supabase_deleter,
+        table=table,
+        encryptor=token.encryptor,
+    )
+    token_provider = token.create_token_provider(http_client)
 
     strava_API_async = AsyncStravaAPI(
-        access_token=access_token,  # type: ignore
+        access_token=token_provider.access_token,
+        token_provider=token_provider,
+        http_client=http_client,
         deleter=token.supabase_deleter,
-        table=token.credentials["supabase_secrets"].supabase_table,
+        table=table,
         encryptor=token.encryptor,
+        response_cache=ResponseCache(),
+        max_concurrency=max_concurrency,
     )
 
+    return StravaService(
+        api_async=strava_API_async,
+        activity_store=SqliteActivityStore(constant.ACTIVITY_STORE_PATH),
+        stream_cache=NpzStreamCache(constant.STREAM_CACHE_DIR),
+    )
+
+
+def main() -> None:
+    setup_logging()
+
+    if len(sys.argv) > 1:
+        sys.exit(batch_cli.run(sys.argv[1:], build_service))
+
+    logger = logging.getLogger(__name__)
+    logger.info("Starting Strava CLI\n")
+
     result_console_printer = ResultConsolePrinter()
     error_console_printer = ConsoleErrorHandler()
 
-    service = strava_service.StravaService(api_async=strava_API_async)
-
-    menu = MenuHandler(
-        service=service,
+    with MenuHandler(
+        service_factory=build_service,
         result_console_printer=result_console_printer,
         error_console_printer=error_console_printer,
-    )
-
-    while True:
-        menu.print_menu()
-        option = input("\nChoose an option (number or 'q' to exit): ")
+    ) as menu:
+        while True:
+            menu.print_menu()
+            option = input("\nChoose an option (number or 'q' to exit): ")
 
-        if option.lower() == "q":
-            print("\n👋 Goodbye")
-            break
+            if option.lower() == "q":
+                print("\n👋 Goodbye")
+                break
 
-        _remove_testing_files(option, "e")
+            _remove_testing_files(option, "e")
 
-        menu.execute_option(option)
+            menu.execute_option(option)
 
 
 def _remove_testing_files(option: str, default_letter: str) -> None:
@@ -1,5 +1,5 @@
 import logging
-from typing import Any
+from typing import Any, Tuple
 
 import supabase
 from dotenv import load_dotenv
@@ -9,12 +9,17 @@ from src.infrastructure.auth.credentials import (
     StravaSecrets,
     SupabaseSecrets,
 )
+from src.infrastructure.auth.token_cache import LocalTokenCache
 from src.infrastructure.auth.token_handler import TokenHandler
-from src.infrastructure.auth.token_manager import TokenManager
+from src.infrastructure.auth.token_manager import AsyncTokenManager, TokenManager
+from src.infrastructure.auth.token_provider import RefreshingTokenProvider
 from src.infrastructure.database.supabase_deleter import SupabaseDeleter
 from src.infrastructure.database.supabase_reader import SupabaseReader
 from src.infrastructure.database.supabase_writer import SupabaseWriter
 from src.infrastructure.encryption.encryptor import FernetEncryptor
+from src.interfaces.api_clients.async_http_client import BaseASyncHTTPClient
+from src.utils import constants as constant
+from src.utils import exceptions as exception
 
 logger = logging.getLogger(__name__)
 
@@ -31,23 +36,58 @@ class GetAccessToken:
         self.token_manager = self._create_token_manager()
         self.encryptor = self._create_encryptor()
         self.token_handler = self._create_token_handler()
-
-    def get_access_token(self) -> str | int:
-        self.token_handler.process_token(
-            self.credentials["supabase_secrets"].supabase_table,
-        )
-        access_token = self.supabase_reader.fetch_latest_record(
+        self.token_cache = self._create_token_cache()
+        self.expires_at: int | None = None
+        self.async_token_manager: AsyncTokenManager | None = None
+
+    def get_access_token(self) -> str:
+        cached = self.token_cache.get_with_expiry()
+        if cached is not None:
+            logger.info("Using cached access token")
+            cached_token, self.expires_at = cached
+            return cached_token
+
+        # One read: process_token already holds the decrypted latest record.
+        record = self.token_handler.process_token(
             self.credentials["supabase_secrets"].supabase_table,
-            "access_token",
-            "access_token",
         )
-        if access_token is None:
+        if not record or not record.get("access_token"):
             logger.error("No access token found in the database.")
             raise ValueError("No access token found in the database.")
 
-        return self.encryptor.decrypt_value(
-            data_to_decrypt=access_token, value="access_token"
+        access_token = str(record["access_token"])
+        if "expires_at" in record:
+            self.expires_at = int(record["expires_at"])
+            self.token_cache.set(access_token, self.expires_at)
+        return access_token
+
+    def create_token_provider(
+        self, http_client: BaseASyncHTTPClient
+    ) -> RefreshingTokenProvider:
+        """Provider that keeps the token fresh during long API sessions.
+
+        Refreshes are posted through ``http_client``, the client used by the
+        API calls, so they share its connection pool.
+        """
+        access_token = self.get_access_token()
+        self.async_token_manager = self._create_async_token_manager(http_client)
+        # Without a known expiry the first request refreshes the token.
+        return RefreshingTokenProvider(
+            access_token=access_token,
+            expires_at=self.expires_at or 0,
+            refresher=self.refresh_access_token,
+        )
+
+    async def refresh_access_token(self) -> Tuple[str, int]:
+        if self.async_token_manager is None:
+            raise exception.TokenError("Create the token provider before refreshing.")
+        record = await self.token_handler.refresh_token(
+            self.credentials["supabase_secrets"].supabase_table,
+            self.async_token_manager,
         )
+        self.expires_at = int(record["expires_at"])
+        self.token_cache.set(str(record["access_token"]), self.expires_at)
+        return str(record["access_token"]), self.expires_at
 
     def _load_credentials(self) -> dict[str, Any]:
         return {
@@ -79,10 +119,23 @@ class GetAccessToken:
             secret_key=strava_secrets.strava_secret_key,
         )
 
+    def _create_async_token_manager(
+        self, http_client: BaseASyncHTTPClient
+    ) -> AsyncTokenManager:
+        strava_secrets = self.credentials["strava_secrets"]
+        return AsyncTokenManager(
+            client_id=strava_secrets.strava_client_id,
+            secret_key=strava_secrets.strava_secret_key,
+            http_client=http_client,
+        )
+
     def _create_encryptor(self) -> FernetEncryptor:
         fernet_secrets = self.credentials["fernet_secrets"]
         return FernetEncryptor(cipher=fernet_secrets.cipher)
 
+    def _create_token_cache(self) -> LocalTokenCache:
+        return LocalTokenCache(path=constant.TOKEN_CACHE_PATH, encryptor=self.encryptor)
+
     def _create_token_handler(self) -> TokenHandler:
         strava_secrets = self.credentials["strava_secrets"]
         return TokenHandler(
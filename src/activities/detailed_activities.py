@@ -1,45 +1,167 @@
 import asyncio
-from typing import Any, Dict, List, cast
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Tuple, cast
 
 from src.interfaces.activities import IActivityFetcher
 from src.utils import helpers as helper
 
+ACTIVITIES_PER_PAGE = 200
+RANGE_WINDOW_SECONDS = 28 * 24 * 60 * 60
+MAX_WINDOWS_IN_FLIGHT = 4
+
+ActivityPage = List[Dict[str, Any]]
+PageQueue = asyncio.Queue[ActivityPage | BaseException | None]
+
+
+class PaginatedActivitiesFetcher(IActivityFetcher):
+    """Walks every page of the athlete activities list for an epoch range.
+
+    Long ranges are split into sub-windows whose pages are fetched
+    concurrently, a few windows at a time, while activities are still yielded
+    in window order. Ranges open at the start of the epoch are paged
+    sequentially instead.
+    """
+
+    async def fetch_activity_data(self, after: int, before: int) -> Any:
+        return [activity async for activity in self.iter_activities(after, before)]
+
+    async def iter_activities(
+        self,
+        after: int,
+        before: int,
+        per_page: int = ACTIVITIES_PER_PAGE,
+        window_seconds: int = RANGE_WINDOW_SECONDS,
+        max_windows_in_flight: int = MAX_WINDOWS_IN_FLIGHT,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield activities page by page as soon as each page arrives."""
+        # Splitting a range that starts at the epoch would cost at least one
+        # request per (mostly empty) window since 1970.
+        if after <= 0:
+            windows = [(after, before)]
+        else:
+            windows = helper.split_epoch_range(after, before, window_seconds)
+
+        if len(windows) == 1:
+            async for activities in self._iter_pages(after, before, per_page):
+                for activity in activities:
+                    yield activity
+            return
+
+        remaining = iter(windows)
+        in_flight: Deque[Tuple[PageQueue, asyncio.Task[None]]] = deque()
+
+        def start_next_window() -> None:
+            window = next(remaining, None)
+            if window is not None:
+                queue: PageQueue = asyncio.Queue()
+                task = asyncio.create_task(self._fill_queue(queue, *window, per_page))
+                in_flight.append((queue, task))
+
+        for _ in range(max(max_windows_in_flight, 1)):
+            start_next_window()
+
+        try:
+            while in_flight:
+                queue, _ = in_flight[0]
+                while (page := await queue.get()) is not None:
+                    if isinstance(page, BaseException):
+                        raise page
+                    for activity in page:
+                        yield activity
+                in_flight.popleft()
+                start_next_window()
+        finally:
+            tasks = [task for _, task in in_flight]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fill_queue(
+        self,
+        queue: PageQueue,
+        after: int,
+        before: int,
+        per_page: int,
+    ) -> None:
+        try:
+            async for page in self._iter_pages(after, before, per_page):
+                queue.put_nowait(page)
+        except Exception as e:
+            queue.put_nowait(e)
+        queue.put_nowait(None)
+
+    async def _iter_pages(
+        self, after: int, before: int, per_page: int
+    ) -> AsyncIterator[ActivityPage]:
+        page = 1
+        while True:
+            params = {
+                "per_page": per_page,
+                "page": page,
+                "after": str(after),
+                "before": str(before),
+            }
+            activities = await self.api.make_request(
+                endpoint="/activities", params=params
+            )
+            if not activities:
+                return
+
+            yield activities
+
+            if len(activities) < per_page:
+                return
+            page += 1
+
 
 class WeeklyActivitiesFetcher(IActivityFetcher):
     @helper.func_time_execution
     async def fetch_activity_data(self, previous_week: bool = False) -> Any:
+        return [
+            activity
+            async for activity in self.iter_activities(previous_week=previous_week)
+        ]
+
+    def iter_activities(
+        self, previous_week: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
         monday, sunday = helper.get_week_epoch_range(previous_week=previous_week)
-        params = {
-            "per_page": 200,
-            "page": 1,
-            "after": str(monday),
-            "before": str(sunday),
-        }
-        return await self.api.make_request(endpoint="/activities", params=params)
+        return PaginatedActivitiesFetcher(self.api).iter_activities(
+            after=monday, before=sunday
+        )
 
 
 class DetailedActivitiesFetcher(IActivityFetcher):
     async def fetch_activity_data(
-        self, keys: List[str], previuos_week: bool = False
+        self,
+        keys: List[str],
+        previuos_week: bool = False,
+        after: int | None = None,
+        before: int | None = None,
     ) -> List[Dict[str, Any]]:
-        activities = await WeeklyActivitiesFetcher(self.api).fetch_activity_data(
-            previous_week=previuos_week
+        start, end = helper.resolve_epoch_range(
+            previous_week=previuos_week, after=after, before=before
         )
-        if not activities:
+        detailed_activity = await self.fetch_all_details(start, end)
+        if not detailed_activity:
             raise ValueError("No activities found.")
 
-        activity_ids = [activity["id"] for activity in activities]
-        detailed_activity = await self._fetch_all_activity_details(activity_ids)
-
         return [
             self._filter_activity_keys(activity, keys) for activity in detailed_activity
         ]
 
-    async def _fetch_all_activity_details(self, activity_ids: List[int]) -> List[dict]:
+    async def fetch_all_details(self, after: int, before: int) -> List[Dict[str, Any]]:
+        """Fetch the full detail of every activity in the range.
+
+        Failed detail requests are returned as empty dicts.
+        """
+        activities = PaginatedActivitiesFetcher(self.api).iter_activities(after, before)
+        # Detail requests start while the remaining pages are still listed.
         tasks = [
-            self._get_activity_details(activity_id) for activity_id in activity_ids
+            asyncio.create_task(self._get_activity_details(activity["id"]))
+            async for activity in activities
         ]
-        return cast(List[dict], await asyncio.gather(*tasks))
+        return cast(List[Dict[str, Any]], await asyncio.gather(*tasks))
 
     async def _get_activity_details(self, activity_id: int) -> Any:
         try:
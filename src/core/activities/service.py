@@ -1,28 +1,129 @@
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Tuple
 
 from src.activities.detailed_activities import (
     DetailedActivitiesFetcher,
-    WeeklyActivitiesFetcher,
+    PaginatedActivitiesFetcher,
 )
 from src.infrastructure.api_clients.async_strava_api import AsyncStravaAPI
+from src.interfaces.database.activity_store import IActivityStore
 from src.utils import constants as constant
+from src.utils import helpers as helper
 
 
 class ActivityService:
-    def __init__(self, api_async: AsyncStravaAPI):
+    def __init__(
+        self,
+        api_async: AsyncStravaAPI,
+        activity_store: IActivityStore | None = None,
+    ):
         self.api_async = api_async
+        self.activity_store = activity_store
+        self._athlete_id: int | None = None
 
-    async def get_activity_range(self, previous_week: bool = False) -> Any:
+    async def get_activity_range(
+        self,
+        previous_week: bool = False,
+        after: int | None = None,
+        before: int | None = None,
+        weeks_back: int | None = None,
+    ) -> Any:
         """Get activities within a specific date range."""
-        return await WeeklyActivitiesFetcher(self.api_async).fetch_activity_data(
-            previous_week=previous_week
+        start, end = helper.resolve_epoch_range(
+            previous_week=previous_week,
+            after=after,
+            before=before,
+            weeks_back=weeks_back,
+        )
+        return await PaginatedActivitiesFetcher(self.api_async).fetch_activity_data(
+            after=start, before=end
         )
 
     async def get_activity_details(
-        self, previous_week: bool = False
+        self,
+        previous_week: bool = False,
+        after: int | None = None,
+        before: int | None = None,
+        weeks_back: int | None = None,
     ) -> List[Dict[Any, Any]]:
-        """Get detailed information for activities."""
-        keys = [key.value for key in constant.ActivityDetailKey]
-        return await DetailedActivitiesFetcher(self.api_async).fetch_activity_data(
-            keys=keys, previuos_week=previous_week
+        """Get detailed information for activities.
+
+        With an activity store, only activities newer than the last sync are
+        requested and the rest are served from disk.
+        """
+        start, end = helper.resolve_epoch_range(
+            previous_week=previous_week,
+            after=after,
+            before=before,
+            weeks_back=weeks_back,
         )
+        keys = [key.value for key in constant.ActivityDetailKey]
+        fetcher = DetailedActivitiesFetcher(self.api_async)
+
+        if self.activity_store is None:
+            return await fetcher.fetch_activity_data(keys=keys, after=start, before=end)
+
+        activities = await self.sync_activities(start, end)
+        if not activities:
+            raise ValueError("No activities found.")
+
+        return [
+            fetcher._filter_activity_keys(activity, keys) for activity in activities
+        ]
+
+    async def sync_activities(self, after: int, before: int) -> List[Dict[str, Any]]:
+        """Download activities missing from the store and return the whole range."""
+        if self.activity_store is None:
+            raise ValueError("An activity store is required to sync activities.")
+
+        athlete_id = await self._get_athlete_id()
+        synced = self.activity_store.get_synced_range(athlete_id)
+        fetcher = DetailedActivitiesFetcher(self.api_async)
+        complete = True
+
+        for missing_after, missing_before in self._missing_ranges(
+            after, before, synced
+        ):
+            details = await fetcher.fetch_all_details(missing_after, missing_before)
+            fetched = [activity for activity in details if activity]
+            self.activity_store.save_activities(athlete_id, fetched)
+            complete = complete and len(fetched) == len(details)
+
+        # Only move the watermark when every detail request succeeded, so a
+        # failed activity is requested again on the next sync.
+        if complete:
+            watermark = min(before, int(time.time()))
+            synced_after, synced_before = synced or (after, watermark)
+            self.activity_store.update_synced_range(
+                athlete_id,
+                min(after, synced_after),
+                max(watermark, synced_before),
+            )
+
+        return self.activity_store.get_activities(athlete_id, after, before)
+
+    async def _get_athlete_id(self) -> int:
+        if self._athlete_id is None:
+            athlete = await self.api_async.make_request("/athlete")
+            self._athlete_id = int(athlete["id"])
+        return self._athlete_id
+
+    @staticmethod
+    def _missing_ranges(
+        after: int,
+        before: int,
+        synced: Tuple[int, int] | None,
+        lookback: int = constant.SYNC_LOOKBACK_SECONDS,
+    ) -> List[Tuple[int, int]]:
+        if synced is None:
+            return [(after, before)]
+
+        synced_after, synced_before = synced
+        missing = []
+        if after < synced_after:
+            missing.append((after, synced_after))
+        if before > synced_before:
+            # The watermark is wall-clock time but Strava matches on start_date;
+            # the overlap picks up late uploads and saving it again is harmless.
+            missing.append((max(after, synced_before - lookback), before))
+        return missing
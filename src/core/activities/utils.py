@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import AsyncIterable, AsyncIterator, Dict, List
 
 
 async def get_activity_ids(activities: List[Dict]) -> List[int]:
@@ -11,3 +11,18 @@ async def get_activity_ids(activities: List[Dict]) -> List[int]:
         List of activity IDs
     """
     return [activity["id"] for activity in activities]
+
+
+async def iter_activity_ids(
+    activities: AsyncIterable[Dict],
+) -> AsyncIterator[int]:
+    """Yield activity IDs as activities arrive from a paginated listing.
+
+    Args:
+        activities: Async iterable of activity dictionaries from Strava API
+
+    Yields:
+        Activity IDs in listing order
+    """
+    async for activity in activities:
+        yield activity["id"]
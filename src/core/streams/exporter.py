@@ -1,8 +1,12 @@
-from typing import Dict
+import os
+from datetime import datetime, timezone
+from typing import Any, AsyncIterable, Dict, List, Tuple, cast
 
 import pandas as pd
 
 from src.core.streams.csv_exporter import CsvExporter
+from src.core.streams.feather_exporter import FeatherExporter
+from src.core.streams.parquet_exporter import ParquetExporter
 from src.interfaces.stream_exporter import IStreamExporter
 
 
@@ -10,10 +14,23 @@ class DataExporter:
     """Handles exporting stream data to different formats."""
 
     def __init__(self, exporter_map: Dict[str, IStreamExporter] | None = None):
-        self.exporter = exporter_map or {"csv": CsvExporter()}
+        self.exporter = exporter_map or {
+            "csv": CsvExporter(),
+            "parquet": ParquetExporter(),
+            "feather": FeatherExporter(),
+        }
 
-    def _create_path(self, output_dir: str, previous_week: bool, fmt: str) -> str:
-        suffix = "previous_week" if previous_week else "current_week"
+    def _create_path(
+        self,
+        output_dir: str,
+        previous_week: bool,
+        fmt: str,
+        date_range: Tuple[int, int] | None = None,
+    ) -> str:
+        if date_range:
+            suffix = "_".join(self._format_epoch(bound) for bound in date_range)
+        else:
+            suffix = "previous_week" if previous_week else "current_week"
         filename = f"streams_{suffix}.{fmt}"
         return f"{output_dir}/{filename}"
 
@@ -23,13 +40,107 @@ class DataExporter:
         selected_format: str = "csv",
         output_dir: str = ".",
         previous_week: bool = False,
+        date_range: Tuple[int, int] | None = None,
     ) -> None:
         """Export stream data to the specified format."""
 
         fmt = selected_format.lower()
+        exporter = self.get_exporter(fmt)
+        path = self._create_path(output_dir, previous_week, fmt, date_range)
+        exporter.export(df, path)
+
+    async def export_streams_chunked(
+        self,
+        frames: AsyncIterable[pd.DataFrame],
+        output_dir: str = ".",
+        previous_week: bool = False,
+        date_range: Tuple[int, int] | None = None,
+        columns: List[str] | None = None,
+    ) -> Dict[str, Any]:
+        """Append each frame to a CSV file as it arrives.
+
+        The header is written once; later frames are aligned to ``columns``
+        (or to the first frame's columns). Returns a summary of the export.
+        """
+        path = self._create_path(output_dir, previous_week, "csv", date_range)
+        temp_path = f"{path}.tmp"
+        activities = rows = 0
+        try:
+            with open(temp_path, "w", newline="") as file:
+                async for df in frames:
+                    if columns is None:
+                        columns = list(df.columns)
+                    df.reindex(columns=columns).to_csv(
+                        file, header=activities == 0, index=False
+                    )
+                    activities += 1
+                    rows += len(df)
+
+                if activities == 0 and columns:
+                    pd.DataFrame(columns=columns).to_csv(file, index=False)
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        return {"path": path, "activities": activities, "rows": rows}
+
+    def partition_path(
+        self,
+        output_dir: str,
+        activity_id: int,
+        start_date_local: str,
+        selected_format: str,
+    ) -> str:
+        """Path of an activity partition: year=/week=/activity_id=/streams.fmt."""
+        start = datetime.fromisoformat(start_date_local.replace("Z", "+00:00"))
+        year, week, _ = start.isocalendar()
+        return (
+            f"{output_dir}/year={year}/week={week:02d}/activity_id={activity_id}"
+            f"/streams.{selected_format.lower()}"
+        )
+
+    def export_partitions(
+        self,
+        df: pd.DataFrame,
+        start_dates: Dict[int, str],
+        selected_format: str = "parquet",
+        output_dir: str = ".",
+    ) -> List[str]:
+        """Write one partition per activity, skipping the ones already on disk.
+
+        Returns the paths written.
+        """
+        fmt = selected_format.lower()
+        exporter = self.get_exporter(fmt)
+        if df.empty:
+            return []
+
+        written = []
+        for key, activity_df in df.groupby("id", observed=True, sort=False):
+            activity_id = int(cast(int, key))
+            if activity_id not in start_dates:
+                continue
+            path = self.partition_path(
+                output_dir, activity_id, start_dates[activity_id], fmt
+            )
+            if os.path.exists(path):
+                continue
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write beside the target first so an interrupted export never
+            # leaves a partial partition that later runs would skip.
+            temp_path = f"{path}.tmp"
+            exporter.export(activity_df.reset_index(drop=True), temp_path)
+            os.replace(temp_path, path)
+            written.append(path)
+        return written
+
+    def get_exporter(self, fmt: str) -> IStreamExporter:
         if fmt not in self.exporter:
             raise ValueError(f"Unsupported format: {fmt}")
+        return self.exporter[fmt]
 
-        path = self._create_path(output_dir, previous_week, fmt)
-        exporter = self.exporter[fmt]
-        exporter.export(df, path)
+    @staticmethod
+    def _format_epoch(epoch: int) -> str:
+        return datetime.fromtimestamp(epoch, tz=timezone.utc).strftime("%Y-%m-%d")
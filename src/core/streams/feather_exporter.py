@@ -0,0 +1,20 @@
+from typing import Literal
+
+import pandas as pd
+
+from src.interfaces.stream_exporter import IStreamExporter
+
+FeatherCompression = Literal["zstd", "lz4", "uncompressed"]
+DEFAULT_FEATHER_COMPRESSION: FeatherCompression = "lz4"
+
+
+class FeatherExporter(IStreamExporter):
+    def __init__(
+        self, compression: FeatherCompression | None = DEFAULT_FEATHER_COMPRESSION
+    ):
+        self.compression = compression
+
+    def export(self, df: pd.DataFrame, path: str) -> None:
+        """Export stream data to Arrow IPC (Feather v2) format."""
+        # Feather only stores a default RangeIndex.
+        df.reset_index(drop=True).to_feather(path, compression=self.compression)
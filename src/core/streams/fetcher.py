@@ -1,16 +1,36 @@
 import asyncio
-from typing import List
+from typing import AsyncIterable, AsyncIterator, Iterable, List
 
 import pandas as pd
 
-from src.core.streams.processor import process_streams
+from src.core.streams.processor import (
+    StreamColumns,
+    build_stream_frame,
+    stream_columns,
+)
 from src.infrastructure.api_clients.async_strava_api import AsyncStravaAPI
 from src.interfaces.activities import IActivityFetcher
+from src.interfaces.api_clients.strava_api import BaseStravaAPI
+from src.interfaces.stream_cache import IStreamCache
+from src.utils.helpers import as_async_iterable
+
+MAX_STREAMS_IN_FLIGHT = 4
 
 
 class ActivityStreamsFetcher(IActivityFetcher):
     """Fetches activity stream data from Strava API."""
 
+    def __init__(
+        self,
+        api: BaseStravaAPI,
+        id_activity: int | None = None,
+        stream_cache: IStreamCache | None = None,
+        compact_dtypes: bool = False,
+    ):
+        super().__init__(api=api, id_activity=id_activity)
+        self.stream_cache = stream_cache
+        self.compact_dtypes = compact_dtypes
+
     async def fetch_activity_data(self, stream_keys: List[str]) -> pd.DataFrame:
         """Fetch stream data for a single activity.
 
@@ -25,42 +45,135 @@ class ActivityStreamsFetcher(IActivityFetcher):
         """
         if not self.id_activity:
             raise ValueError("Activity ID is required for this operation.")
-        params = {"keys": ",".join(stream_keys), "key_by_type": "true"}
-        response_json = await self.api.make_request(
-            f"/activities/{self.id_activity}/streams", params
+        return build_stream_frame(
+            [(self.id_activity, await self.fetch_stream_columns(stream_keys))],
+            compact_dtypes=self.compact_dtypes,
         )
-        return process_streams(response=response_json, id_activity=self.id_activity)
+
+    async def fetch_stream_columns(self, stream_keys: List[str]) -> StreamColumns:
+        """Fetch one activity's streams as typed arrays, using the cache if set."""
+        if not self.id_activity:
+            raise ValueError("Activity ID is required for this operation.")
+
+        # Cache reads and writes hit the disk, keep them off the event loop.
+        response_json = None
+        if self.stream_cache is not None:
+            response_json = await asyncio.to_thread(
+                self.stream_cache.get, self.id_activity, stream_keys
+            )
+
+        if response_json is None:
+            params = {"keys": ",".join(stream_keys), "key_by_type": "true"}
+            response_json = await self.api.make_request(
+                f"/activities/{self.id_activity}/streams", params
+            )
+            if self.stream_cache is not None and response_json:
+                await asyncio.to_thread(
+                    self.stream_cache.set, self.id_activity, stream_keys, response_json
+                )
+
+        return stream_columns(response_json)
 
     @classmethod
     async def fetch_multiple_activities_streams(
         cls,
         api: AsyncStravaAPI,
-        list_id_activities: List[int],
+        list_id_activities: Iterable[int] | AsyncIterable[int],
         stream_keys: List[str],
+        stream_cache: IStreamCache | None = None,
+        compact_dtypes: bool = False,
     ) -> pd.DataFrame:
         """Fetch stream data for multiple activities in parallel.
 
         Args:
             api: Strava API client
-            list_id_activities: List of activity IDs to fetch streams for
+            list_id_activities: Activity IDs to fetch streams for. An async
+                iterable lets each fetch start as soon as its ID is listed.
             stream_keys: List of stream types to fetch
+            stream_cache: Optional cache consulted before each request
+            compact_dtypes: Use narrow dtypes and a categorical ``id`` column
 
         Returns:
             DataFrame containing concatenated stream data from all activities
         """
-        tasks = [
-            cls(api=api, id_activity=activity_id).fetch_activity_data(
-                stream_keys=stream_keys
-            )
-            for activity_id in list_id_activities
-        ]
+        activity_ids: List[int] = []
+        tasks = []
+        async for activity_id in as_async_iterable(list_id_activities):
+            fetcher = cls(api=api, id_activity=activity_id, stream_cache=stream_cache)
+            activity_ids.append(activity_id)
+            tasks.append(asyncio.create_task(fetcher.fetch_stream_columns(stream_keys)))
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        processed_results = [
-            result for result in results if isinstance(result, pd.DataFrame)
-        ]
-        return (
-            pd.concat(processed_results, ignore_index=True)
-            if processed_results
-            else pd.DataFrame()
+        # Raw columns are kept until every fetch is done so the final frame
+        # can be allocated once instead of concatenating per-activity frames.
+        return build_stream_frame(
+            [
+                (activity_id, result)
+                for activity_id, result in zip(activity_ids, results)
+                if isinstance(result, dict)
+            ],
+            compact_dtypes=compact_dtypes,
         )
+
+    @classmethod
+    async def iter_multiple_activities_streams(
+        cls,
+        api: AsyncStravaAPI,
+        list_id_activities: Iterable[int] | AsyncIterable[int],
+        stream_keys: List[str],
+        stream_cache: IStreamCache | None = None,
+        compact_dtypes: bool = False,
+        max_in_flight: int = MAX_STREAMS_IN_FLIGHT,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Yield each activity's stream DataFrame as soon as its fetch completes.
+
+        A fetch holds one of ``max_in_flight`` slots from the moment it starts
+        until the consumer takes its frame, so at most that many frames (plus
+        the one being consumed) are alive at once. Failed activities are
+        skipped like in ``fetch_multiple_activities_streams``.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        slots = asyncio.Semaphore(max_in_flight)
+        queue: asyncio.Queue[pd.DataFrame | BaseException | None] = asyncio.Queue()
+
+        async def fetch(activity_id: int) -> None:
+            fetcher = cls(
+                api=api,
+                id_activity=activity_id,
+                stream_cache=stream_cache,
+                compact_dtypes=compact_dtypes,
+            )
+            try:
+                df = await fetcher.fetch_activity_data(stream_keys=stream_keys)
+            except Exception:
+                slots.release()
+                return
+            # The slot is released by the consumer once it takes the frame.
+            queue.put_nowait(df)
+
+        async def produce() -> None:
+            tasks = []
+            try:
+                async for activity_id in as_async_iterable(list_id_activities):
+                    await slots.acquire()
+                    tasks.append(asyncio.create_task(fetch(activity_id)))
+                await asyncio.gather(*tasks)
+            except Exception as e:
+                queue.put_nowait(e)
+            finally:
+                for task in tasks:
+                    task.cancel()
+            queue.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (result := await queue.get()) is not None:
+                if isinstance(result, BaseException):
+                    raise result
+                slots.release()
+                yield result
+                del result
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
@@ -1,22 +1,36 @@
+from typing import AsyncIterator
+
 import pandas as pd
 
-from src.activities.detailed_activities import WeeklyActivitiesFetcher
-from src.core.activities.utils import get_activity_ids
+from src.activities.detailed_activities import PaginatedActivitiesFetcher
+from src.core.activities.utils import iter_activity_ids
 from src.core.streams.fetcher import ActivityStreamsFetcher
 from src.infrastructure.api_clients.async_strava_api import AsyncStravaAPI
+from src.interfaces.stream_cache import IStreamCache
 from src.utils import constants as constant
+from src.utils import helpers as helper
 
 
 class StreamManager:
     """Manages stream data operations and fetching."""
 
-    def __init__(self, api_async: AsyncStravaAPI):
+    def __init__(
+        self,
+        api_async: AsyncStravaAPI,
+        stream_cache: IStreamCache | None = None,
+        compact_dtypes: bool = False,
+    ):
         self.api_async = api_async
+        self.stream_cache = stream_cache
+        self.compact_dtypes = compact_dtypes
 
     async def get_streams_for_activity(self, activity_id: int) -> pd.DataFrame:
         """Get detailed stream data for a specific activity."""
         return await ActivityStreamsFetcher(
-            api=self.api_async, id_activity=activity_id
+            api=self.api_async,
+            id_activity=activity_id,
+            stream_cache=self.stream_cache,
+            compact_dtypes=self.compact_dtypes,
         ).fetch_activity_data(stream_keys=constant.ACTIVITY_STREAMS_KEYS)
 
     async def get_streams_for_multiple_activities(
@@ -27,16 +41,41 @@ class StreamManager:
             api=self.api_async,
             list_id_activities=activity_ids,
             stream_keys=constant.ACTIVITY_STREAMS_KEYS,
+            stream_cache=self.stream_cache,
+            compact_dtypes=self.compact_dtypes,
         )
 
     async def get_weekly_streams(self, previous_week: bool) -> pd.DataFrame:
         """Fetch streams for activities in the selected week."""
-        week_fetcher = WeeklyActivitiesFetcher(self.api_async)
-        activities = await week_fetcher.fetch_activity_data(previous_week=previous_week)
-        ids = await get_activity_ids(activities)
-        raw_data = await ActivityStreamsFetcher.fetch_multiple_activities_streams(
+        after, before = helper.get_week_epoch_range(previous_week=previous_week)
+        return await self.get_streams_for_range(after=after, before=before)
+
+    async def iter_streams_for_range(
+        self, after: int, before: int
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Yield per-activity streams for an epoch range as each one arrives."""
+        activities = PaginatedActivitiesFetcher(self.api_async).iter_activities(
+            after, before
+        )
+        async for df in ActivityStreamsFetcher.iter_multiple_activities_streams(
+            api=self.api_async,
+            list_id_activities=iter_activity_ids(activities),
+            stream_keys=constant.ACTIVITY_STREAMS_KEYS,
+            stream_cache=self.stream_cache,
+            compact_dtypes=self.compact_dtypes,
+        ):
+            yield df
+
+    async def get_streams_for_range(self, after: int, before: int) -> pd.DataFrame:
+        """Fetch streams for activities started within an epoch range."""
+        activities = PaginatedActivitiesFetcher(self.api_async).iter_activities(
+            after, before
+        )
+        ids = iter_activity_ids(activities)
+        return await ActivityStreamsFetcher.fetch_multiple_activities_streams(
             api=self.api_async,
             list_id_activities=ids,
             stream_keys=constant.ACTIVITY_STREAMS_KEYS,
+            stream_cache=self.stream_cache,
+            compact_dtypes=self.compact_dtypes,
         )
-        return pd.DataFrame(raw_data)
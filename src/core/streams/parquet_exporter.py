@@ -0,0 +1,28 @@
+from typing import Literal
+
+import pandas as pd
+
+from src.interfaces.stream_exporter import IStreamExporter
+
+ParquetCompression = Literal["snappy", "gzip", "brotli", "lz4", "zstd"]
+DEFAULT_PARQUET_COMPRESSION: ParquetCompression = "zstd"
+
+
+class ParquetExporter(IStreamExporter):
+    def __init__(
+        self,
+        compression: ParquetCompression | None = DEFAULT_PARQUET_COMPRESSION,
+        row_group_size: int | None = None,
+    ):
+        self.compression = compression
+        self.row_group_size = row_group_size
+
+    def export(self, df: pd.DataFrame, path: str) -> None:
+        """Export stream data to Apache Parquet format."""
+        df.to_parquet(
+            path,
+            engine="pyarrow",
+            compression=self.compression,
+            index=False,
+            row_group_size=self.row_group_size,
+        )
@@ -1,30 +1,181 @@
-from typing import Dict
+from typing import Any, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import pandas_dtype
 
+StreamColumns = Dict[str, np.ndarray]
 
-def process_streams(response: Dict, id_activity: int) -> pd.DataFrame:
+# Streams whose samples are pairs, split into one column per component.
+NESTED_STREAM_COLUMNS: Dict[str, Tuple[str, ...]] = {"latlng": ("lat", "lng")}
+
+# Narrow dtypes for the opt-in compact schema; integer streams fall back to
+# the nullable pandas dtype of the same width when they contain gaps.
+COMPACT_STREAM_DTYPES: Dict[str, str] = {
+    "time": "uint32",
+    "distance": "float32",
+    "altitude": "float32",
+    "velocity_smooth": "float32",
+    "grade_smooth": "float32",
+    "heartrate": "uint8",
+    "cadence": "uint8",
+    "watts": "uint16",
+    "temp": "int8",
+}
+NULLABLE_DTYPES: Dict[str, str] = {
+    "uint32": "UInt32",
+    "uint16": "UInt16",
+    "uint8": "UInt8",
+    "int8": "Int8",
+}
+
+
+def stream_columns(response: Dict[str, Any]) -> StreamColumns:
+    """Convert a Strava streams response into equally long typed arrays.
+
+    Shorter streams are padded with NaN (promoting them to float64) and
+    streams without data become all-NaN columns. The response is not
+    modified.
+    """
+    arrays: Dict[str, np.ndarray | None] = {}
+    for stream_type, stream_data in response.items():
+        data = stream_data.get("data") if isinstance(stream_data, dict) else None
+        if data is None:
+            arrays[stream_type] = None
+            continue
+
+        array = _to_array(data)
+        nested_columns = NESTED_STREAM_COLUMNS.get(stream_type)
+        if nested_columns is None:
+            arrays[stream_type] = array
+            continue
+
+        pairs = array.reshape(-1, len(nested_columns)).astype(np.float64)
+        for index, column in enumerate(nested_columns):
+            arrays[column] = pairs[:, index]
+
+    length = max(
+        (len(array) for array in arrays.values() if array is not None), default=0
+    )
+    return {column: _pad(array, length) for column, array in arrays.items()}
+
+
+def process_streams(
+    response: Dict, id_activity: int, compact_dtypes: bool = False
+) -> pd.DataFrame:
     """Process stream data into a DataFrame."""
-    max_length = (
-        max(
-            len(stream_data.get("data", []))
-            for stream_data in response.values()
-            if isinstance(stream_data, dict)
-        )
-        if response
-        else 0
+    return build_stream_frame(
+        [(id_activity, stream_columns(response))], compact_dtypes=compact_dtypes
     )
 
-    data = {}
-    for stream_type, stream_data in response.items():
-        if isinstance(stream_data, dict) and "data" in stream_data:
-            data[stream_type] = stream_data["data"]
 
-            if len(data[stream_type]) < max_length:
-                data[stream_type].extend([None] * (max_length - len(data[stream_type])))
-        else:
-            data[stream_type] = [None] * max_length
+def build_stream_frame(
+    activities: List[Tuple[int, StreamColumns]],
+    compact_dtypes: bool = False,
+) -> pd.DataFrame:
+    """Build one DataFrame from the stream columns of several activities.
+
+    Every output column is allocated once for the total sample count and
+    filled slice by slice, so no per-activity frames are concatenated.
+    Columns missing from an activity are filled with NaN (None for
+    non-numeric streams).
+    """
+    if not activities:
+        return pd.DataFrame()
+
+    lengths = np.array(
+        [len(next(iter(columns.values()), ())) for _, columns in activities],
+        dtype=np.int64,
+    )
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    names = list(dict.fromkeys(name for _, columns in activities for name in columns))
+
+    data: Dict[str, Any] = {}
+    for name in names:
+        arrays = [columns.get(name) for _, columns in activities]
+        present = [array for array in arrays if array is not None]
+        dtype = np.result_type(*present)
+        if len(present) < len(arrays):
+            dtype = np.dtype(np.float64) if dtype.kind in "iuf" else np.dtype(object)
+
+        fill_value = np.nan if dtype.kind == "f" else None
+        buffer = np.empty(offsets[-1], dtype=dtype)
+        for start, end, array in zip(offsets[:-1], offsets[1:], arrays):
+            buffer[start:end] = array if array is not None else fill_value
+        data[name] = buffer
+
+    ids = [activity_id for activity_id, _ in activities]
+    if compact_dtypes:
+        codes, categories = pd.factorize(np.array(ids, dtype=np.int64))
+        data["id"] = pd.Categorical.from_codes(
+            np.repeat(codes, lengths), categories=pd.Index(categories)
+        )
+    else:
+        data["id"] = np.repeat(np.array(ids, dtype=np.int64), lengths)
+
+    df = pd.DataFrame(data, copy=False)
+    return compact_stream_frame(df) if compact_dtypes else df
+
 
-    df = pd.DataFrame(data)
-    df["id"] = id_activity
+def compact_stream_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast known stream columns and store ``id`` as a categorical."""
+    for column, dtype in COMPACT_STREAM_DTYPES.items():
+        if column not in df.columns:
+            continue
+        # Non-integral or out of range samples keep their original dtype,
+        # astype would silently truncate or wrap them.
+        if not _fits_integer_dtype(df[column], np.dtype(dtype)):
+            continue
+        if dtype in NULLABLE_DTYPES and df[column].isna().any():
+            dtype = NULLABLE_DTYPES[dtype]
+        try:
+            df[column] = df[column].astype(pandas_dtype(dtype))
+        except (TypeError, ValueError):
+            continue
+
+    if "id" in df.columns and not isinstance(df["id"].dtype, pd.CategoricalDtype):
+        df["id"] = df["id"].astype("category")
     return df
+
+
+def _fits_integer_dtype(values: pd.Series, dtype: np.dtype) -> bool:
+    if dtype.kind not in "iu":
+        return True
+    samples = values.dropna().to_numpy()
+    if samples.size == 0:
+        return True
+    if not np.issubdtype(samples.dtype, np.number):
+        return False
+    limits = np.iinfo(dtype)
+    return bool(
+        np.all(np.mod(samples, 1) == 0)
+        and samples.min() >= limits.min
+        and samples.max() <= limits.max
+    )
+
+
+def _to_array(data: List[Any]) -> np.ndarray:
+    array = np.asarray(data)
+    if array.dtype == object:
+        # Missing samples arrive as None; keep the column numeric as NaN.
+        try:
+            array = np.asarray(data, dtype=np.float64)
+        except (TypeError, ValueError):
+            pass
+    return array
+
+
+def _pad(array: np.ndarray | None, length: int) -> np.ndarray:
+    if array is None:
+        return np.full(length, np.nan)
+
+    missing = length - len(array)
+    if missing == 0:
+        return array
+
+    if array.dtype.kind in "iuf":
+        padded = np.full(length, np.nan)
+    else:
+        padded = np.full(length, None, dtype=object)
+    padded[: len(array)] = array
+    return padded
@@ -1,3 +1,6 @@
+import asyncio
+import logging
+from dataclasses import dataclass
 from typing import Any, Dict, cast
 
 import aiohttp
@@ -7,20 +10,54 @@ from src.interfaces.database.database_deleter import IDatabaseDeleter
 from src.interfaces.encryption.encryptor import IEncryptation
 from src.utils import exceptions
 
+from .rate_limiter import RateLimiter
+from .retry_policy import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
 UNAUTHORIZED_USER = 401
 REACH_REQUEST_LIMIT = 429
 
 
+@dataclass
+class ConnectionPoolConfig:
+    limit: int = 20
+    limit_per_host: int = 10
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+    request_timeout: float = 60.0
+
+
 class AsyncHTTPClient(BaseASyncHTTPClient):
     def __init__(
         self,
         database_deleter: IDatabaseDeleter | None = None,
         table: str | None = None,
         encryptor: IEncryptation | None = None,
+        pool_config: ConnectionPoolConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
     ):
         self.database_deleter = database_deleter
         self.table = table
         self.encryptor = encryptor
+        self.pool_config = pool_config or ConnectionPoolConfig()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._session: aiohttp.ClientSession | None = None
+        self._cleanup_task: asyncio.Task[None] | None = None
+
+    async def open(self) -> None:
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+
+    async def close(self) -> None:
+        if self._cleanup_task is not None:
+            await asyncio.gather(self._cleanup_task, return_exceptions=True)
+            self._cleanup_task = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def make_async_request(
         self,
@@ -28,17 +65,133 @@ class AsyncHTTPClient(BaseASyncHTTPClient):
         headers: Dict[str, str],
         params: Dict[str, Any] | None = None,
     ) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params) as response:
-                if response.status == REACH_REQUEST_LIMIT:
-                    raise exceptions.TooManyRequestError(
-                        "\n\n You have reached the request limit. Please, try again in 15 minutes."
+        if self._session is None or self._session.closed:
+            async with self._create_session() as session:
+                return await self._send_request(session, url, headers, params)
+        return await self._send_request(self._session, url, headers, params)
+
+    async def make_async_post(
+        self,
+        url: str,
+        data: Dict[str, str],
+        headers: Dict[str, str] | None = None,
+    ) -> Dict[str, Any]:
+        """POST a form through the pooled session, e.g. to the OAuth endpoint.
+
+        Token requests are not counted against the API rate limit, so they
+        never queue behind fetches waiting for the next window.
+        """
+        if self._session is None or self._session.closed:
+            async with self._create_session() as session:
+                return await self._send_request(
+                    session, url, headers or {}, data=data, method="POST"
+                )
+        return await self._send_request(
+            self._session, url, headers or {}, data=data, method="POST"
+        )
+
+    async def _send_request(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: Dict[str, str],
+        params: Dict[str, Any] | None = None,
+        data: Dict[str, str] | None = None,
+        method: str = "GET",
+    ) -> Dict[str, Any]:
+        attempt = 1
+        while True:
+            try:
+                if method == "GET":
+                    await self.rate_limiter.acquire()
+                    request = session.get(url, headers=headers, params=params)
+                else:
+                    request = session.post(url, headers=headers, data=data)
+
+                async with request as response:
+                    if method == "GET":
+                        self.rate_limiter.update(response.headers)
+
+                    if not self.retry_policy.should_retry_status(
+                        response.status, attempt
+                    ):
+                        if method == "GET":
+                            return await self._handle_response(response)
+                        return await self._handle_post_response(response)
+
+                    retry_after = self.retry_policy.parse_retry_after(
+                        response.headers.get("Retry-After")
                     )
+                    delay = self.retry_policy.backoff(attempt, retry_after)
+                    reason = f"status {response.status}"
+
+            except Exception as e:
+                if not self.retry_policy.should_retry_error(e, attempt):
+                    raise
+                delay = self.retry_policy.backoff(attempt)
+                reason = repr(e)
+
+            logger.warning(
+                f"Request to {url} failed ({reason}), "
+                f"retrying in {delay:.1f}s (attempt {attempt})"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _handle_response(
+        self, response: aiohttp.ClientResponse
+    ) -> Dict[str, Any]:
+        if response.status == REACH_REQUEST_LIMIT:
+            raise exceptions.TooManyRequestError(
+                "\n\n You have reached the request limit. Please, try again in 15 minutes."
+            )
+
+        if response.status == UNAUTHORIZED_USER:
+            raise exceptions.UnauthorizedError(
+                "\n\n The access token was rejected by Strava."
+            )
+
+        if response.status in self.retry_policy.retryable_statuses:
+            response.raise_for_status()
+        return cast(Dict[str, Any], await response.json())
+
+    @staticmethod
+    async def _handle_post_response(
+        response: aiohttp.ClientResponse,
+    ) -> Dict[str, Any]:
+        response.raise_for_status()
+        return cast(Dict[str, Any], await response.json())
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_config.limit,
+            limit_per_host=self.pool_config.limit_per_host,
+            keepalive_timeout=self.pool_config.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.pool_config.dns_cache_ttl,
+        )
+        timeout = aiohttp.ClientTimeout(total=self.pool_config.request_timeout)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    def schedule_token_cleanup(self) -> None:
+        """Delete expired token rows in the background.
+
+        Only call this once a fresh token row is stored: the latest expired row
+        holds the refresh token that a pending refresh still needs.
+        """
+        # The Supabase client is blocking, keep it off the event loop and run
+        # at most one cleanup at a time.
+        if not (self.database_deleter and self.table and self.encryptor):
+            return
+        if self._cleanup_task is not None and not self._cleanup_task.done():
+            return
+        self._cleanup_task = asyncio.create_task(self._cleanup_expired_tokens())
 
-                if response.status == UNAUTHORIZED_USER:
-                    self._remove_expired_tokens()
-                    return {}
-                return cast(Dict[str, Any], await response.json())
+    async def _cleanup_expired_tokens(self) -> None:
+        try:
+            await asyncio.to_thread(self._remove_expired_tokens)
+        except Exception as e:
+            logger.warning(f"Failed to clean up expired tokens: {e}")
 
     def _remove_expired_tokens(self) -> None:
         if self.database_deleter and self.table and self.encryptor:
@@ -1,11 +1,18 @@
 from typing import Any, Dict, cast
 
 from src.interfaces.api_clients.async_http_client import BaseASyncHTTPClient
+from src.interfaces.api_clients.response_cache import IResponseCache
 from src.interfaces.api_clients.strava_api import BaseStravaAPI, StravaAPIConfig
+from src.interfaces.auth.token_provider import ITokenProvider
 from src.interfaces.database.database_deleter import IDatabaseDeleter
 from src.interfaces.encryption.encryptor import IEncryptation
+from src.utils import exceptions
 
-from .async_http_client import AsyncHTTPClient
+from .async_http_client import AsyncHTTPClient, ConnectionPoolConfig
+from .concurrency import DEFAULT_MAX_CONCURRENCY, ConcurrencyLimiter
+from .rate_limiter import RateLimiter
+from .retry_policy import RetryPolicy
+from .single_flight import SingleFlight, request_key
 
 
 class AsyncStravaAPI(BaseStravaAPI):
@@ -16,26 +23,90 @@ class AsyncStravaAPI(BaseStravaAPI):
         encryptor: IEncryptation,
         config: StravaAPIConfig | None = None,
         deleter: IDatabaseDeleter | None = None,
+        pool_config: ConnectionPoolConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        endpoint_concurrency: Dict[str, int] | None = None,
+        coalesce_requests: bool = True,
+        response_cache: IResponseCache | None = None,
+        token_provider: ITokenProvider | None = None,
+        http_client: BaseASyncHTTPClient | None = None,
     ):
+        # A shared client keeps its own pool, rate-limit and retry settings.
         super().__init__(
             access_token=access_token,
-            http_client=AsyncHTTPClient(
+            http_client=http_client
+            or AsyncHTTPClient(
                 database_deleter=deleter,
                 table=table,
                 encryptor=encryptor,
+                pool_config=pool_config,
+                rate_limiter=rate_limiter,
+                retry_policy=retry_policy,
             ),
             config=config,
+            token_provider=token_provider,
         )
+        self.concurrency_limiter = ConcurrencyLimiter(
+            max_concurrency=max_concurrency,
+            endpoint_limits=endpoint_concurrency,
+        )
+        self.single_flight = SingleFlight() if coalesce_requests else None
+        self.response_cache = response_cache
 
     async def make_request(
         self, endpoint: str, params: dict | None = None
     ) -> Dict[str, Any]:
-        url = self.get_url(endpoint)
+        if self.response_cache is not None:
+            cached = self.response_cache.get(endpoint, params)
+            if cached is not None:
+                return cast(Dict[str, Any], cached)
+
+        # Identical concurrent requests share one HTTP call and its result.
+        if self.single_flight is None:
+            response = await self._send_request(endpoint, params)
+        else:
+            response = await self.single_flight.do(
+                request_key(endpoint, params),
+                lambda: self._send_request(endpoint, params),
+            )
+
+        # Empty bodies are never cached.
+        if self.response_cache is not None and response:
+            self.response_cache.set(endpoint, params, response)
+        return cast(Dict[str, Any], response)
+
+    async def _send_request(
+        self, endpoint: str, params: dict | None = None
+    ) -> Dict[str, Any]:
+        if self.token_provider is None:
+            return await self._send_once(endpoint, params, self.get_headers())
+
+        await self.token_provider.ensure_fresh()
         headers = self.get_headers()
+        try:
+            return await self._send_once(endpoint, params, headers)
+        except exceptions.UnauthorizedError:
+            rejected_token = headers["Authorization"].removeprefix("Bearer ")
+
+        # All requests rejected with the same token share one refresh, then
+        # each is replayed once with the new bearer.
+        await self.token_provider.refresh_rejected(rejected_token)
+        # The new token row is stored by now, so deleting expired rows can no
+        # longer take away the refresh token the refresh was reading.
+        cast(BaseASyncHTTPClient, self.http_client).schedule_token_cleanup()
+        return await self._send_once(endpoint, params, self.get_headers())
+
+    async def _send_once(
+        self, endpoint: str, params: dict | None, headers: Dict[str, str]
+    ) -> Dict[str, Any]:
+        url = self.get_url(endpoint)
         client = cast(BaseASyncHTTPClient, self.http_client)
 
-        return await client.make_async_request(
-            url=url,
-            headers=headers,
-            params=params,
-        )
+        async with self.concurrency_limiter.limit(endpoint):
+            return await client.make_async_request(
+                url=url,
+                headers=headers,
+                params=params,
+            )
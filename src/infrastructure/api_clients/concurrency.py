@@ -0,0 +1,48 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+
+from .endpoints import endpoint_template
+
+DEFAULT_MAX_CONCURRENCY = 10
+_DEFAULT_POOL = "*"
+
+
+class ConcurrencyLimiter:
+    """Caps the number of in-flight requests shared by every fan-out fetch.
+
+    Endpoints listed in ``endpoint_limits`` (by template, e.g.
+    ``/activities/{id}/streams``) get their own pool instead of the default one.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        endpoint_limits: Dict[str, int] | None = None,
+    ):
+        self.endpoint_limits = endpoint_limits or {}
+        for limit in (max_concurrency, *self.endpoint_limits.values()):
+            if limit < 1:
+                raise ValueError("Concurrency limits must be greater than zero.")
+
+        self.max_concurrency = max_concurrency
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @asynccontextmanager
+    async def limit(self, endpoint: str) -> AsyncIterator[None]:
+        async with self._get_semaphore(endpoint_template(endpoint)):
+            yield
+
+    def _get_semaphore(self, template: str) -> asyncio.Semaphore:
+        # Semaphores belong to the loop that first waits on them.
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphores = {}
+
+        pool = template if template in self.endpoint_limits else _DEFAULT_POOL
+        if pool not in self._semaphores:
+            size = self.endpoint_limits.get(pool, self.max_concurrency)
+            self._semaphores[pool] = asyncio.Semaphore(size)
+        return self._semaphores[pool]
@@ -0,0 +1,11 @@
+import re
+
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Replace numeric path segments so endpoints can be grouped by resource.
+
+    Example: ``/activities/123/streams`` becomes ``/activities/{id}/streams``.
+    """
+    return _NUMERIC_SEGMENT.sub("/{id}", endpoint)
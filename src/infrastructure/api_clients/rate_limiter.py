@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Mapping, Tuple
+
+logger = logging.getLogger(__name__)
+
+LIMIT_HEADER = "X-RateLimit-Limit"
+USAGE_HEADER = "X-RateLimit-Usage"
+READ_LIMIT_HEADER = "X-ReadRateLimit-Limit"
+READ_USAGE_HEADER = "X-ReadRateLimit-Usage"
+SHORT_WINDOW_SECONDS = 15 * 60
+DAILY_WINDOW_SECONDS = 24 * 60 * 60
+
+
+@dataclass
+class RateLimitWindow:
+    """Token bucket for one of the Strava rate-limit windows.
+
+    Strava counts requests in fixed windows (quarter hours and UTC days), so the
+    bucket is refilled completely whenever a new window starts.
+    """
+
+    period: int
+    limit: int | None = None
+    tokens: int | None = None
+    window_start: float = 0.0
+
+    def refill(self, now: float) -> None:
+        start = now - now % self.period
+        if start > self.window_start:
+            self.window_start = start
+            self.tokens = self.limit
+
+    def seconds_until_available(self, now: float) -> float:
+        self.refill(now)
+        if self.tokens is None or self.tokens > 0:
+            return 0.0
+        return self.window_start + self.period - now
+
+    def consume(self) -> None:
+        if self.tokens is not None:
+            self.tokens -= 1
+
+    def sync(self, limit: int, usage: int, now: float) -> None:
+        self.refill(now)
+        remaining = max(limit - usage, 0)
+        self.limit = limit
+        # Requests still in flight are already counted locally but may not be
+        # in the server usage yet, so never hand tokens back on a sync.
+        self.tokens = remaining if self.tokens is None else min(self.tokens, remaining)
+
+
+class RateLimiter:
+    """Paces requests according to the rate-limit headers returned by Strava.
+
+    Strava reports an overall budget (X-RateLimit-*) and a tighter budget for
+    read requests (X-ReadRateLimit-*), each with a quarter-hour and a daily
+    window. Reads wait for the tightest of all four.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self.short_window = RateLimitWindow(period=SHORT_WINDOW_SECONDS)
+        self.daily_window = RateLimitWindow(period=DAILY_WINDOW_SECONDS)
+        self.read_short_window = RateLimitWindow(period=SHORT_WINDOW_SECONDS)
+        self.read_daily_window = RateLimitWindow(period=DAILY_WINDOW_SECONDS)
+
+    @property
+    def windows(self) -> Tuple[RateLimitWindow, RateLimitWindow]:
+        return self.short_window, self.daily_window
+
+    @property
+    def read_windows(self) -> Tuple[RateLimitWindow, RateLimitWindow]:
+        return self.read_short_window, self.read_daily_window
+
+    async def acquire(self, read: bool = True) -> None:
+        windows = (*self.windows, *self.read_windows) if read else self.windows
+        while True:
+            now = self.clock()
+            wait = max(window.seconds_until_available(now) for window in windows)
+            if wait <= 0:
+                for window in windows:
+                    window.consume()
+                return
+
+            logger.warning(f"Strava rate limit reached, waiting {wait:.0f} seconds")
+            await asyncio.sleep(wait)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        now = self.clock()
+        self._sync(self.windows, headers, LIMIT_HEADER, USAGE_HEADER, now)
+        self._sync(
+            self.read_windows, headers, READ_LIMIT_HEADER, READ_USAGE_HEADER, now
+        )
+
+    def _sync(
+        self,
+        windows: Tuple[RateLimitWindow, RateLimitWindow],
+        headers: Mapping[str, str],
+        limit_header: str,
+        usage_header: str,
+        now: float,
+    ) -> None:
+        limits = self._parse_header(headers.get(limit_header))
+        usages = self._parse_header(headers.get(usage_header))
+        if len(limits) != 2 or len(usages) != 2:
+            return
+
+        for window, limit, usage in zip(windows, limits, usages):
+            window.sync(limit=limit, usage=usage, now=now)
+
+    @staticmethod
+    def _parse_header(value: str | None) -> List[int]:
+        if not value:
+            return []
+        try:
+            return [int(part) for part in value.split(",")]
+        except ValueError:
+            return []
@@ -0,0 +1,92 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple
+
+from src.interfaces.api_clients.response_cache import IResponseCache
+
+from .endpoints import endpoint_template
+from .single_flight import RequestKey, request_key
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 60.0
+
+# Seconds each endpoint template stays fresh; None never expires and 0 is
+# never cached. Zones of a recorded activity do not change, while the activity
+# list grows. Streams are left to the on-disk stream cache: kept here as raw
+# JSON they would pin every sample in memory as a boxed float.
+DEFAULT_ENDPOINT_TTLS: Dict[str, float | None] = {
+    "/activities": 5 * 60,
+    "/athlete": 60 * 60,
+    "/activities/{id}": 60 * 60,
+    "/activities/{id}/streams": 0,
+    "/activities/{id}/zones": None,
+}
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache(IResponseCache):
+    """In-memory LRU cache of API responses with per-endpoint TTLs.
+
+    Cached responses are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        endpoint_ttls: Dict[str, float | None] | None = None,
+        default_ttl: float | None = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("The cache size must be greater than zero.")
+        self.max_entries = max_entries
+        self.endpoint_ttls = (
+            DEFAULT_ENDPOINT_TTLS if endpoint_ttls is None else endpoint_ttls
+        )
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: OrderedDict[RequestKey, Tuple[float | None, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, endpoint: str, params: dict | None = None) -> Any | None:
+        key = request_key(endpoint, params)
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, response = entry
+            if expires_at is None or self.clock() < expires_at:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return response
+            del self._entries[key]
+
+        self.stats.misses += 1
+        return None
+
+    def set(self, endpoint: str, params: dict | None, response: Any) -> None:
+        ttl = self.endpoint_ttls.get(endpoint_template(endpoint), self.default_ttl)
+        if ttl is not None and ttl <= 0:
+            return
+
+        key = request_key(endpoint, params)
+        expires_at = None if ttl is None else self.clock() + ttl
+        self._entries[key] = (expires_at, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
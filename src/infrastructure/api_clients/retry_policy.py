@@ -0,0 +1,64 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Tuple, Type
+
+import aiohttp
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry settings for transient Strava API failures.
+
+    Delays grow exponentially from ``backoff_base`` up to ``backoff_max``; with
+    ``jitter`` enabled a random delay in ``[0, backoff]`` is used instead, so
+    concurrent fetches do not retry in lockstep. A ``Retry-After`` header always
+    sets the minimum delay.
+    """
+
+    max_attempts: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    jitter: bool = True
+    retryable_statuses: FrozenSet[int] = RETRYABLE_STATUSES
+    retryable_exceptions: Tuple[Type[BaseException], ...] = field(
+        default=(aiohttp.ClientConnectionError, asyncio.TimeoutError)
+    )
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+
+    def should_retry_status(self, status: int, attempt: int) -> bool:
+        return status in self.retryable_statuses and attempt < self.max_attempts
+
+    def should_retry_error(self, error: BaseException, attempt: int) -> bool:
+        return (
+            isinstance(error, self.retryable_exceptions) and attempt < self.max_attempts
+        )
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        delay: float = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: str | None) -> float | None:
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(retry_at.timestamp() - time.time(), 0.0)
@@ -0,0 +1,37 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Tuple
+
+RequestKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def request_key(endpoint: str, params: Mapping[str, Any] | None) -> RequestKey:
+    """Hashable identity of a GET request; param order does not matter."""
+    return endpoint, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+
+
+class SingleFlight:
+    """Shares one in-flight call between concurrent callers with the same key.
+
+    Callers wait on a shielded task, so cancelling one of them does not cancel
+    the request the others are waiting for. Keys are forgotten as soon as the
+    call finishes; nothing is cached.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[Hashable, asyncio.Task[Any]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
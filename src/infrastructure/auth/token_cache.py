@@ -0,0 +1,73 @@
+import json
+import logging
+import os
+import time
+from typing import Callable, Tuple
+
+from src.interfaces.encryption.encryptor import IEncryptation
+from src.utils import constants as constant
+
+logger = logging.getLogger(__name__)
+
+
+class LocalTokenCache:
+    """Encrypted on-disk copy of the current access token.
+
+    A token is only served while it stays valid for at least
+    ``expiry_margin`` seconds, so callers never start work with a token that
+    is about to expire.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        encryptor: IEncryptation,
+        expiry_margin: int = constant.TOKEN_EXPIRY_MARGIN_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.encryptor = encryptor
+        self.expiry_margin = expiry_margin
+        self.clock = clock
+
+    def get(self) -> str | None:
+        cached = self.get_with_expiry()
+        return cached[0] if cached is not None else None
+
+    def get_with_expiry(self) -> Tuple[str, int] | None:
+        try:
+            with open(self.path) as file:
+                record = self.encryptor.decrypt_data(json.load(file))
+            access_token = record["access_token"]
+            expires_at = int(record["expires_at"])
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable token cache: {e}")
+            return None
+
+        if expires_at - self.expiry_margin <= self.clock():
+            return None
+        return access_token, expires_at
+
+    def set(self, access_token: str, expires_at: int) -> None:
+        encrypted = self.encryptor.encrypt_data(
+            {"access_token": access_token, "expires_at": int(expires_at)}
+        )
+        temp_path = f"{self.path}.tmp"
+        try:
+            # Owner-only permissions, the token grants access to the account.
+            descriptor = os.open(
+                temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with os.fdopen(descriptor, "w") as file:
+                json.dump(encrypted, file)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write token cache: {e}")
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
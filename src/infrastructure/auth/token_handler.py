@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime
@@ -5,7 +6,7 @@ from functools import wraps
 from typing import Any, Callable, Dict
 
 from src.infrastructure.auth.oauth_code import GetOauthCode
-from src.infrastructure.auth.token_manager import TokenManager
+from src.infrastructure.auth.token_manager import AsyncTokenManager, TokenManager
 from src.infrastructure.database.supabase_deleter import SupabaseDeleter
 from src.infrastructure.database.supabase_reader import SupabaseReader
 from src.infrastructure.database.supabase_writer import SupabaseWriter
@@ -51,14 +52,44 @@ class TokenHandler:
         self.credentials = Credentials(client_id)
 
     def process_token(self, table: str) -> Any:
-        record = self.supabase_reader.fetch_latest_record(table, "*", "expires_at")
+        """Return the decrypted token record, refreshed or created if needed."""
+        record = self._fetch_latest_token(table)
 
         if not record:
             logger.info("No data found in Supabase. Generating initial tokens...\n")
-            self._handle_initial_token_flow(table)
-            return {}
+            return self._handle_initial_token_flow(table) or {}
         return self._handle_exisiting_token(record, table)
 
+    async def refresh_token(
+        self, table: str, token_manager: AsyncTokenManager
+    ) -> Dict[str, int | str]:
+        """Refresh through the async client; Supabase calls run in a thread."""
+        refresh_token = await asyncio.to_thread(self._latest_refresh_token, table)
+        new_tokens = await token_manager.refresh_access_token(refresh_token)
+
+        if not new_tokens:
+            raise exception.TokenError("Token refresh failed.")
+
+        return await asyncio.to_thread(self._store_and_return_tokens, new_tokens, table)
+
+    def _fetch_latest_token(self, table: str) -> Dict[str, str] | None:
+        # The encrypted expires_at does not sort by time; order by the
+        # plaintext copy and only fall back for rows stored before it existed.
+        record = self.supabase_reader.fetch_latest_record(
+            table, "*", constant.TOKEN_EXPIRES_AT_COLUMN
+        )
+        if record and record.get(constant.TOKEN_EXPIRES_AT_COLUMN) is None:
+            record = self.supabase_reader.fetch_latest_record(table, "*", "expires_at")
+        return record
+
+    @handle_token_errors
+    def _latest_refresh_token(self, table: str) -> str:
+        record = self._fetch_latest_token(table)
+        if not record:
+            raise exception.TokenError("No stored token to refresh.")
+
+        return str(self.encryptor.decrypt_data(record)["refresh_token"])
+
     @handle_token_errors
     def _cleanup_expired_tokens(self, table: str) -> None:
         try:
@@ -114,6 +145,9 @@ class TokenHandler:
     ) -> Dict[str, int | str]:
         data_to_insert = self._prepare_token_data(tokens)
         encrypted_data = self.encryptor.encrypt_data(data=data_to_insert)
+        encrypted_data[constant.TOKEN_EXPIRES_AT_COLUMN] = str(
+            int(data_to_insert["expires_at"])
+        )
 
         if not self.supabase_writer.insert_record(table, encrypted_data):
             raise exception.TokenError("Failed to store tokens in database")
@@ -3,8 +3,10 @@ import time
 from enum import Enum
 from typing import Any, Dict, cast
 
+import aiohttp
 import requests
 
+from src.interfaces.api_clients.async_http_client import BaseASyncHTTPClient
 from src.utils import constants as constant
 from src.utils import exceptions
 
@@ -16,7 +18,7 @@ class GranType(Enum):
     AUTHORIZATION_CODE = "authorization_code"
 
 
-class TokenManager:
+class BaseTokenManager:
     def __init__(self, client_id: str, secret_key: str):
         self.client_id = client_id
         self.secret_key = secret_key
@@ -36,6 +38,8 @@ class TokenManager:
         data.update(kwargs)
         return data
 
+
+class TokenManager(BaseTokenManager):
     def _send_token_request(self, data: Dict[str, str]) -> Dict[str, Any] | None:
         try:
             response = requests.post(constant.URL_GET_ACCESS_TOKEN, data=data)
@@ -61,3 +65,40 @@ class TokenManager:
             code=code,
         )
         return self._send_token_request(data)
+
+
+class AsyncTokenManager(BaseTokenManager):
+    """Token endpoint client that posts through the shared async HTTP client.
+
+    Refreshing mid-batch then reuses the pooled connections of the API calls
+    instead of blocking the event loop on a separate ``requests`` session.
+    """
+
+    def __init__(
+        self, client_id: str, secret_key: str, http_client: BaseASyncHTTPClient
+    ):
+        super().__init__(client_id=client_id, secret_key=secret_key)
+        self.http_client = http_client
+
+    async def _send_token_request(self, data: Dict[str, str]) -> Dict[str, Any] | None:
+        try:
+            return await self.http_client.make_async_post(
+                constant.URL_GET_ACCESS_TOKEN, data=data
+            )
+        except aiohttp.ClientError as e:
+            logger.error(f"Error requesting tokens: {e}", exc_info=True)
+            return None
+
+    async def refresh_access_token(self, refresh_token: str) -> Dict[str, Any] | None:
+        data = self._prepare_request_data(
+            gran_type=GranType.REFRESH_TOKEN,
+            refresh_token=refresh_token,
+        )
+        return await self._send_token_request(data)
+
+    async def get_initial_tokens(self, code: str) -> Dict[str, Any] | None:
+        data = self._prepare_request_data(
+            gran_type=GranType.AUTHORIZATION_CODE,
+            code=code,
+        )
+        return await self._send_token_request(data)
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Tuple
+
+from src.infrastructure.api_clients.single_flight import SingleFlight
+from src.interfaces.auth.token_provider import ITokenProvider
+from src.utils import constants as constant
+from src.utils.exceptions import UnauthorizedError
+
+logger = logging.getLogger(__name__)
+
+TokenRefresher = Callable[[], Awaitable[Tuple[str, int]]]
+
+
+class RefreshingTokenProvider(ITokenProvider):
+    """Keeps the access token valid for as long as the API session is open.
+
+    A background task refreshes the token ``refresh_margin`` seconds before it
+    expires and swaps it in place, so requests sent afterwards pick up the new
+    bearer. Requests that find the token inside the margin, or that Strava
+    rejected, wait for the same refresh instead of each starting their own.
+    """
+
+    def __init__(
+        self,
+        access_token: str,
+        expires_at: int,
+        refresher: TokenRefresher,
+        refresh_margin: int = constant.TOKEN_EXPIRY_MARGIN_SECONDS,
+        retry_interval: float = constant.TOKEN_REFRESH_RETRY_SECONDS,
+        refresh_cooldown: float = constant.TOKEN_REFRESH_COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        if not access_token:
+            raise ValueError("\n\nAccess token must be provided.")
+        self._access_token = access_token
+        self.expires_at = int(expires_at)
+        self.refresher = refresher
+        self.refresh_margin = refresh_margin
+        self.retry_interval = retry_interval
+        self.refresh_cooldown = refresh_cooldown
+        self.clock = clock
+        self._refreshed_at: float | None = None
+        self._failed_at: float | None = None
+        self._single_flight = SingleFlight()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def access_token(self) -> str:
+        return self._access_token
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def seconds_until_refresh(self) -> float:
+        return self.expires_at - self.refresh_margin - self.clock()
+
+    async def ensure_fresh(self) -> None:
+        if self.seconds_until_refresh() > 0:
+            return
+        # Like the background loop, wait retry_interval after a failed
+        # refresh instead of retrying on every request inside the margin.
+        if self._failed_recently() and self.expires_at > self.clock():
+            return
+        try:
+            await self.refresh()
+        except Exception as e:
+            # Inside the margin the current token still works, keep using it.
+            if self.expires_at <= self.clock():
+                raise
+            logger.warning(f"Token refresh failed, using current token: {e}")
+
+    async def refresh_rejected(self, access_token: str) -> None:
+        # Requests rejected with a token that was already swapped out just
+        # replay; the rest join the refresh that is in flight.
+        if access_token != self._access_token:
+            return
+        # Strava hands back the same token while it has over an hour left, so
+        # a token rejected right after a refresh will not be fixed by another.
+        if self._refreshed_recently():
+            raise UnauthorizedError("Access token rejected right after a refresh")
+        await self.refresh()
+        if self._access_token == access_token:
+            raise UnauthorizedError("Token refresh returned the rejected token")
+
+    async def refresh(self) -> None:
+        # Concurrent callers and the background task share one refresh call.
+        await self._single_flight.do("refresh", self._refresh)
+
+    async def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _refresh(self) -> None:
+        try:
+            access_token, expires_at = await self.refresher()
+        except Exception:
+            self._failed_at = self.clock()
+            raise
+        self._failed_at = None
+        self._access_token = access_token
+        self.expires_at = int(expires_at)
+        self._refreshed_at = self.clock()
+        logger.info("Access token refreshed")
+
+    def _failed_recently(self) -> bool:
+        return (
+            self._failed_at is not None
+            and self.clock() - self._failed_at < self.retry_interval
+        )
+
+    def _refreshed_recently(self) -> bool:
+        return (
+            self._refreshed_at is not None
+            and self.clock() - self._refreshed_at < self.refresh_cooldown
+        )
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            delay = self.seconds_until_refresh()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Background token refresh failed: {e}")
+
+            # A failed refresh, or a token issued already inside the margin,
+            # must not turn the loop into a busy retry.
+            if self.seconds_until_refresh() <= 0:
+                await asyncio.sleep(self.retry_interval)
@@ -0,0 +1,128 @@
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from src.interfaces.stream_cache import IStreamCache
+from src.utils import constants as constant
+
+logger = logging.getLogger(__name__)
+
+CACHE_SUFFIX = ".npz"
+
+
+class NpzStreamCache(IStreamCache):
+    """On-disk cache of activity streams stored as compressed NumPy archives.
+
+    Each entry holds one array per stream type and is addressed by a hash of
+    the activity id and the requested stream keys. Reads refresh the file
+    mtime, so eviction drops the least recently used entries first once the
+    directory grows beyond ``max_bytes``. The directory is scanned once on
+    start-up and then only when the running total goes over the limit.
+    Methods block on disk I/O; async callers run them in a thread.
+    """
+
+    def __init__(
+        self, directory: str, max_bytes: int = constant.STREAM_CACHE_MAX_BYTES
+    ):
+        if max_bytes < 1:
+            raise ValueError("The cache size must be greater than zero.")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._total_bytes = sum(size for _, size, _ in self._entries())
+
+    def get(self, activity_id: int, stream_keys: List[str]) -> Dict[str, Any] | None:
+        path = self._path(activity_id, stream_keys)
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                response = {
+                    stream_type: {"data": archive[stream_type]}
+                    for stream_type in archive.files
+                }
+            os.utime(path)
+            return response
+
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable stream cache entry {path}: {e}")
+            with self._lock:
+                self._total_bytes -= self._remove(path)
+            return None
+
+    def set(
+        self, activity_id: int, stream_keys: List[str], response: Dict[str, Any]
+    ) -> None:
+        try:
+            arrays = {
+                stream_type: np.asarray(stream_data["data"])
+                for stream_type, stream_data in response.items()
+            }
+        except (KeyError, TypeError, ValueError):
+            return
+        # Object arrays would need pickling, so those streams are not cached.
+        if not arrays or any(array.dtype == object for array in arrays.values()):
+            return
+
+        path = self._path(activity_id, stream_keys)
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                np.savez_compressed(file, **arrays)  # type: ignore[arg-type]
+            size = os.path.getsize(temp_path)
+            with self._lock:
+                replaced = self._size(path)
+                os.replace(temp_path, path)
+                self._total_bytes += size - replaced
+                if self._total_bytes > self.max_bytes:
+                    self._evict()
+        except OSError as e:
+            logger.warning(f"Failed to write stream cache entry {path}: {e}")
+            Path(temp_path).unlink(missing_ok=True)
+
+    def _path(self, activity_id: int, stream_keys: List[str]) -> Path:
+        key = f"{activity_id}:{','.join(sorted(set(stream_keys)))}"
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / f"{digest}{CACHE_SUFFIX}"
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self.directory.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        # Rescan rather than trust the running total, other processes may
+        # share the directory.
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._total_bytes = total
+
+    @staticmethod
+    def _size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    @classmethod
+    def _remove(cls, path: Path) -> int:
+        size = cls._size(path)
+        path.unlink(missing_ok=True)
+        return size
@@ -0,0 +1,121 @@
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Tuple
+
+from src.interfaces.database.activity_store import IActivityStore
+from src.utils import exceptions as exception
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS activities (
+    id INTEGER PRIMARY KEY,
+    athlete_id INTEGER NOT NULL,
+    start_epoch INTEGER NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_activities_athlete_start
+    ON activities (athlete_id, start_epoch);
+CREATE TABLE IF NOT EXISTS sync_state (
+    athlete_id INTEGER PRIMARY KEY,
+    synced_after INTEGER NOT NULL,
+    synced_before INTEGER NOT NULL
+);
+"""
+
+
+class SqliteActivityStore(IActivityStore):
+    """Local activity cache keyed by activity id.
+
+    ``sync_state`` keeps, per athlete, the contiguous epoch range already
+    downloaded; ``synced_before`` is the high-watermark of the last sync.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with self._connect() as connection:
+                connection.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            raise exception.DatabaseOperationError(
+                f"Failed to initialise activity store: {e}"
+            )
+
+    def get_synced_range(self, athlete_id: int) -> Tuple[int, int] | None:
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT synced_after, synced_before FROM sync_state "
+                    "WHERE athlete_id = ?",
+                    (athlete_id,),
+                ).fetchone()
+            return (int(row[0]), int(row[1])) if row else None
+
+        except sqlite3.Error as e:
+            raise exception.DatabaseOperationError(f"Failed to fetch sync state: {e}")
+
+    def update_synced_range(self, athlete_id: int, after: int, before: int) -> None:
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT INTO sync_state (athlete_id, synced_after, synced_before) "
+                    "VALUES (?, ?, ?) ON CONFLICT(athlete_id) DO UPDATE SET "
+                    "synced_after = excluded.synced_after, "
+                    "synced_before = excluded.synced_before",
+                    (athlete_id, after, before),
+                )
+
+        except sqlite3.Error as e:
+            raise exception.DatabaseOperationError(f"Failed to update sync state: {e}")
+
+    def save_activities(
+        self, athlete_id: int, activities: List[Dict[str, Any]]
+    ) -> None:
+        rows = [
+            (
+                activity["id"],
+                athlete_id,
+                self._start_epoch(activity),
+                json.dumps(activity),
+            )
+            for activity in activities
+        ]
+        try:
+            with self._connect() as connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO activities "
+                    "(id, athlete_id, start_epoch, payload) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+
+        except sqlite3.Error as e:
+            raise exception.DatabaseOperationError(f"Failed to save activities: {e}")
+
+    def get_activities(
+        self, athlete_id: int, after: int, before: int
+    ) -> List[Dict[str, Any]]:
+        try:
+            with self._connect() as connection:
+                rows = connection.execute(
+                    "SELECT payload FROM activities WHERE athlete_id = ? "
+                    "AND start_epoch >= ? AND start_epoch < ? ORDER BY start_epoch",
+                    (athlete_id, after, before),
+                ).fetchall()
+            return [json.loads(row[0]) for row in rows]
+
+        except sqlite3.Error as e:
+            raise exception.DatabaseOperationError(f"Failed to fetch activities: {e}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.path)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _start_epoch(activity: Dict[str, Any]) -> int:
+        start_date = str(activity["start_date"]).replace("Z", "+00:00")
+        return int(datetime.fromisoformat(start_date).timestamp())
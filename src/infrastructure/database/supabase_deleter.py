@@ -1,10 +1,11 @@
 import time
-from typing import List
+from typing import Dict, List, cast
 
 from supabase import Client
 
 from src.interfaces.database.database_deleter import IDatabaseDeleter
 from src.interfaces.encryption.encryptor import IEncryptation
+from src.utils import constants as constant
 from src.utils import exceptions as exception
 
 
@@ -32,17 +33,16 @@ class SupabaseDeleter(IDatabaseDeleter):
 
     def get_expired_token_ids(self, table: str, encryptor: IEncryptation) -> List[int]:
         try:
-            # Fetch all tokens with their expiration times
-            result = self.client.table(table).select("id, expires_at").execute()
-            if not result or not result.data:
-                return []
-
-            expired_ids: List[int] = []
-            for record in result.data:
-                decrypted_data = encryptor.decrypt_data(record)
-                if self._is_token_expired(decrypted_data["expires_at"]):
-                    expired_ids.append(int(decrypted_data["id"]))
-
+            # Indexed range query, only expired rows leave the database.
+            result = (
+                self.client.table(table)
+                .select("id")
+                .lt(constant.TOKEN_EXPIRES_AT_COLUMN, int(time.time()))
+                .execute()
+            )
+            records = cast(List[Dict[str, str]], result.data or [])
+            expired_ids = [int(record["id"]) for record in records]
+            expired_ids.extend(self._get_expired_legacy_token_ids(table, encryptor))
             return sorted(expired_ids)
 
         except Exception as e:
@@ -52,16 +52,46 @@ class SupabaseDeleter(IDatabaseDeleter):
 
     def cleanup_expired_tokens(self, table: str, encryptor: IEncryptation) -> bool:
         try:
-            expired_ids = self.get_expired_token_ids(table, encryptor)
-            if expired_ids:
-                return self.delete_records(table, expired_ids)
-            return False
+            # One filtered bulk delete, its cost does not grow with the table.
+            result = (
+                self.client.table(table)
+                .delete()
+                .lt(constant.TOKEN_EXPIRES_AT_COLUMN, int(time.time()))
+                .execute()
+            )
+            deleted = bool(result and result.data)
+
+            legacy_ids = self._get_expired_legacy_token_ids(table, encryptor)
+            if legacy_ids:
+                deleted = self.delete_records(table, legacy_ids) or deleted
+            return deleted
 
         except Exception as e:
             raise exception.DatabaseOperationError(
                 f"Failed to cleanup expired tokens: {e}"
             )
 
+    def _get_expired_legacy_token_ids(
+        self, table: str, encryptor: IEncryptation
+    ) -> List[int]:
+        # Rows stored before the plaintext expiry column existed still have
+        # to be decrypted; they disappear as soon as they expire.
+        result = (
+            self.client.table(table)
+            .select("id, expires_at")
+            .is_(constant.TOKEN_EXPIRES_AT_COLUMN, "null")
+            .execute()
+        )
+        if not result or not result.data:
+            return []
+
+        expired_ids: List[int] = []
+        for record in cast(List[Dict[str, str]], result.data):
+            decrypted_data = encryptor.decrypt_data(record)
+            if self._is_token_expired(decrypted_data["expires_at"]):
+                expired_ids.append(int(decrypted_data["id"]))
+        return expired_ids
+
     @staticmethod
     def _is_token_expired(expires_at: str | int) -> bool:
         return int(time.time()) > int(expires_at)
@@ -16,7 +16,7 @@ class SupabaseReader(IDatabaseReader):
         try:
             query = self.client.table(table).select(column)
             if order_by:
-                query = query.order(order_by, desc=True)
+                query = query.order(order_by, desc=True, nullsfirst=False)
             result = query.limit(1).execute()
             return result.data[0] if result and result.data else None
 
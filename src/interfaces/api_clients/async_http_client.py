@@ -3,6 +3,12 @@ from typing import Any, Dict
 
 
 class BaseASyncHTTPClient(ABC):
+    @abstractmethod
+    async def open(self) -> None: ...
+
+    @abstractmethod
+    async def close(self) -> None: ...
+
     @abstractmethod
     async def make_async_request(
         self,
@@ -10,3 +16,14 @@ class BaseASyncHTTPClient(ABC):
         headers: Dict[str, str],
         params: Dict[str, Any] | None = None,
     ) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    async def make_async_post(
+        self,
+        url: str,
+        data: Dict[str, str],
+        headers: Dict[str, str] | None = None,
+    ) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    def schedule_token_cleanup(self) -> None: ...
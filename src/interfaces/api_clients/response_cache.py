@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IResponseCache(ABC):
+    @abstractmethod
+    def get(self, endpoint: str, params: dict | None = None) -> Any | None:
+        pass
+
+    @abstractmethod
+    def set(self, endpoint: str, params: dict | None, response: Any) -> None:
+        pass
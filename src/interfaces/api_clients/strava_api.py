@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict
+from types import TracebackType
+from typing import Any, Dict, Self
+
+from src.interfaces.auth.token_provider import ITokenProvider
 
 from .async_http_client import BaseASyncHTTPClient
 
@@ -17,16 +20,39 @@ class BaseStravaAPI(ABC):
         access_token: str,
         http_client: BaseASyncHTTPClient,
         config: StravaAPIConfig | None = None,
+        token_provider: ITokenProvider | None = None,
     ):
         if not access_token:
             raise ValueError("\n\nAccess token must be provided.")
         self.access_token = access_token
         self.http_client = http_client
         self.config = config or StravaAPIConfig()
+        self.token_provider = token_provider
+
+    async def __aenter__(self) -> Self:
+        await self.http_client.open()
+        if self.token_provider is not None:
+            await self.token_provider.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self.token_provider is not None:
+            await self.token_provider.stop()
+        await self.http_client.close()
 
     def get_headers(self) -> Dict[str, str]:
+        access_token = (
+            self.token_provider.access_token
+            if self.token_provider is not None
+            else self.access_token
+        )
         return {
-            "Authorization": f"Bearer {self.access_token}",
+            "Authorization": f"Bearer {access_token}",
             "Content-Type": self.config.content_type,
         }
 
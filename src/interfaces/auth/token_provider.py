@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+
+class ITokenProvider(ABC):
+    @property
+    @abstractmethod
+    def access_token(self) -> str:
+        pass
+
+    @abstractmethod
+    async def ensure_fresh(self) -> None:
+        pass
+
+    @abstractmethod
+    async def refresh_rejected(self, access_token: str) -> None:
+        pass
+
+    @abstractmethod
+    async def start(self) -> None:
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        pass
@@ -1,12 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class IPrinterResult(ABC):
     @abstractmethod
-    def print_result(self, option: str, result: Dict | List | pd.DataFrame) -> None:
+    def print_result(self, option: str, result: "Dict | List | pd.DataFrame") -> None:
         pass
 
 
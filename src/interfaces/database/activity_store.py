@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple
+
+
+class IActivityStore(ABC):
+    @abstractmethod
+    def get_synced_range(self, athlete_id: int) -> Tuple[int, int] | None:
+        pass
+
+    @abstractmethod
+    def update_synced_range(self, athlete_id: int, after: int, before: int) -> None:
+        pass
+
+    @abstractmethod
+    def save_activities(
+        self, athlete_id: int, activities: List[Dict[str, Any]]
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def get_activities(
+        self, athlete_id: int, after: int, before: int
+    ) -> List[Dict[str, Any]]:
+        pass
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+
+class IStreamCache(ABC):
+    @abstractmethod
+    def get(self, activity_id: int, stream_keys: List[str]) -> Dict[str, Any] | None:
+        pass
+
+    @abstractmethod
+    def set(
+        self, activity_id: int, stream_keys: List[str], response: Dict[str, Any]
+    ) -> None:
+        pass
@@ -0,0 +1,202 @@
+import argparse
+import asyncio
+import json
+import sys
+from collections.abc import Callable, Coroutine, Sequence
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, TextIO
+
+from src.infrastructure.api_clients.concurrency import DEFAULT_MAX_CONCURRENCY
+
+if TYPE_CHECKING:
+    from src.strava_service import StravaService
+
+EXIT_OK = 0
+EXIT_FAILURE = 1
+EXIT_USAGE = 2
+
+ServiceFactory = Callable[[int], "StravaService"]
+
+
+def parse_date(value: str) -> int:
+    """Parse a YYYY-MM-DD date (UTC midnight) into an epoch timestamp."""
+    try:
+        date = datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date '{value}', use YYYY-MM-DD")
+    return int(date.timestamp())
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("Value must be greater than zero")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("Value must not be negative")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="strava",
+        description="Run Strava analysis tasks without the interactive menu.",
+        epilog="Global options go before the command, e.g. "
+        "'strava --output week.json details --previous-week'.",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=positive_int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help="Maximum number of in-flight API requests.",
+    )
+    parser.add_argument(
+        "--output", help="Write the result to this file instead of stdout."
+    )
+
+    date_range = argparse.ArgumentParser(add_help=False)
+    date_range.add_argument("--after", type=parse_date, help="Start date YYYY-MM-DD")
+    date_range.add_argument("--before", type=parse_date, help="End date YYYY-MM-DD")
+    date_range.add_argument(
+        "--weeks-back",
+        type=non_negative_int,
+        help="Whole weeks before the current one.",
+    )
+    date_range.add_argument(
+        "--previous-week", action="store_true", help="Use last week's range."
+    )
+
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", parents=[date_range], help="List activities.")
+    commands.add_parser("details", parents=[date_range], help="Activity details.")
+    commands.add_parser(
+        "sync", parents=[date_range], help="Update the local activity store."
+    )
+
+    streams = commands.add_parser("streams", help="Streams of given activities.")
+    streams.add_argument("activity_ids", type=int, nargs="+")
+
+    zones = commands.add_parser("zones", help="Heart rate zones of an activity.")
+    zones.add_argument("activity_id", type=int)
+    zones.add_argument("--save", action="store_true", help="Save them as JSON.")
+
+    export = commands.add_parser(
+        "export", parents=[date_range], help="Export streams to files."
+    )
+    export.add_argument(
+        "--format",
+        default="csv",
+        choices=["csv", "parquet", "feather"],
+        dest="selected_format",
+    )
+    export.add_argument("--output-dir", default=".")
+    layout = export.add_mutually_exclusive_group()
+    layout.add_argument(
+        "--partitioned",
+        action="store_true",
+        help="Write year=/week=/activity_id= partitions.",
+    )
+    layout.add_argument(
+        "--chunked",
+        action="store_true",
+        help="Append activities to a CSV file as they arrive.",
+    )
+    return parser
+
+
+def run(argv: Sequence[str], service_factory: ServiceFactory) -> int:
+    """Run one batch command and return the process exit code."""
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return EXIT_OK if e.code == 0 else EXIT_USAGE
+
+    if args.command == "export" and args.chunked and args.selected_format != "csv":
+        parser.print_usage(sys.stderr)
+        print("strava: error: --chunked only supports csv", file=sys.stderr)
+        return EXIT_USAGE
+
+    try:
+        service = service_factory(args.max_concurrency)
+        result = asyncio.run(_run_command(service, args))
+    except Exception as e:
+        print(f"strava: error: {e}", file=sys.stderr)
+        return EXIT_FAILURE
+
+    if args.output is None:
+        _write_result(result, sys.stdout)
+    else:
+        with open(args.output, "w", newline="") as output:
+            _write_result(result, output)
+    return EXIT_OK
+
+
+async def _run_command(service: "StravaService", args: argparse.Namespace) -> Any:
+    async with service:
+        return await _command(service, args)
+
+
+def _command(
+    service: "StravaService", args: argparse.Namespace
+) -> Coroutine[Any, Any, Any]:
+    if args.command == "streams":
+        return service.get_streams_for_multiple_activities(args.activity_ids)
+    if args.command == "zones":
+        return service.get_activity_zones(args.activity_id, save_zones=args.save)
+
+    date_range: Dict[str, Any] = {
+        "previous_week": args.previous_week,
+        "after": args.after,
+        "before": args.before,
+        "weeks_back": args.weeks_back,
+    }
+    if args.command == "list":
+        return service.get_activity_range(**date_range)
+    if args.command == "details":
+        return service.get_activity_details(**date_range)
+    if args.command == "sync":
+        return _sync_summary(service, date_range)
+
+    if args.partitioned:
+        return service.export_streams_partitioned(
+            selected_format=args.selected_format,
+            output_dir=args.output_dir,
+            **date_range,
+        )
+    if args.chunked:
+        return service.export_streams_chunked(output_dir=args.output_dir, **date_range)
+    return _export_summary(service, args, date_range)
+
+
+async def _export_summary(
+    service: "StravaService", args: argparse.Namespace, date_range: Dict[str, Any]
+) -> Dict[str, Any]:
+    df = await service.export_streams_for_selected_week(
+        selected_format=args.selected_format,
+        output_dir=args.output_dir,
+        **date_range,
+    )
+    return {"activities": int(df["id"].nunique()) if "id" in df else 0, "rows": len(df)}
+
+
+async def _sync_summary(
+    service: "StravaService", date_range: Dict[str, Any]
+) -> Dict[str, Any]:
+    activities = await service.sync_activities(**date_range)
+    return {"activities": len(activities)}
+
+
+def _write_result(result: Any, output: TextIO) -> None:
+    # Commands returning DataFrames have already imported pandas.
+    pandas = sys.modules.get("pandas")
+    if pandas is not None and isinstance(result, pandas.DataFrame):
+        result.to_csv(output, index=False)
+    else:
+        json.dump(result, output, indent=2, default=str)
+        output.write("\n")
+    output.flush()
@@ -1,7 +1,8 @@
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Dict, Optional, Self, cast
 
 from src.presentation.console_output.console_error_handler import (
     ConsoleErrorHandler,
@@ -10,13 +11,15 @@ from src.presentation.console_output.result_console_printer import (
     ResultConsolePrinter,
 )
 from src.presentation.menu.options import MenuOption
-from src.strava_service import StravaService
 from src.utils import constants as constant
 
+if TYPE_CHECKING:
+    from src.strava_service import StravaService
+
 
 @dataclass
 class MenuDependencies:
-    service: StravaService
+    service: Optional["StravaService"]
     result_printer: ResultConsolePrinter
     error_printer: ConsoleErrorHandler
 
@@ -24,65 +27,110 @@ class MenuDependencies:
 class MenuHandler:
     def __init__(
         self,
-        service: StravaService,
+        service: Optional["StravaService"] = None,
         result_console_printer: Optional[ResultConsolePrinter] = None,
         error_console_printer: Optional[ConsoleErrorHandler] = None,
+        runner: Optional[asyncio.Runner] = None,
+        service_factory: Optional[Callable[[], "StravaService"]] = None,
     ) -> None:
+        if service is None and service_factory is None:
+            raise ValueError("Either a service or a service factory is required.")
+        # The factory defers building the service (and importing the API,
+        # pandas and Supabase stacks) until the first command runs.
+        self._service_factory = service_factory
         self.dependencies = MenuDependencies(
             service=service,
             result_printer=result_console_printer or ResultConsolePrinter(),
             error_printer=error_console_printer or ConsoleErrorHandler(),
         )
+        # One event loop for the whole menu, so the HTTP session, caches and
+        # limiters bound to it survive between commands.
+        self._runner = runner or asyncio.Runner()
+        self._session_open = False
         self._init_menu_options()
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def service(self) -> "StravaService":
+        if self.dependencies.service is None and self._service_factory is not None:
+            self.dependencies.service = self._service_factory()
+        return cast("StravaService", self.dependencies.service)
+
+    def open(self) -> None:
+        """Open the service session on the menu event loop."""
+        if not self._session_open:
+            self._runner.run(self.service.__aenter__())
+            self._session_open = True
+
+    def close(self) -> None:
+        """Close the service session and the menu event loop."""
+        try:
+            if self._session_open:
+                self._runner.run(self.service.__aexit__(None, None, None))
+        finally:
+            self._session_open = False
+            self._runner.close()
+
     def _init_menu_options(self) -> None:
         self.menu_options: Dict[MenuOption, Callable[[], Any]] = {
             MenuOption.ACTIVITY_DETAILS: lambda: self._handle_async(
-                self.dependencies.service.get_activity_details, False
+                self.service.get_activity_details, False
             ),
             MenuOption.ACTIVITY_DETAILS_PREV_WEEK: lambda: self._handle_async(
-                self.dependencies.service.get_activity_details, True
+                self.service.get_activity_details, True
             ),
             MenuOption.ACTIVITY_RANGE: lambda: self._handle_async(
-                self.dependencies.service.get_activity_range, False
+                self.service.get_activity_range, False
             ),
             MenuOption.ACTIVITY_RANGE_PREV_WEEK: lambda: self._handle_async(
-                self.dependencies.service.get_activity_range, True
+                self.service.get_activity_range, True
             ),
             MenuOption.SINGLE_STREAM: self._handle_single_stream,
             MenuOption.MULTIPLE_STREAMS: self._handle_multiple_streams,
             MenuOption.STREAMS_CURRENT_WEEK: lambda: self._handle_async(
-                self.dependencies.service.export_streams_for_selected_week,
+                self.service.export_streams_for_selected_week,
                 False,
             ),
             MenuOption.STREAMS_PREV_WEEK: lambda: self._handle_async(
-                self.dependencies.service.export_streams_for_selected_week, True
+                self.service.export_streams_for_selected_week, True
             ),
         }
 
     def _provisional_handle_feature(self) -> Any:
         return "This feature is not yet implemented."
 
+    def _run_in_session(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        self.open()
+        return self._runner.run(coro)
+
     def _handle_async(self, func: Callable, previous_week: bool | None = None) -> Any:
-        return asyncio.run(func(previous_week=previous_week))
+        return self._run_in_session(func(previous_week=previous_week))
 
     def _handle_single_stream(self) -> Any:
-        return asyncio.run(
-            self.dependencies.service.get_streams_for_activity(
+        return self._run_in_session(
+            self.service.get_streams_for_activity(
                 activity_id=constant.EXAMPLE_ID_ONE_ACTIVITY
             )
         )
 
     def _handle_weekly_streams(self, previous_week: bool) -> Any:
-        return asyncio.run(
-            self.dependencies.service.export_streams_for_selected_week(
-                previous_week=previous_week
-            )
+        return self._run_in_session(
+            self.service.export_streams_for_selected_week(previous_week=previous_week)
         )
 
     def _handle_multiple_streams(self) -> Any:
-        return asyncio.run(
-            self.dependencies.service.get_streams_for_multiple_activities(
+        return self._run_in_session(
+            self.service.get_streams_for_multiple_activities(
                 activity_ids=constant.EXAMPLE_ID_ACTIVITIES
             )
         )
@@ -1,22 +1,26 @@
-from typing import Any, Dict, List
-
-import pandas as pd
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from src.interfaces.console_printer import IPrinterResult
 
 from .formatter import ActivityFormatter
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class ResultConsolePrinter(IPrinterResult):
     def __init__(self) -> None:
         self.formatter = ActivityFormatter()
 
     def print_result(
-        self, option: str, result: Dict | List | pd.DataFrame | None
+        self, option: str, result: "Dict | List | pd.DataFrame | None"
     ) -> None:
         print(f"\n✅ Result for option {option}:\n")
 
-        if isinstance(result, pd.DataFrame):
+        # A DataFrame can only exist once pandas has been imported.
+        pandas = sys.modules.get("pandas")
+        if pandas is not None and isinstance(result, pandas.DataFrame):
             self._print_dataframe(result)
         elif isinstance(result, list):
             self._print_activities_list(result)
@@ -45,7 +49,9 @@ class ResultConsolePrinter(IPrinterResult):
                 self._print_activity_dict(item, indent)
                 print(f"\n{'  ' * indent}━━━━━━━━━━━━━━\n")
 
-    def _print_dataframe(self, df: pd.DataFrame) -> None:
+    def _print_dataframe(self, df: "pd.DataFrame") -> None:
+        import pandas as pd
+
         pd.set_option("display.max_columns", None)
         pd.set_option("display.expand_frame_repr", False)
         pd.set_option("display.float_format", lambda x: f"{x:.2f}")
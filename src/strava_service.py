@@ -1,4 +1,6 @@
-from typing import Any, Dict, List
+import os
+from types import TracebackType
+from typing import Any, Dict, List, Self
 
 import pandas as pd
 
@@ -7,7 +9,11 @@ from src.core.activities.zones import ActivityZones
 from src.core.streams.exporter import DataExporter
 from src.core.streams.manager import StreamManager
 from src.infrastructure.api_clients.async_strava_api import AsyncStravaAPI
+from src.interfaces.database.activity_store import IActivityStore
+from src.interfaces.stream_cache import IStreamCache
 from src.interfaces.stream_exporter import IStreamExporter
+from src.utils import constants as constant
+from src.utils import helpers as helper
 
 
 class StravaService:
@@ -15,21 +21,69 @@ class StravaService:
         self,
         api_async: AsyncStravaAPI,
         exporter_map: Dict[str, IStreamExporter] | None = None,
+        activity_store: IActivityStore | None = None,
+        stream_cache: IStreamCache | None = None,
+        compact_dtypes: bool = False,
     ):
         self.api_async = api_async
-        self.activity_manager = ActivityService(api_async)
-        self.stream_manager = StreamManager(api_async)
+        self.activity_manager = ActivityService(api_async, activity_store)
+        self.stream_manager = StreamManager(
+            api_async, stream_cache=stream_cache, compact_dtypes=compact_dtypes
+        )
         self.data_exporter = DataExporter(exporter_map)
 
-    async def get_activity_range(self, previous_week: bool = False) -> Any:
+    async def __aenter__(self) -> Self:
+        """Open the pooled HTTP session shared by every request of the service."""
+        await self.api_async.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.api_async.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def get_activity_range(
+        self,
+        previous_week: bool = False,
+        after: int | None = None,
+        before: int | None = None,
+        weeks_back: int | None = None,
+    ) -> Any:
         """Get activity data for a specific date range."""
-        return await self.activity_manager.get_activity_range(previous_week)
+        return await self.activity_manager.get_activity_range(
+            previous_week, after=after, before=before, weeks_back=weeks_back
+        )
 
     async def get_activity_details(
-        self, previous_week: bool = False
+        self,
+        previous_week: bool = False,
+        after: int | None = None,
+        before: int | None = None,
+        weeks_back: int | None = None,
     ) -> List[Dict[Any, Any]]:
         """Get detailed activity information."""
-        return await self.activity_manager.get_activity_details(previous_week)
+        return await self.activity_manager.get_activity_details(
+            previous_week, after=after, before=before, weeks_back=weeks_back
+        )
+
+    async def sync_activities(
+        self,
+        previous_week: bool = False,
+        after: int | None = None,
+        before: int | None = None,
+        weeks_back: int | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Bring the local activity store up to date for a date range."""
+        start, end = helper.resolve_epoch_range(
+            previous_week=previous_week,
+            after=after,
+            before=before,
+            weeks_back=weeks_back,
+        )
+        return await self.activity_manager.sync_activities(start, end)
 
     async def get_streams_for_activity(self, activity_id: int) -> pd.DataFrame:
         """Get stream data for a specific activity."""
@@ -48,17 +102,94 @@ class StravaService:
         selected_format: str = "csv",
         output_dir: str = ".",
         previous_week: bool = False,
+        after: int | None = None,
+        before: int | None = None,
+        weeks_back: int | None = None,
     ) -> pd.DataFrame:
-        """Export stream data for activities in the selected week."""
-        df = await self.stream_manager.get_weekly_streams(previous_week=previous_week)
+        """Export stream data for activities in the selected week or date range."""
+        custom_range = any(bound is not None for bound in (after, before, weeks_back))
+        date_range = helper.resolve_epoch_range(
+            previous_week=previous_week,
+            after=after,
+            before=before,
+            weeks_back=weeks_back,
+        )
+        df = await self.stream_manager.get_streams_for_range(*date_range)
         self.data_exporter.export_streams(
             df,
             selected_format=selected_format,
             output_dir=output_dir,
             previous_week=previous_week,
+            date_range=date_range if custom_range else None,
         )
         return df
 
+    async def export_streams_chunked(
+        self,
+        output_dir: str = ".",
+        previous_week: bool = False,
+        after: int | None = None,
+        before: int | None = None,
+        weeks_back: int | None = None,
+    ) -> Dict[str, Any]:
+        """Stream activities into a CSV file without building the full frame."""
+        custom_range = any(bound is not None for bound in (after, before, weeks_back))
+        date_range = helper.resolve_epoch_range(
+            previous_week=previous_week,
+            after=after,
+            before=before,
+            weeks_back=weeks_back,
+        )
+        return await self.data_exporter.export_streams_chunked(
+            self.stream_manager.iter_streams_for_range(*date_range),
+            output_dir=output_dir,
+            previous_week=previous_week,
+            date_range=date_range if custom_range else None,
+            columns=[*constant.ACTIVITY_STREAMS_KEYS, "id"],
+        )
+
+    async def export_streams_partitioned(
+        self,
+        selected_format: str = "parquet",
+        output_dir: str = ".",
+        previous_week: bool = False,
+        after: int | None = None,
+        before: int | None = None,
+        weeks_back: int | None = None,
+    ) -> List[str]:
+        """Export streams as year=/week=/activity_id= partitions.
+
+        Only activities without a partition on disk are fetched and written.
+        """
+        self.data_exporter.get_exporter(selected_format.lower())
+        activities = await self.activity_manager.get_activity_range(
+            previous_week, after=after, before=before, weeks_back=weeks_back
+        )
+        start_dates = {
+            activity["id"]: activity["start_date_local"]
+            for activity in activities
+            if not os.path.exists(
+                self.data_exporter.partition_path(
+                    output_dir,
+                    activity["id"],
+                    activity["start_date_local"],
+                    selected_format,
+                )
+            )
+        }
+        if not start_dates:
+            return []
+
+        df = await self.stream_manager.get_streams_for_multiple_activities(
+            list(start_dates)
+        )
+        return self.data_exporter.export_partitions(
+            df,
+            start_dates,
+            selected_format=selected_format,
+            output_dir=output_dir,
+        )
+
     async def get_activity_zones(
         self, activity_id: int, save_zones: bool = False
     ) -> Dict[str, int]:
@@ -37,3 +37,16 @@ EXAMPLE_ID_ACTIVITIES = [
 
 URL_GET_ACCESS_TOKEN = "https://www.strava.com/oauth/token"
 OAUTH_URL = "https://www.strava.com/oauth/authorize"
+
+ACTIVITY_STORE_PATH = "strava_activities.sqlite3"
+# Strava filters "after" on start_date, so activities uploaded late land
+# behind the sync watermark; re-request this much before it on every sync.
+SYNC_LOOKBACK_SECONDS = 2 * 24 * 60 * 60
+STREAM_CACHE_DIR = ".stream_cache"
+STREAM_CACHE_MAX_BYTES = 512 * 1024 * 1024
+TOKEN_CACHE_PATH = ".strava_token_cache.json"
+TOKEN_EXPIRY_MARGIN_SECONDS = 5 * 60
+TOKEN_REFRESH_RETRY_SECONDS = 60
+TOKEN_REFRESH_COOLDOWN_SECONDS = 60
+# Plaintext copy of expires_at so expired tokens can be filtered server-side.
+TOKEN_EXPIRES_AT_COLUMN = "expires_at_epoch"
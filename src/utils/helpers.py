@@ -2,7 +2,18 @@ import functools
 import os
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Tuple
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
 
 
 def func_time_execution(func: Callable) -> Callable:
@@ -20,6 +31,16 @@ def func_time_execution(func: Callable) -> Callable:
     return wrapper
 
 
+async def as_async_iterable(items: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    """Iterate plain and async iterables through the same ``async for``."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
 def check_path(path: str) -> bool:
     """Check if a path exists."""
     return os.path.exists(path)
@@ -39,3 +60,50 @@ def get_week_epoch_range(previous_week: bool = False) -> Tuple[int, int]:
     sunday = monday + timedelta(days=7)
 
     return int(monday.timestamp()), int(sunday.timestamp())
+
+
+def get_weeks_back_epoch_range(weeks_back: int) -> Tuple[int, int]:
+    """Get epoch range covering the current week and the ``weeks_back`` before."""
+    if weeks_back < 0:
+        raise ValueError("weeks_back must be zero or positive.")
+
+    monday, sunday = get_week_epoch_range()
+    return monday - weeks_back * 7 * 24 * 60 * 60, sunday
+
+
+def resolve_epoch_range(
+    previous_week: bool = False,
+    after: int | None = None,
+    before: int | None = None,
+    weeks_back: int | None = None,
+) -> Tuple[int, int]:
+    """Resolve the epoch range requested by a service call.
+
+    Explicit ``after``/``before`` bounds take precedence over ``weeks_back``,
+    which takes precedence over the current/previous week selection. A missing
+    ``after`` means the start of the epoch and a missing ``before`` means now.
+    """
+    if after is not None or before is not None:
+        start = after if after is not None else 0
+        end = before if before is not None else int(time.time())
+        if start >= end:
+            raise ValueError("The 'after' bound must be earlier than 'before'.")
+        return start, end
+
+    if weeks_back is not None:
+        return get_weeks_back_epoch_range(weeks_back)
+
+    return get_week_epoch_range(previous_week=previous_week)
+
+
+def split_epoch_range(
+    after: int, before: int, window_seconds: int
+) -> List[Tuple[int, int]]:
+    """Split an epoch range into consecutive windows of ``window_seconds``."""
+    if window_seconds <= 0:
+        raise ValueError("window_seconds must be greater than zero.")
+
+    return [
+        (start, min(start + window_seconds, before))
+        for start in range(after, before, window_seconds)
+    ]
@@ -1,8 +1,13 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from src.core.activities.service import ActivityService
+from src.utils import constants as constant
+from src.infrastructure.database.sqlite_activity_store import SqliteActivityStore
 
 
 @pytest.fixture
@@ -55,3 +60,152 @@ class TestActivityService:
         assert len(result) == 2
         assert all(isinstance(activity, dict) for activity in result)
         assert mock_async_api.make_request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_activity_range_custom_bounds(
+        self, activity_service: ActivityService, mock_async_api: Mock
+    ) -> None:
+        mock_async_api.make_request.return_value = [{"id": 1}]
+
+        result = await activity_service.get_activity_range(after=100, before=200)
+
+        assert result == [{"id": 1}]
+        params = mock_async_api.make_request.call_args.kwargs["params"]
+        assert (params["after"], params["before"]) == ("100", "200")
+
+    @pytest.mark.asyncio
+    async def test_get_activity_details_custom_bounds(
+        self, activity_service: ActivityService, mock_async_api: Mock
+    ) -> None:
+        mock_async_api.make_request.side_effect = [
+            [{"id": 1}],
+            {"id": 1, "name": "Activity 1"},
+        ]
+
+        result = await activity_service.get_activity_details(after=100, before=200)
+
+        assert result == [{"id": 1, "name": "Activity 1"}]
+        first_call = mock_async_api.make_request.call_args_list[0]
+        assert first_call.kwargs["params"]["after"] == "100"
+
+
+class TestActivityServiceWithStore:
+    AFTER = 1704067200  # 2024-01-01
+    BEFORE = 1704672000  # 2024-01-08
+
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> SqliteActivityStore:
+        return SqliteActivityStore(str(tmp_path / "activities.sqlite3"))
+
+    @staticmethod
+    def _api(details: Dict[int, Dict[str, Any]]) -> Mock:
+        async def make_request(endpoint: str, params: Any = None) -> Any:
+            if endpoint == "/athlete":
+                return {"id": 99}
+            if endpoint == "/activities":
+                # Like Strava, match the window against start_date.
+                return [
+                    {"id": activity_id}
+                    for activity_id, activity in details.items()
+                    if "start_date" not in activity
+                    or int(params["after"])
+                    < datetime.fromisoformat(activity["start_date"]).timestamp()
+                    < int(params["before"])
+                ]
+            activity = details[int(endpoint.rsplit("/", 1)[1])]
+            if not activity:
+                raise Exception("Server error")
+            return activity
+
+        api = Mock()
+        api.make_request = AsyncMock(side_effect=make_request)
+        return api
+
+    @pytest.mark.asyncio
+    async def test_second_sync_is_served_from_store(
+        self, store: SqliteActivityStore
+    ) -> None:
+        details = {
+            1: {"id": 1, "name": "Run", "start_date": "2024-01-02T08:00:00Z"},
+            2: {"id": 2, "name": "Ride", "start_date": "2024-01-03T08:00:00Z"},
+        }
+        first = await ActivityService(self._api(details), store).get_activity_details(
+            after=self.AFTER, before=self.BEFORE
+        )
+
+        api = self._api(details)
+        second = await ActivityService(api, store).get_activity_details(
+            after=self.AFTER, before=self.BEFORE
+        )
+
+        assert (
+            first
+            == second
+            == [
+                {"id": 1, "name": "Run"},
+                {"id": 2, "name": "Ride"},
+            ]
+        )
+        api.make_request.assert_awaited_once_with("/athlete")
+        assert store.get_synced_range(99) == (self.AFTER, self.BEFORE)
+
+    @pytest.mark.asyncio
+    async def test_only_missing_range_is_requested(
+        self, store: SqliteActivityStore
+    ) -> None:
+        store.update_synced_range(99, self.AFTER, self.BEFORE - 86400)
+        api = self._api(
+            {7: {"id": 7, "name": "Swim", "start_date": "2024-01-07T08:00:00Z"}}
+        )
+
+        result = await ActivityService(api, store).get_activity_details(
+            after=self.AFTER, before=self.BEFORE
+        )
+
+        assert result == [{"id": 7, "name": "Swim"}]
+        params = api.make_request.call_args_list[1].kwargs["params"]
+        assert (params["after"], params["before"]) == (
+            str(self.BEFORE - 86400 - constant.SYNC_LOOKBACK_SECONDS),
+            str(self.BEFORE),
+        )
+        assert store.get_synced_range(99) == (self.AFTER, self.BEFORE)
+
+    @pytest.mark.asyncio
+    async def test_late_upload_behind_watermark_is_synced(
+        self, store: SqliteActivityStore
+    ) -> None:
+        # Synced up to Jan 7; a run from Jan 6 was only uploaded afterwards.
+        store.update_synced_range(99, self.AFTER, self.BEFORE - 86400)
+        api = self._api(
+            {
+                5: {"id": 5, "name": "Late run", "start_date": "2024-01-06T08:00:00Z"},
+                7: {"id": 7, "name": "Swim", "start_date": "2024-01-07T08:00:00Z"},
+            }
+        )
+
+        result = await ActivityService(api, store).get_activity_details(
+            after=self.AFTER, before=self.BEFORE
+        )
+
+        assert result == [
+            {"id": 5, "name": "Late run"},
+            {"id": 7, "name": "Swim"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_detail_keeps_watermark(
+        self, store: SqliteActivityStore
+    ) -> None:
+        api = self._api(
+            {
+                1: {"id": 1, "name": "Run", "start_date": "2024-01-02T08:00:00Z"},
+                2: {},
+            }
+        )
+
+        result = await ActivityService(api, store).get_activity_details(
+            after=self.AFTER, before=self.BEFORE
+        )
+
+        assert result == [{"id": 1, "name": "Run"}]
+        assert store.get_synced_range(99) is None
@@ -1,8 +1,8 @@
-from typing import Any
+from typing import Any, AsyncIterator, Dict
 
 import pytest
 
-from src.core.activities.utils import get_activity_ids
+from src.core.activities.utils import get_activity_ids, iter_activity_ids
 
 
 class TestActivityUtils:
@@ -26,3 +26,12 @@ class TestActivityUtils:
         activities: list[dict[str, Any]] = [{"name": "Activity 1"}, {"id": 2}]
         with pytest.raises(KeyError):
             await get_activity_ids(activities)
+
+    @pytest.mark.asyncio
+    async def test_iter_activity_ids(self) -> None:
+        async def activities() -> AsyncIterator[Dict[str, Any]]:
+            for activity_id in (1, 2, 3):
+                yield {"id": activity_id}
+
+        result = [activity_id async for activity_id in iter_activity_ids(activities())]
+        assert result == [1, 2, 3]
@@ -1,11 +1,16 @@
 import os
 import tempfile
+from pathlib import Path
+from typing import AsyncIterator
 
 import pandas as pd
 import pytest
 
 from src.core.streams.exporter import CsvExporter, DataExporter
+from src.core.streams.feather_exporter import FeatherExporter
+from src.core.streams.parquet_exporter import ParquetExporter
 from src.interfaces.stream_exporter import IStreamExporter
+from src.utils.helpers import as_async_iterable
 
 
 class MockExporter(IStreamExporter):
@@ -48,11 +53,39 @@ class TestStreamExporters:
             result_df = pd.read_csv(path)
             pd.testing.assert_frame_equal(result_df, sample_df)
 
+    def test_parquet_exporter(self, sample_df: pd.DataFrame) -> None:
+        pq = pytest.importorskip("pyarrow.parquet")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = f"{tmp_dir}/test.parquet"
+
+            ParquetExporter(compression="snappy", row_group_size=2).export(
+                sample_df, path
+            )
+
+            result_df = pd.read_parquet(path)
+            pd.testing.assert_frame_equal(result_df, sample_df)
+            metadata = pq.ParquetFile(path).metadata
+            assert metadata.num_row_groups == 2
+            assert metadata.row_group(0).column(0).compression == "SNAPPY"
+
+    def test_feather_exporter_keeps_dtypes(self, sample_df: pd.DataFrame) -> None:
+        pytest.importorskip("pyarrow")
+        compact_df = sample_df.astype({"time": "uint32", "id": "category"})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = f"{tmp_dir}/test.feather"
+
+            FeatherExporter().export(compact_df, path)
+
+            result_df = pd.read_feather(path)
+            pd.testing.assert_frame_equal(result_df, compact_df)
+
 
 class TestDataExporter:
     def test_default_initialization(self, data_exporter: DataExporter) -> None:
         assert "csv" in data_exporter.exporter
         assert isinstance(data_exporter.exporter["csv"], CsvExporter)
+        assert isinstance(data_exporter.exporter["parquet"], ParquetExporter)
+        assert isinstance(data_exporter.exporter["feather"], FeatherExporter)
 
     def test_custom_exporter_initialization(self) -> None:
         mock_exporter = MockExporter()
@@ -67,6 +100,72 @@ class TestDataExporter:
         path = data_exporter._create_path("test_dir", False, "csv")
         assert path == "test_dir/streams_current_week.csv"
 
+    def test_create_path_date_range(self, data_exporter: DataExporter) -> None:
+        # 2024-01-01 and 2024-02-01 at 00:00 UTC
+        path = data_exporter._create_path(
+            "test_dir", False, "csv", date_range=(1704067200, 1706745600)
+        )
+        assert path == "test_dir/streams_2024-01-01_2024-02-01.csv"
+
+    @pytest.mark.asyncio
+    async def test_export_streams_chunked(
+        self, data_exporter: DataExporter, tmp_path: Path
+    ) -> None:
+        async def frames() -> AsyncIterator[pd.DataFrame]:
+            yield pd.DataFrame({"time": [0, 1], "heartrate": [60, 61], "id": [1, 1]})
+            yield pd.DataFrame({"heartrate": [70], "time": [0], "id": [2]})
+            yield pd.DataFrame({"time": [0], "id": [3]})
+
+        summary = await data_exporter.export_streams_chunked(
+            frames(), output_dir=str(tmp_path), columns=["time", "heartrate", "id"]
+        )
+
+        assert summary == {
+            "path": f"{tmp_path}/streams_current_week.csv",
+            "activities": 3,
+            "rows": 4,
+        }
+        result = pd.read_csv(summary["path"])
+        assert list(result.columns) == ["time", "heartrate", "id"]
+        assert result["id"].tolist() == [1, 1, 2, 3]
+        assert result["heartrate"].isna().tolist() == [False, False, False, True]
+
+    @pytest.mark.asyncio
+    async def test_export_streams_chunked_without_frames(
+        self, data_exporter: DataExporter, tmp_path: Path
+    ) -> None:
+        summary = await data_exporter.export_streams_chunked(
+            as_async_iterable([]), output_dir=str(tmp_path), columns=["time", "id"]
+        )
+
+        assert summary["activities"] == 0
+        assert Path(summary["path"]).read_text() == "time,id\n"
+
+    def test_partition_path(self, data_exporter: DataExporter) -> None:
+        path = data_exporter.partition_path("out", 7, "2024-12-30T07:00:00Z", "PARQUET")
+        # 2024-12-30 belongs to ISO week 1 of 2025
+        assert path == "out/year=2025/week=01/activity_id=7/streams.parquet"
+
+    def test_export_partitions_skips_unknown_and_existing(
+        self, data_exporter: DataExporter, tmp_path: Path
+    ) -> None:
+        df = pd.DataFrame({"time": [0, 1, 0, 0], "id": [1, 1, 2, 3]})
+        start_dates = {1: "2024-01-02T08:00:00Z", 2: "2024-01-03T08:00:00Z"}
+        existing = data_exporter.partition_path(str(tmp_path), 2, start_dates[2], "csv")
+        os.makedirs(os.path.dirname(existing))
+        Path(existing).write_text("time,id\n")
+
+        written = data_exporter.export_partitions(
+            df, start_dates, selected_format="csv", output_dir=str(tmp_path)
+        )
+
+        assert written == [
+            data_exporter.partition_path(str(tmp_path), 1, start_dates[1], "csv")
+        ]
+        assert pd.read_csv(written[0])["time"].tolist() == [0, 1]
+        assert Path(existing).read_text() == "time,id\n"
+        assert not list(tmp_path.rglob("*.tmp"))
+
     def test_export_streams_invalid_format(
         self, data_exporter: DataExporter, sample_df: pd.DataFrame
     ) -> None:
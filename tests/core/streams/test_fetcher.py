@@ -1,10 +1,14 @@
-from typing import Dict, List
-from unittest.mock import AsyncMock, Mock
+import asyncio
+import weakref
+from pathlib import Path
+from typing import AsyncIterator, Dict, List
+from unittest.mock import AsyncMock, Mock, patch
 
 import pandas as pd
 import pytest
 
 from src.core.streams.fetcher import ActivityStreamsFetcher
+from src.infrastructure.cache.npz_stream_cache import NpzStreamCache
 from src.utils import constants as constant
 from src.utils import exceptions
 
@@ -69,6 +73,23 @@ class TestActivityStreamsFetcher:
                 stream_keys=constant.ACTIVITY_STREAMS_KEYS
             )
 
+    @pytest.mark.asyncio
+    async def test_fetch_activity_data_uses_stream_cache(
+        self, mock_async_api: Mock, tmp_path: Path
+    ) -> None:
+        cache = NpzStreamCache(str(tmp_path))
+        mock_async_api.make_request.return_value = STREAM_RESPONSES[0]
+
+        results = [
+            await ActivityStreamsFetcher(
+                api=mock_async_api, id_activity=123, stream_cache=cache
+            ).fetch_activity_data(stream_keys=constant.ACTIVITY_STREAMS_KEYS)
+            for _ in range(2)
+        ]
+
+        pd.testing.assert_frame_equal(results[0], results[1])
+        assert mock_async_api.make_request.call_count == 1
+
     @pytest.mark.parametrize("stream_response", STREAM_RESPONSES)
     @pytest.mark.asyncio
     async def test_fetch_multiple_activities_streams(
@@ -110,3 +131,83 @@ class TestActivityStreamsFetcher:
 
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 3  # Only data from successful request
+
+    @pytest.mark.asyncio
+    async def test_iter_multiple_activities_streams_skips_failures(
+        self, mock_async_api: Mock
+    ) -> None:
+        mock_async_api.make_request.side_effect = [
+            STREAM_RESPONSES[0],
+            exceptions.TooManyRequestError("Rate limit exceeded"),
+            STREAM_RESPONSES[1],
+        ]
+
+        frames = [
+            df
+            async for df in ActivityStreamsFetcher.iter_multiple_activities_streams(
+                api=mock_async_api,
+                list_id_activities=[1, 2, 3],
+                stream_keys=constant.ACTIVITY_STREAMS_KEYS,
+            )
+        ]
+
+        assert sorted(df["id"].iloc[0] for df in frames) == [1, 3]
+        assert all(len(df) == 3 for df in frames)
+
+    @pytest.mark.asyncio
+    async def test_iter_multiple_activities_streams_bounds_frames_alive(
+        self, mock_async_api: Mock
+    ) -> None:
+        alive = 0
+        peak = 0
+
+        def release() -> None:
+            nonlocal alive
+            alive -= 1
+
+        async def fetch_activity_data(
+            self: ActivityStreamsFetcher, stream_keys: List[str]
+        ) -> pd.DataFrame:
+            nonlocal alive, peak
+            await asyncio.sleep(0)
+            df = pd.DataFrame({"time": [0, 1, 2], "id": self.id_activity})
+            alive += 1
+            peak = max(peak, alive)
+            weakref.finalize(df, release)
+            return df
+
+        count = 0
+        with patch.object(
+            ActivityStreamsFetcher, "fetch_activity_data", fetch_activity_data
+        ):
+            async for _ in ActivityStreamsFetcher.iter_multiple_activities_streams(
+                api=mock_async_api,
+                list_id_activities=range(50),
+                stream_keys=constant.ACTIVITY_STREAMS_KEYS,
+                max_in_flight=3,
+            ):
+                count += 1
+                # A slow consumer, e.g. a CSV writer.
+                await asyncio.sleep(0.001)
+
+        assert count == 50
+        # The in-flight slots plus the frame the consumer is holding.
+        assert peak <= 4
+
+    @pytest.mark.asyncio
+    async def test_iter_multiple_activities_streams_propagates_listing_error(
+        self, mock_async_api: Mock
+    ) -> None:
+        async def activity_ids() -> AsyncIterator[int]:
+            yield 1
+            raise exceptions.TooManyRequestError("Rate limit exceeded")
+
+        mock_async_api.make_request.return_value = STREAM_RESPONSES[0]
+
+        with pytest.raises(exceptions.TooManyRequestError):
+            async for _ in ActivityStreamsFetcher.iter_multiple_activities_streams(
+                api=mock_async_api,
+                list_id_activities=activity_ids(),
+                stream_keys=constant.ACTIVITY_STREAMS_KEYS,
+            ):
+                pass
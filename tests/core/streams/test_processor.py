@@ -1,6 +1,11 @@
+import numpy as np
 import pandas as pd
 
-from src.core.streams.processor import process_streams
+from src.core.streams.processor import (
+    build_stream_frame,
+    process_streams,
+    stream_columns,
+)
 
 
 class TestStreamProcessor:
@@ -59,3 +64,106 @@ class TestStreamProcessor:
         assert result["distance"].isna().sum() == 2  # Last value should be NaN
         assert result["time"].isna().sum() == 1
         assert result["heartrate"].isna().sum() == 0
+
+    def test_process_streams_does_not_mutate_response(self) -> None:
+        test_data = {
+            "time": {"data": [0, 1, 2]},
+            "distance": {"data": [0, 100]},
+        }
+
+        process_streams(test_data, id_activity=123)
+
+        assert test_data["distance"]["data"] == [0, 100]
+
+    def test_process_streams_keeps_typed_columns(self) -> None:
+        test_data = {
+            "time": {"data": [0, 1, 2]},
+            "distance": {"data": [0.0, 1.5, 3.0]},
+            "heartrate": {"data": [60, 65]},
+        }
+
+        result = process_streams(test_data, id_activity=123)
+
+        assert result["time"].dtype == np.int64
+        assert result["distance"].dtype == np.float64
+        assert result["heartrate"].dtype == np.float64
+        assert result["id"].dtype == np.int64
+
+    def test_process_streams_splits_latlng(self) -> None:
+        test_data = {
+            "time": {"data": [0, 1]},
+            "latlng": {"data": [[40.4, -3.7], [40.5, -3.8]]},
+        }
+
+        result = process_streams(test_data, id_activity=123)
+
+        assert list(result.columns) == ["time", "lat", "lng", "id"]
+        assert result["lat"].tolist() == [40.4, 40.5]
+        assert result["lng"].tolist() == [-3.7, -3.8]
+
+    def test_process_streams_compact_dtypes(self) -> None:
+        test_data = {
+            "time": {"data": [0, 1, 2]},
+            "distance": {"data": [0.0, 1.5, 3.0]},
+            "heartrate": {"data": [60, 65]},
+        }
+
+        result = process_streams(test_data, id_activity=123, compact_dtypes=True)
+
+        assert result["time"].dtype == np.uint32
+        assert result["distance"].dtype == np.float32
+        assert result["heartrate"].dtype == "UInt8"
+        assert result["heartrate"].isna().sum() == 1
+        assert isinstance(result["id"].dtype, pd.CategoricalDtype)
+
+    def test_compact_dtypes_keep_out_of_range_and_fractional_samples(self) -> None:
+        test_data = {
+            "time": {"data": [0, 1]},
+            "heartrate": {"data": [72.6, 300.0]},
+            "watts": {"data": [250, 70000]},
+            "cadence": {"data": [-1, 90]},
+        }
+
+        result = process_streams(test_data, id_activity=123, compact_dtypes=True)
+
+        assert result["time"].dtype == np.uint32
+        assert result["heartrate"].tolist() == [72.6, 300.0]
+        assert result["watts"].tolist() == [250, 70000]
+        assert result["cadence"].tolist() == [-1, 90]
+        assert result["watts"].dtype == np.int64
+
+    def test_build_stream_frame_keeps_compact_schema(self) -> None:
+        activities = [
+            (
+                activity_id,
+                stream_columns(
+                    {"time": {"data": [0, 1]}, "heartrate": {"data": [60, 61]}}
+                ),
+            )
+            for activity_id in (1, 2)
+        ]
+
+        result = build_stream_frame(activities, compact_dtypes=True)
+
+        assert list(result.columns) == ["time", "heartrate", "id"]
+        assert result["time"].dtype == np.uint32
+        assert result["heartrate"].dtype == np.uint8
+        assert list(result["id"].cat.categories) == [1, 2]
+        assert result["id"].tolist() == [1, 1, 2, 2]
+
+    def test_build_stream_frame_fills_missing_columns(self) -> None:
+        activities = [
+            (1, stream_columns({"time": {"data": [0, 1]}})),
+            (2, stream_columns({"heartrate": {"data": [70]}, "time": {"data": [0]}})),
+        ]
+
+        result = build_stream_frame(activities)
+
+        assert list(result.columns) == ["time", "heartrate", "id"]
+        assert result["time"].dtype == np.int64
+        assert result["time"].tolist() == [0, 1, 0]
+        assert result["heartrate"].isna().tolist() == [True, True, False]
+        assert result["id"].tolist() == [1, 1, 2]
+
+    def test_build_stream_frame_without_activities(self) -> None:
+        assert build_stream_frame([]).empty
@@ -0,0 +1,217 @@
+from typing import AsyncIterator
+from unittest.mock import AsyncMock, Mock, patch
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from src.infrastructure.api_clients.async_http_client import AsyncHTTPClient
+from src.infrastructure.api_clients.retry_policy import RetryPolicy
+from src.utils import exceptions
+
+URL = "https://test.api.com/v3/activities/1"
+HEADERS = {"Authorization": "Bearer test"}
+
+
+@pytest.fixture
+def mock_sleep() -> AsyncIterator[AsyncMock]:
+    with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+        yield sleep
+
+
+@pytest.fixture
+def client() -> AsyncHTTPClient:
+    return AsyncHTTPClient(retry_policy=RetryPolicy(max_attempts=3, jitter=False))
+
+
+class TestRetryPolicy:
+    def test_exponential_backoff(self) -> None:
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0, jitter=False)
+        assert [policy.backoff(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+    def test_jitter_stays_within_backoff(self) -> None:
+        policy = RetryPolicy(backoff_base=1.0)
+        assert all(0 <= policy.backoff(3) <= 4 for _ in range(50))
+
+    def test_retry_after_sets_minimum_delay(self) -> None:
+        policy = RetryPolicy(backoff_base=1.0, jitter=False)
+        assert policy.backoff(1, retry_after=10) == 10
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("7", 7.0),
+            (None, None),
+            ("soon", None),
+            ("Wed, 21 Oct 2015 07:28:00 GMT", 0),
+        ],
+    )
+    def test_parse_retry_after(self, value: str | None, expected: float | None) -> None:
+        assert RetryPolicy.parse_retry_after(value) == expected
+
+    def test_invalid_max_attempts(self) -> None:
+        with pytest.raises(ValueError, match="max_attempts"):
+            RetryPolicy(max_attempts=0)
+
+
+class TestAsyncHTTPClientRetries:
+    @pytest.mark.asyncio
+    async def test_retries_server_errors(
+        self, client: AsyncHTTPClient, mock_sleep: AsyncMock
+    ) -> None:
+        with aioresponses() as mocked:
+            mocked.get(URL, status=503)
+            mocked.get(URL, status=502)
+            mocked.get(URL, payload={"id": 1})
+
+            result = await client.make_async_request(URL, HEADERS)
+
+        assert result == {"id": 1}
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_retries_connection_errors(
+        self, client: AsyncHTTPClient, mock_sleep: AsyncMock
+    ) -> None:
+        with aioresponses() as mocked:
+            mocked.get(URL, exception=aiohttp.ServerDisconnectedError())
+            mocked.get(URL, payload={"id": 1})
+
+            result = await client.make_async_request(URL, HEADERS)
+
+        assert result == {"id": 1}
+        assert mock_sleep.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after(
+        self, client: AsyncHTTPClient, mock_sleep: AsyncMock
+    ) -> None:
+        with aioresponses() as mocked:
+            mocked.get(URL, status=429, headers={"Retry-After": "12"})
+            mocked.get(URL, payload={"id": 1})
+
+            result = await client.make_async_request(URL, HEADERS)
+
+        assert result == {"id": 1}
+        mock_sleep.assert_called_once_with(12.0)
+
+    @pytest.mark.asyncio
+    async def test_raises_when_attempts_exhausted(
+        self, client: AsyncHTTPClient, mock_sleep: AsyncMock
+    ) -> None:
+        with aioresponses() as mocked:
+            for _ in range(3):
+                mocked.get(URL, status=500)
+
+            with pytest.raises(aiohttp.ClientResponseError):
+                await client.make_async_request(URL, HEADERS)
+
+        assert mock_sleep.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_after_retries(
+        self, client: AsyncHTTPClient, mock_sleep: AsyncMock
+    ) -> None:
+        with aioresponses() as mocked:
+            for _ in range(3):
+                mocked.get(URL, status=429)
+
+            with pytest.raises(exceptions.TooManyRequestError):
+                await client.make_async_request(URL, HEADERS)
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(
+        self, client: AsyncHTTPClient, mock_sleep: AsyncMock
+    ) -> None:
+        with aioresponses() as mocked:
+            mocked.get(URL, status=404, payload={"message": "Record Not Found"})
+
+            result = await client.make_async_request(URL, HEADERS)
+
+        assert result == {"message": "Record Not Found"}
+        mock_sleep.assert_not_called()
+
+
+class TestAsyncHTTPClientPost:
+    TOKEN_URL = "https://www.strava.com/oauth/token"
+
+    @pytest.mark.asyncio
+    async def test_post_returns_json(self, client: AsyncHTTPClient) -> None:
+        with aioresponses() as mocked:
+            mocked.post(self.TOKEN_URL, payload={"access_token": "new"})
+
+            result = await client.make_async_post(self.TOKEN_URL, data={"a": "b"})
+
+        assert result == {"access_token": "new"}
+
+    @pytest.mark.asyncio
+    async def test_post_skips_rate_limiter(self, client: AsyncHTTPClient) -> None:
+        client.rate_limiter.acquire = AsyncMock()  # type: ignore[method-assign]
+
+        with aioresponses() as mocked:
+            mocked.post(self.TOKEN_URL, payload={})
+            await client.make_async_post(self.TOKEN_URL, data={})
+
+        client.rate_limiter.acquire.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_post_client_error_raises(self, client: AsyncHTTPClient) -> None:
+        with aioresponses() as mocked:
+            mocked.post(self.TOKEN_URL, status=400, payload={"message": "Bad"})
+
+            with pytest.raises(aiohttp.ClientResponseError):
+                await client.make_async_post(self.TOKEN_URL, data={})
+
+
+class TestAsyncHTTPClientUnauthorized:
+    @pytest.mark.asyncio
+    async def test_unauthorized_raises(self, client: AsyncHTTPClient) -> None:
+        with aioresponses() as mocked:
+            mocked.get(URL, status=401)
+
+            with pytest.raises(exceptions.UnauthorizedError):
+                await client.make_async_request(URL, HEADERS)
+
+    @pytest.mark.asyncio
+    async def test_unauthorized_does_not_clean_up_tokens(self) -> None:
+        deleter = Mock()
+        client = AsyncHTTPClient(
+            database_deleter=deleter, table="tokens", encryptor=Mock()
+        )
+
+        with aioresponses() as mocked:
+            mocked.get(URL, status=401)
+            with pytest.raises(exceptions.UnauthorizedError):
+                await client.make_async_request(URL, HEADERS)
+        await client.close()
+
+        deleter.cleanup_expired_tokens.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_runs_once_in_background(self) -> None:
+        deleter = Mock()
+        encryptor = Mock()
+        client = AsyncHTTPClient(
+            database_deleter=deleter, table="tokens", encryptor=encryptor
+        )
+
+        for _ in range(3):
+            client.schedule_token_cleanup()
+        await client.close()
+
+        deleter.cleanup_expired_tokens.assert_called_once_with(
+            table="tokens", encryptor=encryptor
+        )
+
+    @pytest.mark.asyncio
+    async def test_cleanup_failure_is_logged(self) -> None:
+        deleter = Mock()
+        deleter.cleanup_expired_tokens.side_effect = RuntimeError("down")
+        client = AsyncHTTPClient(
+            database_deleter=deleter, table="tokens", encryptor=Mock()
+        )
+
+        client.schedule_token_cleanup()
+        await client.close()
+
+        deleter.cleanup_expired_tokens.assert_called_once()
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.api_clients.concurrency import ConcurrencyLimiter
+from src.infrastructure.api_clients.endpoints import endpoint_template
+
+
+class InFlightCounter:
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+
+    async def run(self, limiter: ConcurrencyLimiter, endpoint: str) -> None:
+        async with limiter.limit(endpoint):
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+            await asyncio.sleep(0)
+            self.current -= 1
+
+
+class TestEndpointTemplate:
+    @pytest.mark.parametrize(
+        "endpoint, expected",
+        [
+            ("/activities", "/activities"),
+            ("/activities/123", "/activities/{id}"),
+            ("/activities/123/streams", "/activities/{id}/streams"),
+            ("/activities/123/zones", "/activities/{id}/zones"),
+        ],
+    )
+    def test_endpoint_template(self, endpoint: str, expected: str) -> None:
+        assert endpoint_template(endpoint) == expected
+
+
+class TestConcurrencyLimiter:
+    @pytest.mark.asyncio
+    async def test_limits_default_pool(self) -> None:
+        limiter = ConcurrencyLimiter(max_concurrency=3)
+        counter = InFlightCounter()
+
+        await asyncio.gather(
+            *(counter.run(limiter, f"/activities/{i}") for i in range(20))
+        )
+
+        assert counter.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_endpoint_override_uses_own_pool(self) -> None:
+        limiter = ConcurrencyLimiter(
+            max_concurrency=5, endpoint_limits={"/activities/{id}/streams": 2}
+        )
+        streams = InFlightCounter()
+        details = InFlightCounter()
+
+        await asyncio.gather(
+            *(streams.run(limiter, f"/activities/{i}/streams") for i in range(10)),
+            *(details.run(limiter, f"/activities/{i}") for i in range(10)),
+        )
+
+        assert streams.peak == 2
+        assert details.peak == 5
+
+    @pytest.mark.parametrize(
+        "max_concurrency, endpoint_limits",
+        [(0, None), (5, {"/activities/{id}/streams": 0})],
+    )
+    def test_invalid_limits(
+        self, max_concurrency: int, endpoint_limits: dict[str, int] | None
+    ) -> None:
+        with pytest.raises(ValueError, match="greater than zero"):
+            ConcurrencyLimiter(
+                max_concurrency=max_concurrency, endpoint_limits=endpoint_limits
+            )
+
+    def test_limiter_survives_new_event_loop(self) -> None:
+        limiter = ConcurrencyLimiter(max_concurrency=1)
+        counter = InFlightCounter()
+
+        async def fan_out() -> None:
+            await asyncio.gather(
+                *(counter.run(limiter, "/activities") for _ in range(3))
+            )
+
+        asyncio.run(fan_out())
+        asyncio.run(fan_out())
+
+        assert counter.peak == 1
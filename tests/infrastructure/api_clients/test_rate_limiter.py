@@ -0,0 +1,143 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.infrastructure.api_clients.rate_limiter import (
+    SHORT_WINDOW_SECONDS,
+    RateLimiter,
+    RateLimitWindow,
+)
+
+# A quarter-hour boundary, so window arithmetic is easy to follow.
+WINDOW_START = 1_700_000_100.0 - 1_700_000_100.0 % SHORT_WINDOW_SECONDS
+
+
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock(WINDOW_START + 60)
+
+
+@pytest.fixture
+def rate_limiter(clock: FakeClock) -> RateLimiter:
+    return RateLimiter(clock=clock)
+
+
+def _headers(limit: str, usage: str) -> dict[str, str]:
+    return {"X-RateLimit-Limit": limit, "X-RateLimit-Usage": usage}
+
+
+class TestRateLimitWindow:
+    def test_unknown_limit_never_blocks(self) -> None:
+        window = RateLimitWindow(period=SHORT_WINDOW_SECONDS)
+        window.consume()
+        assert window.seconds_until_available(WINDOW_START) == 0.0
+
+    def test_sync_never_returns_tokens(self) -> None:
+        window = RateLimitWindow(period=SHORT_WINDOW_SECONDS)
+        window.sync(limit=100, usage=10, now=WINDOW_START)
+        window.sync(limit=100, usage=5, now=WINDOW_START + 1)
+        assert window.tokens == 90
+
+    def test_refills_on_new_window(self) -> None:
+        window = RateLimitWindow(period=SHORT_WINDOW_SECONDS)
+        window.sync(limit=100, usage=100, now=WINDOW_START)
+
+        assert window.seconds_until_available(WINDOW_START + 60) == (
+            SHORT_WINDOW_SECONDS - 60
+        )
+        assert window.seconds_until_available(WINDOW_START + SHORT_WINDOW_SECONDS) == 0
+        assert window.tokens == 100
+
+
+class TestRateLimiter:
+    def test_update_from_headers(self, rate_limiter: RateLimiter) -> None:
+        rate_limiter.update(_headers("200,2000", "20,300"))
+
+        assert rate_limiter.short_window.tokens == 180
+        assert rate_limiter.daily_window.tokens == 1700
+
+    @pytest.mark.parametrize(
+        "headers",
+        [{}, _headers("200", "20"), _headers("abc,2000", "20,300")],
+    )
+    def test_update_ignores_malformed_headers(
+        self, rate_limiter: RateLimiter, headers: dict[str, str]
+    ) -> None:
+        rate_limiter.update(headers)
+
+        assert rate_limiter.short_window.tokens is None
+        assert rate_limiter.daily_window.tokens is None
+
+    @pytest.mark.asyncio
+    async def test_acquire_consumes_tokens(self, rate_limiter: RateLimiter) -> None:
+        rate_limiter.update(_headers("200,2000", "20,300"))
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await rate_limiter.acquire()
+
+        mock_sleep.assert_not_called()
+        assert rate_limiter.short_window.tokens == 179
+        assert rate_limiter.daily_window.tokens == 1699
+
+    @pytest.mark.asyncio
+    async def test_reads_wait_for_the_read_limit(
+        self, rate_limiter: RateLimiter, clock: FakeClock
+    ) -> None:
+        rate_limiter.update(
+            {
+                **_headers("200,2000", "100,300"),
+                "X-ReadRateLimit-Limit": "100,1000",
+                "X-ReadRateLimit-Usage": "100,300",
+            }
+        )
+
+        assert rate_limiter.short_window.tokens == 100
+        assert rate_limiter.read_short_window.tokens == 0
+        assert rate_limiter.read_daily_window.tokens == 700
+
+        async def advance(seconds: float) -> None:
+            clock.now += seconds
+
+        with patch("asyncio.sleep", side_effect=advance) as mock_sleep:
+            await rate_limiter.acquire()
+
+        # The overall budget still had tokens; the read budget decides.
+        mock_sleep.assert_called_once_with(SHORT_WINDOW_SECONDS - 60)
+        assert rate_limiter.read_short_window.tokens == 99
+
+    @pytest.mark.asyncio
+    async def test_non_reads_ignore_the_read_limit(
+        self, rate_limiter: RateLimiter
+    ) -> None:
+        rate_limiter.update(
+            {"X-ReadRateLimit-Limit": "100,1000", "X-ReadRateLimit-Usage": "100,300"}
+        )
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await rate_limiter.acquire(read=False)
+
+        mock_sleep.assert_not_called()
+        assert rate_limiter.read_short_window.tokens == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_short_window_reset(
+        self, rate_limiter: RateLimiter, clock: FakeClock
+    ) -> None:
+        rate_limiter.update(_headers("200,2000", "200,300"))
+
+        async def advance(seconds: float) -> None:
+            clock.now += seconds
+
+        with patch("asyncio.sleep", side_effect=advance) as mock_sleep:
+            await rate_limiter.acquire()
+
+        mock_sleep.assert_called_once_with(SHORT_WINDOW_SECONDS - 60)
+        assert rate_limiter.short_window.tokens == 199
@@ -0,0 +1,78 @@
+import pytest
+
+from src.infrastructure.api_clients.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+class TestResponseCache:
+    def test_streams_are_not_cached_by_default(self, clock: FakeClock) -> None:
+        cache = ResponseCache(clock=clock)
+        cache.set("/activities/1/streams", {"keys": "time"}, {"time": {"data": [0]}})
+
+        assert cache.get("/activities/1/streams", {"keys": "time"}) is None
+        assert len(cache) == 0
+
+    def test_miss_then_hit(self, clock: FakeClock) -> None:
+        cache = ResponseCache(clock=clock)
+
+        assert cache.get("/athlete") is None
+        cache.set("/athlete", None, {"id": 1})
+
+        assert cache.get("/athlete") == {"id": 1}
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        assert cache.stats.hit_rate == 0.5
+
+    def test_params_are_part_of_the_key(self, clock: FakeClock) -> None:
+        cache = ResponseCache(clock=clock)
+        cache.set("/activities", {"page": 1}, [{"id": 1}])
+
+        assert cache.get("/activities", {"page": "1"}) == [{"id": 1}]
+        assert cache.get("/activities", {"page": 2}) is None
+
+    def test_entries_expire_by_endpoint_ttl(self, clock: FakeClock) -> None:
+        cache = ResponseCache(
+            endpoint_ttls={"/activities": 10, "/activities/{id}/streams": None},
+            clock=clock,
+        )
+        cache.set("/activities", None, [{"id": 1}])
+        cache.set("/activities/1/streams", None, {"time": {"data": [0]}})
+
+        clock.now = 11
+
+        assert cache.get("/activities") is None
+        assert cache.get("/activities/1/streams") == {"time": {"data": [0]}}
+        assert len(cache) == 1
+
+    def test_zero_ttl_disables_caching(self, clock: FakeClock) -> None:
+        cache = ResponseCache(endpoint_ttls={}, default_ttl=0, clock=clock)
+        cache.set("/athlete", None, {"id": 1})
+
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self, clock: FakeClock) -> None:
+        cache = ResponseCache(max_entries=2, clock=clock)
+        cache.set("/activities/1", None, {"id": 1})
+        cache.set("/activities/2", None, {"id": 2})
+        cache.get("/activities/1")
+
+        cache.set("/activities/3", None, {"id": 3})
+
+        assert cache.get("/activities/2") is None
+        assert cache.get("/activities/1") == {"id": 1}
+        assert cache.get("/activities/3") == {"id": 3}
+
+    def test_invalid_size_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
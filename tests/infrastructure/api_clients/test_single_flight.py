@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.api_clients.single_flight import SingleFlight, request_key
+
+
+class TestRequestKey:
+    def test_param_order_does_not_matter(self) -> None:
+        assert request_key("/activities", {"page": 1, "per_page": 200}) == (
+            request_key("/activities", {"per_page": "200", "page": "1"})
+        )
+
+    def test_different_params_give_different_keys(self) -> None:
+        assert request_key("/activities", {"page": 1}) != request_key(
+            "/activities", {"page": 2}
+        )
+        assert request_key("/activities", None) == request_key("/activities", {})
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self) -> None:
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def call() -> dict:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return {"id": 1}
+
+        results = await asyncio.gather(
+            *(single_flight.do("key", call) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert results == [{"id": 1}] * 5
+        assert single_flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_cached(self) -> None:
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def call() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await single_flight.do("key", call) == 1
+        assert await single_flight.do("key", call) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared_and_forgotten(self) -> None:
+        single_flight = SingleFlight()
+
+        async def call() -> None:
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            single_flight.do("key", call),
+            single_flight.do("key", call),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert single_flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_caller_keeps_the_shared_call(self) -> None:
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def call() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(single_flight.do("key", call))
+        second = asyncio.create_task(single_flight.do("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
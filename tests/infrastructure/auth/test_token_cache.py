@@ -0,0 +1,67 @@
+import os
+from pathlib import Path
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.infrastructure.auth.token_cache import LocalTokenCache
+from src.infrastructure.encryption.encryptor import FernetEncryptor
+
+NOW = 1_700_000_000
+
+
+@pytest.fixture
+def encryptor() -> FernetEncryptor:
+    return FernetEncryptor(cipher=Fernet(Fernet.generate_key()))
+
+
+@pytest.fixture
+def cache(tmp_path: Path, encryptor: FernetEncryptor) -> LocalTokenCache:
+    return LocalTokenCache(
+        path=str(tmp_path / "token.json"),
+        encryptor=encryptor,
+        expiry_margin=300,
+        clock=lambda: NOW,
+    )
+
+
+class TestLocalTokenCache:
+    def test_missing_cache_returns_none(self, cache: LocalTokenCache) -> None:
+        assert cache.get() is None
+
+    def test_valid_token_is_served(self, cache: LocalTokenCache) -> None:
+        cache.set("token", expires_at=NOW + 3600)
+
+        assert cache.get() == "token"
+
+    def test_token_is_encrypted_and_private(self, cache: LocalTokenCache) -> None:
+        cache.set("secret-token", expires_at=NOW + 3600)
+
+        assert "secret-token" not in Path(cache.path).read_text()
+        assert os.stat(cache.path).st_mode & 0o777 == 0o600
+
+    def test_token_inside_expiry_margin_is_ignored(
+        self, cache: LocalTokenCache
+    ) -> None:
+        cache.set("token", expires_at=NOW + 299)
+
+        assert cache.get() is None
+
+    def test_cache_from_another_key_is_ignored(
+        self, cache: LocalTokenCache, tmp_path: Path
+    ) -> None:
+        cache.set("token", expires_at=NOW + 3600)
+        other = LocalTokenCache(
+            path=cache.path,
+            encryptor=FernetEncryptor(cipher=Fernet(Fernet.generate_key())),
+            clock=lambda: NOW,
+        )
+
+        assert other.get() is None
+
+    def test_clear_removes_the_cache(self, cache: LocalTokenCache) -> None:
+        cache.set("token", expires_at=NOW + 3600)
+        cache.clear()
+        cache.clear()
+
+        assert cache.get() is None
@@ -0,0 +1,310 @@
+import asyncio
+from typing import List, Tuple
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.infrastructure.api_clients.async_strava_api import AsyncStravaAPI
+from src.infrastructure.auth.token_provider import RefreshingTokenProvider
+from src.interfaces.database.database_deleter import IDatabaseDeleter
+from src.interfaces.encryption.encryptor import IEncryptation
+from src.utils import exceptions
+
+NOW = 1_700_000_000
+
+
+class FakeClock:
+    def __init__(self, now: float = NOW) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRefreshingTokenProvider:
+    @pytest.mark.asyncio
+    async def test_valid_token_is_not_refreshed(self) -> None:
+        refresher = AsyncMock()
+        provider = RefreshingTokenProvider(
+            "old", NOW + 3600, refresher, refresh_margin=300, clock=FakeClock()
+        )
+
+        await provider.ensure_fresh()
+
+        assert provider.access_token == "old"
+        refresher.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_token_inside_margin_is_refreshed_once(self) -> None:
+        refresher = AsyncMock(side_effect=[("new", NOW + 21600)])
+        provider = RefreshingTokenProvider(
+            "old", NOW + 100, refresher, refresh_margin=300, clock=FakeClock()
+        )
+
+        await asyncio.gather(*(provider.ensure_fresh() for _ in range(5)))
+
+        assert provider.access_token == "new"
+        assert provider.expires_at == NOW + 21600
+        refresher.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_unexpired_token(self) -> None:
+        refresher = AsyncMock(side_effect=RuntimeError("boom"))
+        provider = RefreshingTokenProvider(
+            "old", NOW + 100, refresher, refresh_margin=300, clock=FakeClock()
+        )
+
+        await provider.ensure_fresh()
+
+        assert provider.access_token == "old"
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_is_not_retried_before_retry_interval(self) -> None:
+        clock = FakeClock()
+        refresher = AsyncMock(side_effect=[RuntimeError("boom"), ("new", NOW + 21600)])
+        provider = RefreshingTokenProvider(
+            "old",
+            NOW + 200,
+            refresher,
+            refresh_margin=300,
+            retry_interval=60,
+            clock=clock,
+        )
+
+        for _ in range(3):
+            await provider.ensure_fresh()
+
+        refresher.assert_awaited_once()
+        assert provider.access_token == "old"
+
+        clock.now = NOW + 60
+        await provider.ensure_fresh()
+
+        assert refresher.await_count == 2
+        assert provider.access_token == "new"
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_of_expired_token_raises(self) -> None:
+        refresher = AsyncMock(side_effect=RuntimeError("boom"))
+        provider = RefreshingTokenProvider(
+            "old", NOW - 1, refresher, refresh_margin=300, clock=FakeClock()
+        )
+
+        with pytest.raises(RuntimeError):
+            await provider.ensure_fresh()
+
+    @pytest.mark.asyncio
+    async def test_background_task_refreshes_ahead_of_expiry(self) -> None:
+        clock = FakeClock()
+        refreshed = asyncio.Event()
+
+        async def refresher() -> Tuple[str, int]:
+            refreshed.set()
+            return "new", int(clock.now) + 21600
+
+        provider = RefreshingTokenProvider(
+            "old", NOW + 300, refresher, refresh_margin=300, clock=clock
+        )
+
+        await provider.start()
+        await asyncio.wait_for(refreshed.wait(), timeout=1)
+        await provider.stop()
+
+        assert provider.access_token == "new"
+        assert not provider.running
+
+    @pytest.mark.asyncio
+    async def test_background_failure_waits_before_retrying(self) -> None:
+        refresher = AsyncMock(side_effect=RuntimeError("boom"))
+        provider = RefreshingTokenProvider(
+            "old",
+            NOW,
+            refresher,
+            refresh_margin=300,
+            retry_interval=60,
+            clock=FakeClock(),
+        )
+
+        await provider.start()
+        await asyncio.sleep(0.05)
+        await provider.stop()
+
+        refresher.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_api_session_uses_refreshed_token(self) -> None:
+        clock = FakeClock()
+        provider = RefreshingTokenProvider(
+            "old",
+            NOW + 3600,
+            AsyncMock(side_effect=[("new", NOW + 21600)]),
+            refresh_margin=300,
+            clock=clock,
+        )
+        api = AsyncStravaAPI(
+            access_token=provider.access_token,
+            table="test_table",
+            encryptor=Mock(spec=IEncryptation),
+            deleter=Mock(spec=IDatabaseDeleter),
+            coalesce_requests=False,
+            token_provider=provider,
+        )
+        client = Mock()
+        client.open = AsyncMock()
+        client.close = AsyncMock()
+        client.make_async_request = AsyncMock(return_value={"id": 1})
+        api.http_client = client
+
+        async with api:
+            assert provider.running
+            await api.make_request("/athlete")
+            clock.now = NOW + 3400
+            await api.make_request("/athlete")
+
+        assert not provider.running
+        bearers = [
+            call.kwargs["headers"]["Authorization"]
+            for call in client.make_async_request.await_args_list
+        ]
+        assert bearers == ["Bearer old", "Bearer new"]
+
+
+class TestUnauthorizedReplay:
+    @staticmethod
+    def make_api(provider: RefreshingTokenProvider, client: Mock) -> AsyncStravaAPI:
+        api = AsyncStravaAPI(
+            access_token=provider.access_token,
+            table="test_table",
+            encryptor=Mock(spec=IEncryptation),
+            coalesce_requests=False,
+            token_provider=provider,
+        )
+        api.http_client = client
+        return api
+
+    @staticmethod
+    def make_client() -> Mock:
+        async def request(url: str, headers: dict, params: dict | None) -> dict:
+            await asyncio.sleep(0)
+            if headers["Authorization"] == "Bearer old":
+                raise exceptions.UnauthorizedError()
+            return {"url": url}
+
+        client = Mock()
+        client.make_async_request = AsyncMock(side_effect=request)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_rejected_requests_share_one_refresh_and_replay(self) -> None:
+        refresher = AsyncMock(return_value=("new", NOW + 21600))
+        provider = RefreshingTokenProvider(
+            "old", NOW + 3600, refresher, refresh_margin=300, clock=FakeClock()
+        )
+        api = self.make_api(provider, self.make_client())
+
+        results = await asyncio.gather(
+            *(api.make_request(f"/activities/{i}") for i in range(5))
+        )
+
+        assert [r["url"] for r in results] == [
+            f"https://www.strava.com/api/v3/activities/{i}" for i in range(5)
+        ]
+        refresher.assert_awaited_once()
+        assert provider.access_token == "new"
+
+    @pytest.mark.asyncio
+    async def test_token_cleanup_waits_for_the_refresh(self) -> None:
+        events: List[str] = []
+
+        async def refresher() -> Tuple[str, int]:
+            await asyncio.sleep(0)
+            events.append("refreshed")
+            return "new", NOW + 21600
+
+        provider = RefreshingTokenProvider(
+            "old", NOW + 3600, refresher, refresh_margin=300, clock=FakeClock()
+        )
+        client = self.make_client()
+        client.schedule_token_cleanup = Mock(
+            side_effect=lambda: events.append("cleanup")
+        )
+        api = self.make_api(provider, client)
+
+        await asyncio.gather(*(api.make_request("/athlete") for _ in range(3)))
+
+        assert events[0] == "refreshed"
+        assert set(events[1:]) == {"cleanup"}
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_does_not_clean_up_tokens(self) -> None:
+        provider = RefreshingTokenProvider(
+            "old",
+            NOW + 3600,
+            AsyncMock(side_effect=RuntimeError("down")),
+            refresh_margin=300,
+            clock=FakeClock(),
+        )
+        client = self.make_client()
+        api = self.make_api(provider, client)
+
+        with pytest.raises(RuntimeError):
+            await api.make_request("/athlete")
+
+        client.schedule_token_cleanup.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_same_token_from_refresh_is_raised_without_replay(self) -> None:
+        refresher = AsyncMock(return_value=("old", NOW + 21600))
+        provider = RefreshingTokenProvider(
+            "old", NOW + 3600, refresher, refresh_margin=300, clock=FakeClock()
+        )
+        client = self.make_client()
+        api = self.make_api(provider, client)
+
+        with pytest.raises(exceptions.UnauthorizedError):
+            await api.make_request("/athlete")
+
+        refresher.assert_awaited_once()
+        assert client.make_async_request.await_count == 1
+        client.schedule_token_cleanup.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejection_within_cooldown_does_not_refresh_again(self) -> None:
+        clock = FakeClock()
+        refresher = AsyncMock(side_effect=[("new", NOW + 21600), ("newer", NOW)])
+        provider = RefreshingTokenProvider(
+            "old",
+            NOW + 3600,
+            refresher,
+            refresh_margin=300,
+            refresh_cooldown=60,
+            clock=clock,
+        )
+        client = Mock()
+        client.make_async_request = AsyncMock(side_effect=exceptions.UnauthorizedError)
+        api = self.make_api(provider, client)
+
+        for _ in range(3):
+            with pytest.raises(exceptions.UnauthorizedError):
+                await api.make_request("/athlete")
+
+        refresher.assert_awaited_once()
+        assert provider.access_token == "new"
+
+        clock.now = NOW + 61
+        with pytest.raises(exceptions.UnauthorizedError):
+            await api.make_request("/athlete")
+
+        assert refresher.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_without_provider_rejection_is_raised(self) -> None:
+        api = AsyncStravaAPI(
+            access_token="old",
+            table="test_table",
+            encryptor=Mock(spec=IEncryptation),
+        )
+        api.http_client = self.make_client()
+
+        with pytest.raises(exceptions.UnauthorizedError):
+            await api.make_request("/athlete")
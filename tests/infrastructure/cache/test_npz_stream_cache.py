@@ -0,0 +1,109 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.infrastructure.cache.npz_stream_cache import NpzStreamCache
+
+STREAM_KEYS = ["time", "distance", "heartrate"]
+RESPONSE = {
+    "time": {"data": [0, 1, 2]},
+    "distance": {"data": [0.0, 1.5, 3.0]},
+    "heartrate": {"data": [60, 62, 64]},
+    "latlng": {"data": [[40.1, -3.7], [40.2, -3.8], [40.3, -3.9]]},
+}
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> NpzStreamCache:
+    return NpzStreamCache(str(tmp_path))
+
+
+class TestNpzStreamCache:
+    def test_get_missing_entry_returns_none(self, cache: NpzStreamCache) -> None:
+        assert cache.get(1, STREAM_KEYS) is None
+
+    def test_round_trip_preserves_streams(self, cache: NpzStreamCache) -> None:
+        cache.set(1, STREAM_KEYS, RESPONSE)
+
+        result = cache.get(1, STREAM_KEYS)
+
+        assert result is not None
+        assert list(result) == list(RESPONSE)
+        for stream_type, stream_data in RESPONSE.items():
+            np.testing.assert_array_equal(
+                result[stream_type]["data"], stream_data["data"]
+            )
+        assert result["time"]["data"].dtype == np.int64
+
+    def test_key_order_does_not_matter(self, cache: NpzStreamCache) -> None:
+        cache.set(1, STREAM_KEYS, RESPONSE)
+
+        assert cache.get(1, list(reversed(STREAM_KEYS))) is not None
+        assert cache.get(1, ["time"]) is None
+        assert cache.get(2, STREAM_KEYS) is None
+
+    def test_streams_with_missing_values_are_not_cached(
+        self, cache: NpzStreamCache
+    ) -> None:
+        cache.set(1, STREAM_KEYS, {"heartrate": {"data": [60, None, 64]}})
+
+        assert cache.get(1, STREAM_KEYS) is None
+
+    def test_corrupt_entry_is_discarded(
+        self, cache: NpzStreamCache, tmp_path: Path
+    ) -> None:
+        cache.set(1, STREAM_KEYS, RESPONSE)
+        (entry,) = tmp_path.glob("*.npz")
+        entry.write_bytes(b"not an archive")
+
+        assert cache.get(1, STREAM_KEYS) is None
+        assert not entry.exists()
+
+    def test_evicts_least_recently_used_entries(self, tmp_path: Path) -> None:
+        cache = NpzStreamCache(str(tmp_path), max_bytes=10**9)
+        for activity_id in (1, 2, 3):
+            cache.set(activity_id, STREAM_KEYS, RESPONSE)
+        entries = sorted(tmp_path.glob("*.npz"))
+        for age, path in enumerate(entries):
+            os.utime(path, (age, age))
+        cache.get(1, STREAM_KEYS)  # refresh the first activity
+
+        cache.max_bytes = sum(path.stat().st_size for path in entries)
+        cache.set(4, STREAM_KEYS, RESPONSE)
+
+        remaining = [
+            activity_id
+            for activity_id in (1, 2, 3, 4)
+            if cache.get(activity_id, STREAM_KEYS) is not None
+        ]
+        assert 1 in remaining and 4 in remaining
+        assert len(remaining) == 3
+
+    def test_directory_is_not_scanned_while_under_the_limit(
+        self, cache: NpzStreamCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache.set(1, STREAM_KEYS, RESPONSE)
+        size = cache._total_bytes
+
+        def fail() -> None:
+            raise AssertionError("scanned the cache directory")
+
+        monkeypatch.setattr(cache, "_entries", fail)
+        cache.set(1, STREAM_KEYS, RESPONSE)  # overwriting keeps the same size
+        cache.set(2, STREAM_KEYS, RESPONSE)
+
+        assert cache._total_bytes == 2 * size
+
+    def test_existing_entries_count_towards_the_limit(self, tmp_path: Path) -> None:
+        NpzStreamCache(str(tmp_path)).set(1, STREAM_KEYS, RESPONSE)
+        (entry,) = tmp_path.glob("*.npz")
+
+        cache = NpzStreamCache(str(tmp_path))
+
+        assert cache._total_bytes == entry.stat().st_size
+
+    def test_invalid_size_raises_value_error(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            NpzStreamCache(str(tmp_path), max_bytes=0)
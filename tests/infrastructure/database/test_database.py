@@ -1,9 +1,10 @@
 from collections.abc import Callable
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.infrastructure.database.supabase_deleter import SupabaseDeleter
 from src.infrastructure.database.supabase_reader import SupabaseReader
 from src.infrastructure.database.supabase_writer import SupabaseWriter
 from src.utils import exceptions as exception
@@ -24,6 +25,11 @@ def supabase_writer(mock_client: MagicMock) -> SupabaseWriter:
     return SupabaseWriter(mock_client)
 
 
+@pytest.fixture
+def supabase_deleter(mock_client: MagicMock) -> SupabaseDeleter:
+    return SupabaseDeleter(mock_client)
+
+
 @pytest.fixture
 def mock_execute() -> Callable[..., MagicMock]:
     def _mock_execute(data: None = None, error: None = None) -> MagicMock:
@@ -62,6 +68,9 @@ class TestSupabaseReader:
             "test_table", "access_token", "expires_at"
         )
         assert result == {"access_token": "test_token"}
+        supabase_reader.client.table.return_value.select.return_value.order.assert_called_once_with(
+            "expires_at", desc=True, nullsfirst=False
+        )
 
     def test_fetch_latest_record_no_data(
         self,
@@ -154,3 +163,86 @@ class TestSupabaseWriter:
             match="Failed to insert data: Insert error",
         ):
             supabase_writer.insert_record("test_table", {"access_token": "test_token"})
+
+
+class TestSupabaseDeleter:
+    NOW = 1_700_000_000
+
+    @pytest.fixture
+    def encryptor(self) -> MagicMock:
+        encryptor = MagicMock()
+        encryptor.decrypt_data.side_effect = lambda record: record
+        return encryptor
+
+    def test_expired_ids_are_filtered_server_side(
+        self,
+        supabase_deleter: SupabaseDeleter,
+        mock_client: MagicMock,
+        encryptor: MagicMock,
+    ) -> None:
+        select = mock_client.table.return_value.select.return_value
+        select.lt.return_value.execute.return_value.data = [{"id": 7}, {"id": 3}]
+        select.is_.return_value.execute.return_value.data = [
+            {"id": 5, "expires_at": str(self.NOW - 1)},
+            {"id": 9, "expires_at": str(self.NOW + 3600)},
+        ]
+
+        with patch("time.time", return_value=self.NOW):
+            result = supabase_deleter.get_expired_token_ids("tokens", encryptor)
+
+        assert result == [3, 5, 7]
+        select.lt.assert_called_once_with("expires_at_epoch", self.NOW)
+        select.is_.assert_called_once_with("expires_at_epoch", "null")
+        # Only legacy rows without the plaintext expiry are decrypted.
+        assert encryptor.decrypt_data.call_count == 2
+
+    def test_cleanup_is_one_filtered_bulk_delete(
+        self,
+        supabase_deleter: SupabaseDeleter,
+        mock_client: MagicMock,
+        encryptor: MagicMock,
+    ) -> None:
+        table = mock_client.table.return_value
+        table.delete.return_value.lt.return_value.execute.return_value.data = [
+            {"id": 1},
+            {"id": 2},
+        ]
+        table.select.return_value.is_.return_value.execute.return_value.data = []
+
+        with patch("time.time", return_value=self.NOW):
+            assert supabase_deleter.cleanup_expired_tokens("tokens", encryptor)
+
+        table.delete.return_value.lt.assert_called_once_with(
+            "expires_at_epoch", self.NOW
+        )
+        table.delete.return_value.in_.assert_not_called()
+        encryptor.decrypt_data.assert_not_called()
+
+    def test_cleanup_deletes_expired_legacy_rows(
+        self,
+        supabase_deleter: SupabaseDeleter,
+        mock_client: MagicMock,
+        encryptor: MagicMock,
+    ) -> None:
+        table = mock_client.table.return_value
+        table.delete.return_value.lt.return_value.execute.return_value.data = []
+        table.select.return_value.is_.return_value.execute.return_value.data = [
+            {"id": 4, "expires_at": str(self.NOW - 1)}
+        ]
+
+        with patch("time.time", return_value=self.NOW):
+            supabase_deleter.cleanup_expired_tokens("tokens", encryptor)
+
+        table.delete.return_value.in_.assert_called_once_with("id", values=[4])
+
+    def test_cleanup_error_raises_database_error(
+        self,
+        supabase_deleter: SupabaseDeleter,
+        mock_client: MagicMock,
+        encryptor: MagicMock,
+    ) -> None:
+        table = mock_client.table.return_value
+        table.delete.return_value.lt.return_value.execute.side_effect = Exception()
+
+        with pytest.raises(exception.DatabaseOperationError):
+            supabase_deleter.cleanup_expired_tokens("tokens", encryptor)
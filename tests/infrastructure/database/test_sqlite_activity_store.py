@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.database.sqlite_activity_store import SqliteActivityStore
+from src.utils import exceptions as exception
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> SqliteActivityStore:
+    return SqliteActivityStore(str(tmp_path / "activities.sqlite3"))
+
+
+class TestSqliteActivityStore:
+    def test_synced_range_is_none_before_first_sync(
+        self, store: SqliteActivityStore
+    ) -> None:
+        assert store.get_synced_range(athlete_id=1) is None
+
+    def test_update_synced_range_overwrites_previous_value(
+        self, store: SqliteActivityStore
+    ) -> None:
+        store.update_synced_range(athlete_id=1, after=100, before=200)
+        store.update_synced_range(athlete_id=1, after=50, before=300)
+
+        assert store.get_synced_range(athlete_id=1) == (50, 300)
+        assert store.get_synced_range(athlete_id=2) is None
+
+    def test_get_activities_filters_by_athlete_and_range(
+        self, store: SqliteActivityStore
+    ) -> None:
+        store.save_activities(
+            1,
+            [
+                {"id": 2, "start_date": "2024-01-02T00:00:00Z"},
+                {"id": 1, "start_date": "2024-01-01T00:00:00Z"},
+                {"id": 3, "start_date": "2024-02-01T00:00:00Z"},
+            ],
+        )
+        store.save_activities(2, [{"id": 4, "start_date": "2024-01-01T00:00:00Z"}])
+
+        result = store.get_activities(1, after=1704067200, before=1706745600)
+
+        assert [activity["id"] for activity in result] == [1, 2]
+
+    def test_save_activities_replaces_existing_activity(
+        self, store: SqliteActivityStore
+    ) -> None:
+        store.save_activities(1, [{"id": 1, "start_date": "2024-01-01T00:00:00Z"}])
+        store.save_activities(
+            1, [{"id": 1, "start_date": "2024-01-01T00:00:00Z", "name": "Run"}]
+        )
+
+        result = store.get_activities(1, after=0, before=2_000_000_000)
+
+        assert result == [
+            {"id": 1, "start_date": "2024-01-01T00:00:00Z", "name": "Run"}
+        ]
+
+    def test_invalid_path_raises_database_error(self, tmp_path: Path) -> None:
+        with pytest.raises(exception.DatabaseOperationError):
+            SqliteActivityStore(str(tmp_path / "missing" / "activities.sqlite3"))
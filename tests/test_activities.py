@@ -1,3 +1,4 @@
+import asyncio
 from typing import Dict, List
 from unittest.mock import AsyncMock, Mock
 
@@ -5,7 +6,9 @@ import pandas as pd
 import pytest
 
 from src.activities.detailed_activities import (
+    ACTIVITIES_PER_PAGE,
     DetailedActivitiesFetcher,
+    PaginatedActivitiesFetcher,
     WeeklyActivitiesFetcher,
 )
 from src.core.streams.fetcher import ActivityStreamsFetcher
@@ -27,6 +30,140 @@ def mock_async_api() -> Mock:
     return api
 
 
+class TestPaginatedActivitiesFetcher:
+    @pytest.fixture
+    def activity_fetcher(self, mock_async_api: Mock) -> PaginatedActivitiesFetcher:
+        return PaginatedActivitiesFetcher(api=mock_async_api)
+
+    @pytest.mark.asyncio
+    async def test_fetch_activity_data_walks_all_pages(
+        self, activity_fetcher: PaginatedActivitiesFetcher, mock_async_api: Mock
+    ) -> None:
+        first_page = [{"id": i} for i in range(ACTIVITIES_PER_PAGE)]
+        second_page = [{"id": ACTIVITIES_PER_PAGE}]
+        mock_async_api.make_request.side_effect = [first_page, second_page]
+
+        result = await activity_fetcher.fetch_activity_data(after=100, before=200)
+
+        assert result == first_page + second_page
+        pages = [
+            call.kwargs["params"]["page"]
+            for call in mock_async_api.make_request.call_args_list
+        ]
+        assert pages == [1, 2]
+        assert mock_async_api.make_request.call_args.kwargs["params"]["after"] == "100"
+
+    @pytest.mark.asyncio
+    async def test_iter_activities_stops_on_empty_page(
+        self, activity_fetcher: PaginatedActivitiesFetcher, mock_async_api: Mock
+    ) -> None:
+        mock_async_api.make_request.side_effect = [[{"id": 1}, {"id": 2}], []]
+
+        result = [
+            activity
+            async for activity in activity_fetcher.iter_activities(
+                after=100, before=200, per_page=2
+            )
+        ]
+
+        assert result == [{"id": 1}, {"id": 2}]
+        assert mock_async_api.make_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_iter_activities_splits_long_ranges(
+        self, activity_fetcher: PaginatedActivitiesFetcher, mock_async_api: Mock
+    ) -> None:
+        async def make_request(endpoint: str, params: dict) -> list[dict]:
+            # Later windows answer first to show results still come out in order.
+            await asyncio.sleep(0.01 if params["after"] == "100" else 0)
+            return [{"id": int(params["after"])}]
+
+        mock_async_api.make_request.side_effect = make_request
+
+        result = [
+            activity
+            async for activity in activity_fetcher.iter_activities(
+                after=100, before=130, window_seconds=10
+            )
+        ]
+
+        assert result == [{"id": 100}, {"id": 110}, {"id": 120}]
+        assert mock_async_api.make_request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_iter_activities_caps_windows_in_flight(
+        self, activity_fetcher: PaginatedActivitiesFetcher, mock_async_api: Mock
+    ) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def make_request(endpoint: str, params: dict) -> list[dict]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return [{"id": int(params["after"])}]
+
+        mock_async_api.make_request.side_effect = make_request
+
+        result = [
+            activity
+            async for activity in activity_fetcher.iter_activities(
+                after=100, before=200, window_seconds=10, max_windows_in_flight=3
+            )
+        ]
+
+        assert result == [{"id": start} for start in range(100, 200, 10)]
+        assert peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_iter_activities_pages_open_ended_range_sequentially(
+        self, activity_fetcher: PaginatedActivitiesFetcher, mock_async_api: Mock
+    ) -> None:
+        mock_async_api.make_request.return_value = [{"id": 1}]
+
+        result = [
+            activity
+            async for activity in activity_fetcher.iter_activities(
+                after=0, before=1_704_067_200
+            )
+        ]
+
+        assert result == [{"id": 1}]
+        assert mock_async_api.make_request.call_count == 1
+        params = mock_async_api.make_request.call_args.kwargs["params"]
+        assert params["after"] == "0"
+
+    @pytest.mark.asyncio
+    async def test_iter_activities_propagates_window_errors(
+        self, activity_fetcher: PaginatedActivitiesFetcher, mock_async_api: Mock
+    ) -> None:
+        mock_async_api.make_request.side_effect = [
+            [{"id": 1}],
+            exceptions.TooManyRequestError("Rate limit exceeded"),
+        ]
+
+        with pytest.raises(exceptions.TooManyRequestError):
+            async for _ in activity_fetcher.iter_activities(
+                after=100, before=120, window_seconds=10
+            ):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_iter_activities_is_lazy(
+        self, activity_fetcher: PaginatedActivitiesFetcher, mock_async_api: Mock
+    ) -> None:
+        mock_async_api.make_request.return_value = [{"id": 1}, {"id": 2}]
+
+        activities = activity_fetcher.iter_activities(after=100, before=200, per_page=2)
+        first = await anext(activities)
+        await activities.aclose()
+
+        assert first == {"id": 1}
+        assert mock_async_api.make_request.call_count == 1
+
+
 class TestWeeklyActivitiesFetcher:
     @pytest.fixture
     def activity_fetcher(self, mock_async_api: Mock) -> WeeklyActivitiesFetcher:
@@ -111,6 +248,28 @@ class TestDetailedActivitiesFetcher:
         assert len(result) == 1
         assert result[0] == {}  # Empty dict returned for failed fetch
 
+    @pytest.mark.asyncio
+    async def test_fetch_activity_data_multiple_pages(
+        self, activity_fetcher: DetailedActivitiesFetcher, mock_async_api: Mock
+    ) -> None:
+        first_page = [{"id": i} for i in range(ACTIVITIES_PER_PAGE)]
+        responses = {
+            "/activities": iter([first_page, [{"id": ACTIVITIES_PER_PAGE}]]),
+        }
+
+        async def make_request(endpoint: str, params: dict | None = None) -> object:
+            if endpoint == "/activities":
+                return next(responses["/activities"])
+            return {"id": int(endpoint.rsplit("/", 1)[1]), "name": "Run"}
+
+        mock_async_api.make_request.side_effect = make_request
+
+        result = await activity_fetcher.fetch_activity_data(keys=["id"])
+
+        assert [activity["id"] for activity in result] == list(
+            range(ACTIVITIES_PER_PAGE + 1)
+        )
+
 
 stream_response_type = List[Dict[str, Dict[str, List[float]]]]
 STREAM_RESPONSES: stream_response_type = [
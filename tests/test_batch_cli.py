@@ -0,0 +1,132 @@
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pandas as pd
+import pytest
+
+from src.presentation import batch_cli
+
+
+@pytest.fixture
+def mock_service() -> Mock:
+    service = Mock()
+    service.__aenter__ = AsyncMock(return_value=service)
+    service.__aexit__ = AsyncMock(return_value=None)
+    service.get_activity_range = AsyncMock(return_value=[{"id": 1}])
+    service.get_activity_details = AsyncMock(return_value=[{"id": 1, "name": "Run"}])
+    service.sync_activities = AsyncMock(return_value=[{"id": 1}, {"id": 2}])
+    service.get_streams_for_multiple_activities = AsyncMock(
+        return_value=pd.DataFrame({"time": [0, 1], "id": [5, 5]})
+    )
+    service.get_activity_zones = AsyncMock(return_value={"Zone_1": 10})
+    service.export_streams_partitioned = AsyncMock(return_value=["a", "b"])
+    service.export_streams_for_selected_week = AsyncMock(
+        return_value=pd.DataFrame({"time": [0, 1, 0], "id": [1, 1, 2]})
+    )
+    return service
+
+
+class TestBatchCli:
+    def test_list_with_date_range(
+        self, mock_service: Mock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        factory = Mock(return_value=mock_service)
+
+        code = batch_cli.run(
+            [
+                "--max-concurrency",
+                "4",
+                "list",
+                "--after",
+                "2024-01-01",
+                "--before",
+                "2024-02-01",
+            ],
+            factory,
+        )
+
+        assert code == batch_cli.EXIT_OK
+        factory.assert_called_once_with(4)
+        mock_service.get_activity_range.assert_awaited_once_with(
+            previous_week=False, after=1704067200, before=1706745600, weeks_back=None
+        )
+        mock_service.__aexit__.assert_awaited_once()
+        assert json.loads(capsys.readouterr().out) == [{"id": 1}]
+
+    def test_sync_prints_summary(
+        self, mock_service: Mock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        code = batch_cli.run(["sync", "--weeks-back", "4"], lambda _: mock_service)
+
+        assert code == batch_cli.EXIT_OK
+        assert json.loads(capsys.readouterr().out) == {"activities": 2}
+
+    def test_streams_written_as_csv_to_output(
+        self, mock_service: Mock, tmp_path: Path
+    ) -> None:
+        output = tmp_path / "streams.csv"
+
+        code = batch_cli.run(
+            ["--output", str(output), "streams", "5"], lambda _: mock_service
+        )
+
+        assert code == batch_cli.EXIT_OK
+        mock_service.get_streams_for_multiple_activities.assert_awaited_once_with([5])
+        assert pd.read_csv(output)["id"].tolist() == [5, 5]
+
+    def test_zones(self, mock_service: Mock) -> None:
+        code = batch_cli.run(["zones", "7", "--save"], lambda _: mock_service)
+
+        assert code == batch_cli.EXIT_OK
+        mock_service.get_activity_zones.assert_awaited_once_with(7, save_zones=True)
+
+    def test_export_partitioned(self, mock_service: Mock) -> None:
+        code = batch_cli.run(
+            ["export", "--format", "parquet", "--output-dir", "out", "--partitioned"],
+            lambda _: mock_service,
+        )
+
+        assert code == batch_cli.EXIT_OK
+        kwargs = mock_service.export_streams_partitioned.await_args.kwargs
+        assert kwargs["selected_format"] == "parquet"
+        assert kwargs["output_dir"] == "out"
+
+    def test_export_prints_summary(
+        self, mock_service: Mock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        code = batch_cli.run(["export", "--previous-week"], lambda _: mock_service)
+
+        assert code == batch_cli.EXIT_OK
+        assert json.loads(capsys.readouterr().out) == {"activities": 2, "rows": 3}
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["unknown"],
+            ["list", "--after", "01/02/2024"],
+            ["--max-concurrency", "0", "list"],
+            ["export", "--format", "parquet", "--chunked"],
+            ["export", "--format", "xlsx"],
+            ["list", "--weeks-back", "-1"],
+            ["details", "--weeks-back", "two"],
+        ],
+    )
+    def test_usage_errors(self, argv: list[str], mock_service: Mock) -> None:
+        factory = Mock(return_value=mock_service)
+
+        assert batch_cli.run(argv, factory) == batch_cli.EXIT_USAGE
+        factory.assert_not_called()
+
+    def test_command_failure_returns_failure_code(
+        self, mock_service: Mock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        mock_service.get_activity_details.side_effect = ValueError(
+            "No activities found."
+        )
+
+        code = batch_cli.run(["details"], lambda _: mock_service)
+
+        assert code == batch_cli.EXIT_FAILURE
+        assert "No activities found." in capsys.readouterr().err
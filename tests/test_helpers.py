@@ -1,9 +1,20 @@
 import asyncio
+from datetime import datetime, timezone
+from typing import AsyncIterator
 
 import pytest
 from freezegun import freeze_time
 
-from src.utils.helpers import func_time_execution, get_week_epoch_range
+from src.utils.helpers import (
+    as_async_iterable,
+    func_time_execution,
+    get_week_epoch_range,
+    get_weeks_back_epoch_range,
+    resolve_epoch_range,
+    split_epoch_range,
+)
+
+ONE_WEEK = 7 * 24 * 60 * 60
 
 
 class TestEpochTimeCalculation:
@@ -43,6 +54,54 @@ class TestEpochTimeCalculation:
             ) == 7 * 24 * 60 * 60  # One week difference
 
 
+class TestEpochRangeResolution:
+    def test_get_weeks_back_epoch_range(self) -> None:
+        with freeze_time("2024-01-24"):
+            monday, sunday = get_week_epoch_range()
+            after, before = get_weeks_back_epoch_range(4)
+
+            assert before == sunday
+            assert after == monday - 4 * ONE_WEEK
+
+    def test_get_weeks_back_epoch_range_negative(self) -> None:
+        with pytest.raises(ValueError, match="weeks_back"):
+            get_weeks_back_epoch_range(-1)
+
+    def test_resolve_epoch_range_defaults_to_week(self) -> None:
+        with freeze_time("2024-01-24"):
+            assert resolve_epoch_range() == get_week_epoch_range()
+            assert resolve_epoch_range(previous_week=True) == get_week_epoch_range(
+                previous_week=True
+            )
+
+    def test_resolve_epoch_range_explicit_bounds_win(self) -> None:
+        assert resolve_epoch_range(
+            previous_week=True, after=100, before=200, weeks_back=3
+        ) == (100, 200)
+
+    def test_resolve_epoch_range_open_bounds(self) -> None:
+        with freeze_time("2024-01-24"):
+            now = int(datetime(2024, 1, 24, tzinfo=timezone.utc).timestamp())
+            assert resolve_epoch_range(after=100) == (100, now)
+            assert resolve_epoch_range(before=200) == (0, 200)
+
+    def test_resolve_epoch_range_weeks_back(self) -> None:
+        with freeze_time("2024-01-24"):
+            assert resolve_epoch_range(weeks_back=2) == get_weeks_back_epoch_range(2)
+
+    def test_resolve_epoch_range_invalid(self) -> None:
+        with pytest.raises(ValueError, match="earlier than"):
+            resolve_epoch_range(after=200, before=100)
+
+    def test_split_epoch_range(self) -> None:
+        assert split_epoch_range(0, 25, 10) == [(0, 10), (10, 20), (20, 25)]
+        assert split_epoch_range(0, 10, 10) == [(0, 10)]
+
+    def test_split_epoch_range_invalid_window(self) -> None:
+        with pytest.raises(ValueError, match="window_seconds"):
+            split_epoch_range(0, 10, 0)
+
+
 @pytest.mark.asyncio
 async def test_func_time_execution_decorator() -> None:
     @func_time_execution
@@ -52,3 +111,13 @@ async def test_func_time_execution_decorator() -> None:
 
     result = await sample_async_function()
     assert result == "test"
+
+
+@pytest.mark.asyncio
+async def test_as_async_iterable_accepts_sync_and_async_iterables() -> None:
+    async def numbers() -> AsyncIterator[int]:
+        for number in (1, 2):
+            yield number
+
+    assert [item async for item in as_async_iterable([1, 2])] == [1, 2]
+    assert [item async for item in as_async_iterable(numbers())] == [1, 2]
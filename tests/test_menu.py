@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pandas as pd
@@ -84,6 +85,64 @@ class TestMenuHandler:
             menu_handler._validate_option(invalid_option)
 
 
+class TestMenuEventLoop:
+    @pytest.fixture
+    def session_service(self, mock_service: Mock) -> Mock:
+        mock_service.__aenter__ = AsyncMock(return_value=mock_service)
+        mock_service.__aexit__ = AsyncMock(return_value=None)
+        loops = []
+
+        async def get_activity_range(previous_week: bool = False) -> list:
+            loops.append(asyncio.get_running_loop())
+            return [{"id": 1}]
+
+        mock_service.get_activity_range = get_activity_range
+        mock_service.loops = loops
+        return mock_service
+
+    def test_commands_share_one_loop_and_session(
+        self, session_service: Mock, mock_result_printer: Mock
+    ) -> None:
+        with MenuHandler(
+            service=session_service, result_console_printer=mock_result_printer
+        ) as menu:
+            menu.execute_option(str(MenuOption.ACTIVITY_RANGE.id))
+            menu.execute_option(str(MenuOption.ACTIVITY_RANGE_PREV_WEEK.id))
+
+        assert len(session_service.loops) == 2
+        assert session_service.loops[0] is session_service.loops[1]
+        assert session_service.loops[0].is_closed()
+        session_service.__aenter__.assert_awaited_once()
+        session_service.__aexit__.assert_awaited_once()
+        assert mock_result_printer.print_result.call_count == 2
+
+    def test_session_opens_lazily(self, session_service: Mock) -> None:
+        menu = MenuHandler(service=session_service)
+        session_service.__aenter__.assert_not_awaited()
+
+        menu.execute_option(str(MenuOption.ACTIVITY_RANGE.id))
+        menu.close()
+
+        session_service.__aenter__.assert_awaited_once()
+        session_service.__aexit__.assert_awaited_once()
+
+    def test_service_factory_runs_on_first_command(self, session_service: Mock) -> None:
+        factory = Mock(return_value=session_service)
+
+        with MenuHandler(service_factory=factory) as menu:
+            menu.print_menu()
+            factory.assert_not_called()
+            menu.execute_option(str(MenuOption.ACTIVITY_RANGE.id))
+            menu.execute_option(str(MenuOption.ACTIVITY_RANGE.id))
+
+        factory.assert_called_once_with()
+        session_service.__aexit__.assert_awaited_once()
+
+    def test_service_or_factory_is_required(self) -> None:
+        with pytest.raises(ValueError):
+            MenuHandler()
+
+
 class TestResultConsolePrinter:
     @pytest.fixture
     def printer(self) -> ResultConsolePrinter:
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("pandas", "numpy", "supabase", "aiohttp", "cryptography", "requests")
+# Generous enough for slow CI machines; eager imports took over a second.
+STARTUP_BUDGET_US = 500_000
+
+
+def import_times(*args: str) -> Dict[str, int]:
+    """Cumulative import time in microseconds per module, from -X importtime."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartup:
+    @pytest.mark.parametrize(
+        "args", [("-c", "import main"), ("main.py", "--help")], ids=["menu", "help"]
+    )
+    def test_heavy_modules_are_not_imported(self, args: tuple[str, ...]) -> None:
+        times = import_times(*args)
+
+        assert "src.presentation.cli_entrypoint" in times
+        loaded = [module for module in HEAVY_MODULES if module in times]
+        assert loaded == []
+
+    def test_main_import_within_budget(self) -> None:
+        # The first run warms the bytecode cache.
+        import_times("-c", "import main")
+
+        times = import_times("-c", "import main")
+
+        assert times["main"] < STARTUP_BUDGET_US
@@ -1,10 +1,16 @@
-from typing import Any, Optional, Type
-from unittest.mock import Mock, patch
+import asyncio
+from typing import Any, Dict, Optional, Type
+from unittest.mock import AsyncMock, Mock, patch
 
 import aiohttp
 import pytest
 
+from src.infrastructure.api_clients.async_http_client import (
+    AsyncHTTPClient,
+    ConnectionPoolConfig,
+)
 from src.infrastructure.api_clients.async_strava_api import AsyncStravaAPI
+from src.infrastructure.api_clients.response_cache import ResponseCache
 from src.interfaces.api_clients.strava_api import StravaAPIConfig
 from src.interfaces.database.database_deleter import IDatabaseDeleter
 from src.interfaces.encryption.encryptor import IEncryptation
@@ -12,9 +18,12 @@ from src.utils import exceptions
 
 
 class MockResponse:
-    def __init__(self, data: Any, status: int = 200) -> None:
+    def __init__(
+        self, data: Any, status: int = 200, headers: Dict[str, str] | None = None
+    ) -> None:
         self._data = data
         self.status = status
+        self.headers = headers or {}
 
     async def json(self) -> Any:
         return self._data
@@ -86,7 +95,131 @@ class TestStravaAPI:
     ) -> None:
         endpoint = "/activities/12345"
 
-        with patch("aiohttp.ClientSession.get") as mock_get:
+        with (
+            patch("aiohttp.ClientSession.get") as mock_get,
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
             mock_get.return_value = MockResponse({}, status=429)
             with pytest.raises(exceptions.TooManyRequestError):
                 await async_api.make_request(endpoint)
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused_inside_context(
+        self, async_api: AsyncStravaAPI
+    ) -> None:
+        client = async_api.http_client
+        assert isinstance(client, AsyncHTTPClient)
+
+        with patch("aiohttp.ClientSession.get") as mock_get:
+            mock_get.return_value = MockResponse({"id": 1})
+            async with async_api:
+                session = client._session
+                assert session is not None
+                await async_api.make_request("/activities/1")
+                await async_api.make_request("/activities/2")
+                assert client._session is session
+                assert mock_get.call_count == 2
+
+        assert client._session is None
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_connection_pool_config(self) -> None:
+        api = AsyncStravaAPI(
+            access_token=self.TEST_TOKEN,
+            table=self.TEST_TABLE,
+            encryptor=self.TEST_ENCRYPTOR,
+            pool_config=ConnectionPoolConfig(limit=5, limit_per_host=3),
+        )
+        client = api.http_client
+        assert isinstance(client, AsyncHTTPClient)
+
+        async with api:
+            assert client._session is not None
+            connector = client._session.connector
+            assert isinstance(connector, aiohttp.TCPConnector)
+            assert connector.limit == 5
+            assert connector.limit_per_host == 3
+
+    @pytest.mark.asyncio
+    async def test_make_request_updates_rate_limiter(
+        self, async_api: AsyncStravaAPI
+    ) -> None:
+        client = async_api.http_client
+        assert isinstance(client, AsyncHTTPClient)
+        headers = {"X-RateLimit-Limit": "200,2000", "X-RateLimit-Usage": "50,700"}
+
+        with patch("aiohttp.ClientSession.get") as mock_get:
+            mock_get.return_value = MockResponse({"id": 1}, headers=headers)
+            await async_api.make_request("/activities/1")
+
+        assert client.rate_limiter.short_window.tokens == 150
+        assert client.rate_limiter.daily_window.tokens == 1300
+
+    @pytest.mark.asyncio
+    async def test_make_request_bounded_concurrency(self) -> None:
+        api = AsyncStravaAPI(
+            access_token=self.TEST_TOKEN,
+            table=self.TEST_TABLE,
+            encryptor=self.TEST_ENCRYPTOR,
+            max_concurrency=2,
+        )
+        in_flight = 0
+        peak = 0
+
+        async def fake_request(**kwargs: Any) -> Dict[str, Any]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {}
+
+        with patch.object(api.http_client, "make_async_request", fake_request):
+            await asyncio.gather(
+                *(api.make_request(f"/activities/{i}") for i in range(10))
+            )
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_make_request_coalesces_identical_requests(
+        self, async_api: AsyncStravaAPI
+    ) -> None:
+        calls = 0
+
+        async def fake_request(**kwargs: Any) -> Dict[str, Any]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return {"page": kwargs["params"]["page"]}
+
+        with patch.object(async_api.http_client, "make_async_request", fake_request):
+            results = await asyncio.gather(
+                async_api.make_request("/activities", {"page": 1}),
+                async_api.make_request("/activities", {"page": 1}),
+                async_api.make_request("/activities", {"page": 2}),
+            )
+
+        assert calls == 2
+        assert results == [{"page": 1}, {"page": 1}, {"page": 2}]
+
+    @pytest.mark.asyncio
+    async def test_make_request_uses_response_cache(self) -> None:
+        cache = ResponseCache()
+        api = AsyncStravaAPI(
+            access_token=self.TEST_TOKEN,
+            table=self.TEST_TABLE,
+            encryptor=self.TEST_ENCRYPTOR,
+            response_cache=cache,
+        )
+        responses = iter([{}, {"id": 1}])
+
+        async def fake_request(**kwargs: Any) -> Dict[str, Any]:
+            return next(responses)
+
+        with patch.object(api.http_client, "make_async_request", fake_request):
+            results = [await api.make_request("/athlete") for _ in range(3)]
+
+        assert results == [{}, {"id": 1}, {"id": 1}]
+        assert (cache.stats.hits, cache.stats.misses) == (1, 2)
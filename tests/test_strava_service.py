@@ -87,6 +87,86 @@ class TestStravaService:
         assert not result.empty
         assert (tmp_path / "streams_previous_week.csv").exists()
 
+    @pytest.mark.asyncio
+    async def test_export_streams_for_date_range(
+        self, service: StravaService, mock_async_api: Mock, tmp_path: Path
+    ) -> None:
+        mock_stream_data = {
+            "time": {"data": [0, 1]},
+            "distance": {"data": [0, 100]},
+            "heartrate": {"data": [60, 65]},
+        }
+        mock_async_api.make_request.side_effect = [[{"id": 1}], mock_stream_data]
+
+        result = await service.export_streams_for_selected_week(
+            output_dir=str(tmp_path), after=1704067200, before=1705276800
+        )
+
+        assert len(result) == 2
+        assert (tmp_path / "streams_2024-01-01_2024-01-15.csv").exists()
+        params = mock_async_api.make_request.call_args_list[0].kwargs["params"]
+        assert params["after"] == "1704067200"
+
+    @pytest.mark.asyncio
+    async def test_export_streams_chunked(
+        self, service: StravaService, mock_async_api: Mock, tmp_path: Path
+    ) -> None:
+        mock_stream_data = {
+            "time": {"data": [0, 1]},
+            "distance": {"data": [0, 100]},
+            "heartrate": {"data": [60, 65]},
+        }
+        mock_async_api.make_request.side_effect = [
+            [{"id": 1}, {"id": 2}],
+            mock_stream_data,
+            mock_stream_data,
+        ]
+
+        summary = await service.export_streams_chunked(
+            output_dir=str(tmp_path), previous_week=True
+        )
+
+        assert summary["activities"] == 2
+        assert summary["rows"] == 4
+        result = pd.read_csv(tmp_path / "streams_previous_week.csv")
+        assert list(result.columns) == ["time", "distance", "heartrate", "id"]
+        assert sorted(result["id"].unique()) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_export_streams_partitioned_skips_existing(
+        self, service: StravaService, mock_async_api: Mock, tmp_path: Path
+    ) -> None:
+        mock_activities = [
+            {"id": 1, "start_date_local": "2024-01-02T08:00:00Z"},
+            {"id": 2, "start_date_local": "2024-01-09T08:00:00Z"},
+        ]
+        mock_stream_data = {
+            "time": {"data": [0, 1]},
+            "heartrate": {"data": [60, 65]},
+        }
+        mock_async_api.make_request.side_effect = [
+            mock_activities,
+            mock_stream_data,
+            mock_stream_data,
+            mock_activities,
+        ]
+
+        written = await service.export_streams_partitioned(
+            selected_format="csv", output_dir=str(tmp_path), weeks_back=2
+        )
+        rerun = await service.export_streams_partitioned(
+            selected_format="csv", output_dir=str(tmp_path), weeks_back=2
+        )
+
+        assert written == [
+            f"{tmp_path}/year=2024/week=01/activity_id=1/streams.csv",
+            f"{tmp_path}/year=2024/week=02/activity_id=2/streams.csv",
+        ]
+        assert rerun == []
+        assert mock_async_api.make_request.call_count == 4
+        partition = pd.read_csv(written[0])
+        assert partition["id"].tolist() == [1, 1]
+
     @pytest.mark.asyncio
     async def test_get_activity_range(
         self, service: StravaService, mock_async_api: Mock
@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -67,6 +67,59 @@ class TestTokenHandler:
             token_handler.process_token("test_table")
             mock_existing.assert_called_once_with(mock_record, "test_table")
 
+    def test_process_token_returns_decrypted_record_in_one_read(
+        self,
+        token_handler: TokenHandler,
+        mock_supabase_reader: Mock,
+        mock_token_manager: Mock,
+        mock_encryptor: Mock,
+    ) -> None:
+        decrypted_data = {"access_token": "test_token", "expires_at": "9999999999"}
+        mock_supabase_reader.fetch_latest_record.return_value = {
+            "id": 1,
+            "expires_at_epoch": "9999999999",
+        }
+        mock_encryptor.decrypt_data.return_value = decrypted_data
+        mock_token_manager.token_has_expired.return_value = False
+
+        result = token_handler.process_token("test_table")
+
+        assert result == decrypted_data
+        mock_supabase_reader.fetch_latest_record.assert_called_once_with(
+            "test_table", "*", "expires_at_epoch"
+        )
+        mock_encryptor.decrypt_data.assert_called_once()
+
+    def test_legacy_rows_fall_back_to_encrypted_ordering(
+        self, token_handler: TokenHandler, mock_supabase_reader: Mock
+    ) -> None:
+        legacy_record = {"id": 1, "expires_at_epoch": None}
+        mock_supabase_reader.fetch_latest_record.side_effect = [
+            legacy_record,
+            {"id": 2, "expires_at_epoch": None},
+        ]
+
+        record = token_handler._fetch_latest_token("test_table")
+
+        assert record == {"id": 2, "expires_at_epoch": None}
+        assert [
+            c.args for c in mock_supabase_reader.fetch_latest_record.call_args_list
+        ] == [
+            ("test_table", "*", "expires_at_epoch"),
+            ("test_table", "*", "expires_at"),
+        ]
+
+    def test_process_token_returns_initial_tokens(
+        self, token_handler: TokenHandler, mock_supabase_reader: Mock
+    ) -> None:
+        initial_tokens = {"access_token": "new_token", "expires_at": 9999999999}
+        mock_supabase_reader.fetch_latest_record.return_value = None
+
+        with patch.object(
+            token_handler, "_handle_initial_token_flow", return_value=initial_tokens
+        ):
+            assert token_handler.process_token("test_table") == initial_tokens
+
     def test_handle_existing_token_expired(
         self,
         token_handler: TokenHandler,
@@ -142,17 +195,23 @@ class TestTokenHandler:
         self,
         token_handler: TokenHandler,
         mock_supabase_writer: Mock,
+        mock_encryptor: Mock,
     ) -> None:
         tokens = {
             "access_token": "test_token",
             "refresh_token": "test_refresh",
             "expires_at": "9999999999",
         }
+        mock_encryptor.encrypt_data.return_value = {"expires_at": "encrypted"}
         mock_supabase_writer.insert_record.return_value = True
 
         result = token_handler._store_and_return_tokens(tokens, "test_table")
         assert "access_token" in result
         assert "access_token_creation" in result
+        mock_supabase_writer.insert_record.assert_called_once_with(
+            "test_table",
+            {"expires_at": "encrypted", "expires_at_epoch": "9999999999"},
+        )
 
     def test_store_and_return_tokens_failure(
         self, token_handler: TokenHandler, mock_supabase_writer: Mock
@@ -166,3 +225,46 @@ class TestTokenHandler:
 
         with pytest.raises(exceptions.TokenError):
             token_handler._store_and_return_tokens(tokens, "test_table")
+
+    @pytest.mark.asyncio
+    async def test_async_refresh_uses_given_token_manager(
+        self,
+        token_handler: TokenHandler,
+        mock_supabase_reader: Mock,
+        mock_encryptor: Mock,
+    ) -> None:
+        new_tokens = {
+            "access_token": "new_token",
+            "refresh_token": "new_refresh",
+            "expires_at": 9999999999,
+        }
+        mock_supabase_reader.fetch_latest_record.return_value = {"id": 1}
+        mock_encryptor.decrypt_data.return_value = {"refresh_token": "old_refresh"}
+        async_token_manager = Mock()
+        async_token_manager.refresh_access_token = AsyncMock(return_value=new_tokens)
+
+        with patch.object(
+            token_handler, "_store_and_return_tokens", return_value=new_tokens
+        ) as mock_store:
+            result = await token_handler.refresh_token(
+                "test_table", async_token_manager
+            )
+
+        assert result == new_tokens
+        async_token_manager.refresh_access_token.assert_awaited_once_with("old_refresh")
+        mock_store.assert_called_once_with(new_tokens, "test_table")
+
+    @pytest.mark.asyncio
+    async def test_async_refresh_failure_raises(
+        self,
+        token_handler: TokenHandler,
+        mock_supabase_reader: Mock,
+        mock_encryptor: Mock,
+    ) -> None:
+        mock_supabase_reader.fetch_latest_record.return_value = {"id": 1}
+        mock_encryptor.decrypt_data.return_value = {"refresh_token": "old_refresh"}
+        async_token_manager = Mock()
+        async_token_manager.refresh_access_token = AsyncMock(return_value=None)
+
+        with pytest.raises(exceptions.TokenError):
+            await token_handler.refresh_token("test_table", async_token_manager)
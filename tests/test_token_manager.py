@@ -1,10 +1,15 @@
 import time
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
 import pytest
 
-from src.infrastructure.auth.token_manager import GranType, TokenManager
+from src.infrastructure.auth.token_manager import (
+    AsyncTokenManager,
+    GranType,
+    TokenManager,
+)
 from src.utils import exceptions
 
 TEST_CLIENT_ID = "test_client_id"
@@ -170,3 +175,61 @@ class TestTokenManager:
         result = token_manager.refresh_access_token(TEST_REFRESH_TOKEN)
 
         assert result is None
+
+
+class TestAsyncTokenManager:
+    @pytest.fixture
+    def http_client(self) -> MagicMock:
+        client = MagicMock()
+        client.make_async_post = AsyncMock()
+        return client
+
+    @pytest.fixture
+    def async_token_manager(self, http_client: MagicMock) -> AsyncTokenManager:
+        return AsyncTokenManager(
+            client_id=TEST_CLIENT_ID,
+            secret_key=TEST_SECRET_KEY,
+            http_client=http_client,
+        )
+
+    @pytest.mark.asyncio
+    async def test_refresh_posts_through_shared_client(
+        self,
+        async_token_manager: AsyncTokenManager,
+        http_client: MagicMock,
+        mock_successful_response: dict[str, Any],
+    ) -> None:
+        http_client.make_async_post.return_value = mock_successful_response
+
+        result = await async_token_manager.refresh_access_token(TEST_REFRESH_TOKEN)
+
+        assert result == mock_successful_response
+        http_client.make_async_post.assert_awaited_once_with(
+            TEST_BASE_URL_ACCESS_TOKEN,
+            data={
+                "client_id": TEST_CLIENT_ID,
+                "client_secret": TEST_SECRET_KEY,
+                "grant_type": "refresh_token",
+                "refresh_token": TEST_REFRESH_TOKEN,
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_initial_tokens_use_authorization_code(
+        self, async_token_manager: AsyncTokenManager, http_client: MagicMock
+    ) -> None:
+        await async_token_manager.get_initial_tokens(TEST_AUTHORIZATION_CODE)
+
+        data = http_client.make_async_post.await_args.kwargs["data"]
+        assert data["grant_type"] == "authorization_code"
+        assert data["code"] == TEST_AUTHORIZATION_CODE
+
+    @pytest.mark.asyncio
+    async def test_refresh_error_returns_none(
+        self, async_token_manager: AsyncTokenManager, http_client: MagicMock
+    ) -> None:
+        http_client.make_async_post.side_effect = aiohttp.ClientError()
+
+        result = await async_token_manager.refresh_access_token(TEST_REFRESH_TOKEN)
+
+        assert result is None
@@ -0,0 +1,74 @@
+"""Compare the NumPy ``process_streams`` with the previous list-based version.
+
+Usage: uv run python tools/benchmark_process_streams.py [samples] [repeat]
+"""
+
+import copy
+import sys
+import timeit
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.streams.processor import process_streams
+
+
+def legacy_process_streams(response: Dict, id_activity: int) -> pd.DataFrame:
+    max_length = (
+        max(
+            len(stream_data.get("data", []))
+            for stream_data in response.values()
+            if isinstance(stream_data, dict)
+        )
+        if response
+        else 0
+    )
+
+    data = {}
+    for stream_type, stream_data in response.items():
+        if isinstance(stream_data, dict) and "data" in stream_data:
+            data[stream_type] = stream_data["data"]
+
+            if len(data[stream_type]) < max_length:
+                data[stream_type].extend([None] * (max_length - len(data[stream_type])))
+        else:
+            data[stream_type] = [None] * max_length
+
+    df = pd.DataFrame(data)
+    df["id"] = id_activity
+    return df
+
+
+def build_response(samples: int) -> Dict:
+    rng = np.random.default_rng(0)
+    return {
+        "time": {"data": list(range(samples))},
+        "distance": {"data": np.cumsum(rng.uniform(2, 4, samples)).tolist()},
+        "heartrate": {"data": rng.integers(90, 180, samples - 10).tolist()},
+        "altitude": {"data": rng.uniform(600, 700, samples).tolist()},
+        "latlng": {"data": rng.uniform(-90, 90, (samples, 2)).tolist()},
+    }
+
+
+def main(samples: int = 10_000, repeat: int = 50) -> None:
+    response = build_response(samples)
+    # The legacy version pads in place, so each run gets its own copy.
+    copies = [copy.deepcopy(response) for _ in range(repeat)]
+
+    legacy = timeit.timeit(
+        lambda: legacy_process_streams(copies.pop(), 1), number=repeat
+    )
+    vectorized = timeit.timeit(lambda: process_streams(response, 1), number=repeat)
+
+    print(f"{samples} samples x {repeat} runs")
+    print(f"legacy:     {legacy / repeat * 1000:8.2f} ms per activity")
+    print(f"vectorized: {vectorized / repeat * 1000:8.2f} ms per activity")
+    print(f"speedup:    {legacy / vectorized:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))